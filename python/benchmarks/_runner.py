@@ -0,0 +1,77 @@
+"""
+Shared runner for the polyfill benchmark scripts.
+
+Times grid scan vs quadtree polyfill cases, either in parallel across CPU
+cores (the default) or one at a time in a single process (--serial).
+
+Requires: pip install digipinpy[geo]
+"""
+
+import argparse
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Tuple
+
+try:
+    import shapely  # noqa: F401
+    from digipin import polyfill
+except ImportError:
+    print("Error: This benchmark requires geospatial dependencies.")
+    print("Run: pip install digipinpy[geo]")
+    exit(1)
+
+
+# (algorithm, label)
+ALGORITHMS = [("grid", "Grid Scan"), ("quadtree", "Quadtree")]
+
+
+def benchmark_polyfill(
+    polygon_coords: List[Tuple[float, float]],
+    precision: int,
+    algorithm: str,
+) -> Tuple[int, float]:
+    """
+    Benchmark a polyfill operation.
+
+    Returns:
+        Tuple of (num_codes, execution_time_seconds)
+    """
+    start = time.time()
+    codes = polyfill(polygon_coords, precision=precision, algorithm=algorithm)
+    elapsed = time.time() - start
+
+    return len(codes), elapsed
+
+
+def _run_case(case: Tuple[List[Tuple[float, float]], int, str]) -> Tuple[int, float]:
+    """Top-level (picklable) worker for the process pool."""
+    return benchmark_polyfill(*case)
+
+
+def run_cases(cases: list, serial: bool = False) -> List[Tuple[int, float]]:
+    """Run all benchmark cases, in parallel unless serial is requested."""
+    if serial:
+        return [_run_case(case) for case in cases]
+
+    with ProcessPoolExecutor() as executor:
+        return list(executor.map(_run_case, cases))
+
+
+def parse_args(description: str, argv: Optional[list] = None) -> argparse.Namespace:
+    """Parse the command line shared by the polyfill benchmarks."""
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument(
+        "--serial",
+        action="store_true",
+        help="Run cases one at a time in this process for fair timings",
+    )
+    return parser.parse_args(argv)
+
+
+def print_mode_note(serial: bool) -> None:
+    """Explain why parallel runs print no grid-vs-quadtree speedup."""
+    if not serial:
+        print(
+            "\nCases ran in parallel, so grid and quadtree competed for CPU;"
+            "\nspeedup ratios are only printed with --serial."
+        )
@@ -18,9 +18,9 @@ Usage:
     python benchmarks/cython_performance.py
 """
 
-import time
 import statistics
-from typing import Callable, List, Tuple
+import timeit
+from typing import Callable, List
 
 # Test data: Representative locations across India
 TEST_COORDINATES = [
@@ -53,48 +53,51 @@ TEST_CODES = [
 def benchmark_function(
     func: Callable,
     args: List,
-    iterations: int = 10000,
+    repeat: int = 5,
     warmup: int = 100
 ) -> dict:
     """
-    Benchmark a function with multiple iterations.
+    Benchmark a function with timeit.
+
+    The whole pass over args is timed by timeit.Timer, so no timer calls or
+    per-pass bookkeeping happen inside the measured loop. autorange() picks
+    how many passes make up one ~0.2s measurement; the best of `repeat`
+    measurements is reported.
 
     Args:
         func: Function to benchmark
         args: List of argument tuples
-        iterations: Number of iterations
+        repeat: Number of timed measurements (best one is reported)
         warmup: Number of warmup runs
 
     Returns:
         Dictionary with timing statistics
     """
-    # Warmup
-    for _ in range(warmup):
-        for arg_set in args:
-            if isinstance(arg_set, tuple):
+    # Resolve tuple-vs-single argument dispatch once, not per call
+    if isinstance(args[0], tuple):
+        def run_pass():
+            for arg_set in args:
                 func(*arg_set)
-            else:
+    else:
+        def run_pass():
+            for arg_set in args:
                 func(arg_set)
 
+    timer = timeit.Timer(run_pass)
+
+    # Warmup
+    timer.timeit(warmup)
+
     # Actual benchmark
-    times = []
-    for _ in range(iterations):
-        start = time.perf_counter()
-        for arg_set in args:
-            if isinstance(arg_set, tuple):
-                func(*arg_set)
-            else:
-                func(arg_set)
-        end = time.perf_counter()
-        times.append(end - start)
+    passes, _ = timer.autorange()
+    times = [total / passes for total in timer.repeat(repeat=repeat, number=passes)]
 
     # Calculate statistics
-    total_ops = iterations * len(args)
-    mean_time = statistics.mean(times)
-    ops_per_sec = total_ops / sum(times)
+    total_ops = repeat * passes * len(args)
+    ops_per_sec = len(args) / min(times)
 
     return {
-        "mean_time_sec": mean_time,
+        "mean_time_sec": statistics.mean(times),
         "total_ops": total_ops,
         "ops_per_sec": ops_per_sec,
         "min_time": min(times),
@@ -116,7 +119,6 @@ def compare_implementations():
             encode_fast,
             decode_fast,
             batch_encode_fast,
-            batch_decode_fast,
         )
         cython_available = True
     except ImportError:
@@ -126,7 +128,7 @@ def compare_implementations():
         cython_available = False
 
     from digipin.encoder import encode as encode_py, batch_encode as batch_encode_py
-    from digipin.decoder import decode as decode_py, batch_decode as batch_decode_py
+    from digipin.decoder import decode as decode_py
 
     # Check what backend is active
     import digipin
@@ -137,12 +139,10 @@ def compare_implementations():
     print()
 
     # Benchmark configuration
-    iterations = 5000
     print(f"Benchmark Configuration:")
     print(f"  - Test coordinates: {len(TEST_COORDINATES)}")
     print(f"  - Test codes: {len(TEST_CODES)}")
-    print(f"  - Iterations: {iterations:,}")
-    print(f"  - Total operations per test: {iterations * len(TEST_COORDINATES):,}")
+    print(f"  - Timing: timeit autorange, best of 5")
     print()
 
     # ========================================================================
@@ -153,12 +153,12 @@ def compare_implementations():
     print("-" * 70)
 
     print("Testing Pure Python encode()...", end=" ", flush=True)
-    py_encode_stats = benchmark_function(encode_py, TEST_COORDINATES, iterations)
+    py_encode_stats = benchmark_function(encode_py, TEST_COORDINATES)
     print(f"✓ {py_encode_stats['ops_per_sec']:,.0f} ops/sec")
 
     if cython_available:
         print("Testing Cython encode_fast()...", end=" ", flush=True)
-        cy_encode_stats = benchmark_function(encode_fast, TEST_COORDINATES, iterations)
+        cy_encode_stats = benchmark_function(encode_fast, TEST_COORDINATES)
         print(f"✓ {cy_encode_stats['ops_per_sec']:,.0f} ops/sec")
 
         speedup = cy_encode_stats['ops_per_sec'] / py_encode_stats['ops_per_sec']
@@ -177,12 +177,12 @@ def compare_implementations():
     print("-" * 70)
 
     print("Testing Pure Python decode()...", end=" ", flush=True)
-    py_decode_stats = benchmark_function(decode_py, TEST_CODES, iterations)
+    py_decode_stats = benchmark_function(decode_py, TEST_CODES)
     print(f"✓ {py_decode_stats['ops_per_sec']:,.0f} ops/sec")
 
     if cython_available:
         print("Testing Cython decode_fast()...", end=" ", flush=True)
-        cy_decode_stats = benchmark_function(decode_fast, TEST_CODES, iterations)
+        cy_decode_stats = benchmark_function(decode_fast, TEST_CODES)
         print(f"✓ {cy_decode_stats['ops_per_sec']:,.0f} ops/sec")
 
         speedup = cy_decode_stats['ops_per_sec'] / py_decode_stats['ops_per_sec']
@@ -200,18 +200,16 @@ def compare_implementations():
     print("BATCH OPERATIONS BENCHMARK")
     print("-" * 70)
 
-    batch_iterations = iterations // 10  # Fewer iterations for batch
-
     print("Testing Pure Python batch_encode()...", end=" ", flush=True)
     py_batch_encode_stats = benchmark_function(
-        batch_encode_py, [TEST_COORDINATES], batch_iterations
+        batch_encode_py, [TEST_COORDINATES]
     )
     print(f"✓ {py_batch_encode_stats['ops_per_sec']:,.0f} ops/sec")
 
     if cython_available:
         print("Testing Cython batch_encode_fast()...", end=" ", flush=True)
         cy_batch_encode_stats = benchmark_function(
-            batch_encode_fast, [TEST_COORDINATES], batch_iterations
+            batch_encode_fast, [TEST_COORDINATES]
         )
         print(f"✓ {cy_batch_encode_stats['ops_per_sec']:,.0f} ops/sec")
 
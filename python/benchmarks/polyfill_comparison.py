@@ -1,131 +1,101 @@
 """
 Performance benchmark comparing grid scan vs quadtree polyfill algorithms.
 
-Run with: python benchmarks/polyfill_comparison.py
+Run with: python benchmarks/polyfill_comparison.py [--serial]
+
+Cases are independent, so by default they run in parallel across CPU cores.
+Pass --serial to run them one at a time in a single process (for fair,
+contention-free timing comparisons); grid-vs-quadtree speedups are only
+printed then.
 
 Requires: pip install digipinpy[geo]
 """
 
-import time
-from typing import List, Tuple
-
-try:
-    from shapely.geometry import Polygon
-    from digipin import polyfill
-except ImportError:
-    print("Error: This benchmark requires geospatial dependencies.")
-    print("Run: pip install digipinpy[geo]")
-    exit(1)
-
-
-def benchmark_polyfill(
-    polygon_coords: List[Tuple[float, float]],
-    precision: int,
-    algorithm: str,
-    name: str,
-) -> Tuple[int, float]:
-    """
-    Benchmark a polyfill operation.
-
-    Returns:
-        Tuple of (num_codes, execution_time_seconds)
-    """
-    start = time.time()
-    codes = polyfill(polygon_coords, precision=precision, algorithm=algorithm)
-    elapsed = time.time() - start
+from _runner import ALGORITHMS, parse_args, print_mode_note, run_cases
+
+# (title, zone, precisions)
+SCENARIOS = [
+    (
+        "1. Small Delivery Zone (~1 km²) in Delhi",
+        [
+            (28.6300, 77.2200),
+            (28.6300, 77.2250),
+            (28.6250, 77.2250),
+            (28.6250, 77.2200),
+            (28.6300, 77.2200),
+        ],
+        [7, 8, 9],
+    ),
+    (
+        "2. Medium City Zone (~25 km²) in Bangalore",
+        [
+            (12.9800, 77.5900),
+            (12.9800, 77.6100),
+            (12.9600, 77.6100),
+            (12.9600, 77.5900),
+            (12.9800, 77.5900),
+        ],
+        [7, 8],
+    ),
+    (
+        "3. Large District Zone (~100 km²) in Mumbai",
+        [
+            (19.2000, 72.8000),
+            (19.2000, 72.9000),
+            (19.1000, 72.9000),
+            (19.1000, 72.8000),
+            (19.2000, 72.8000),
+        ],
+        [6, 7],
+    ),
+    (
+        "4. Complex Irregular Polygon (L-shape) in Delhi",
+        [
+            (28.6400, 77.2200),
+            (28.6400, 77.2250),
+            (28.6350, 77.2250),
+            (28.6350, 77.2300),
+            (28.6300, 77.2300),
+            (28.6300, 77.2200),
+            (28.6400, 77.2200),
+        ],
+        [7, 8],
+    ),
+]
+
+
+def main(argv=None):
+    args = parse_args(__doc__.strip().splitlines()[0], argv)
 
-    print(f"  {name:15} {len(codes):6} codes in {elapsed:8.4f}s")
-    return len(codes), elapsed
-
-
-def main():
     print("=" * 70)
     print("DIGIPIN Polyfill Performance Comparison: Grid vs Quadtree")
     print("=" * 70)
 
-    # Test Case 1: Small delivery zone (neighborhood level)
-    print("\n1. Small Delivery Zone (~1 km²) in Delhi")
-    print("-" * 70)
-    small_zone = [
-        (28.6300, 77.2200),
-        (28.6300, 77.2250),
-        (28.6250, 77.2250),
-        (28.6250, 77.2200),
-        (28.6300, 77.2200),
+    cases = [
+        (zone, precision, algorithm)
+        for _, zone, precisions in SCENARIOS
+        for precision in precisions
+        for algorithm, _ in ALGORITHMS
     ]
-
-    for precision in [7, 8, 9]:
-        print(f"\nPrecision {precision}:")
-        _, time_grid = benchmark_polyfill(small_zone, precision, "grid", "Grid Scan")
-        _, time_quad = benchmark_polyfill(
-            small_zone, precision, "quadtree", "Quadtree"
-        )
-        speedup = time_grid / time_quad if time_quad > 0 else float("inf")
-        print(f"  Speedup: {speedup:.2f}x faster")
-
-    # Test Case 2: Medium city zone (~25 km²)
-    print("\n\n2. Medium City Zone (~25 km²) in Bangalore")
-    print("-" * 70)
-    medium_zone = [
-        (12.9800, 77.5900),
-        (12.9800, 77.6100),
-        (12.9600, 77.6100),
-        (12.9600, 77.5900),
-        (12.9800, 77.5900),
-    ]
-
-    for precision in [7, 8]:
-        print(f"\nPrecision {precision}:")
-        _, time_grid = benchmark_polyfill(medium_zone, precision, "grid", "Grid Scan")
-        _, time_quad = benchmark_polyfill(
-            medium_zone, precision, "quadtree", "Quadtree"
-        )
-        speedup = time_grid / time_quad if time_quad > 0 else float("inf")
-        print(f"  Speedup: {speedup:.2f}x faster")
-
-    # Test Case 3: Large district zone (~100 km²)
-    print("\n\n3. Large District Zone (~100 km²) in Mumbai")
-    print("-" * 70)
-    large_zone = [
-        (19.2000, 72.8000),
-        (19.2000, 72.9000),
-        (19.1000, 72.9000),
-        (19.1000, 72.8000),
-        (19.2000, 72.8000),
-    ]
-
-    for precision in [6, 7]:
-        print(f"\nPrecision {precision}:")
-        _, time_grid = benchmark_polyfill(large_zone, precision, "grid", "Grid Scan")
-        _, time_quad = benchmark_polyfill(
-            large_zone, precision, "quadtree", "Quadtree"
-        )
-        speedup = time_grid / time_quad if time_quad > 0 else float("inf")
-        print(f"  Speedup: {speedup:.2f}x faster")
-
-    # Test Case 4: Complex polygon (irregular shape)
-    print("\n\n4. Complex Irregular Polygon (L-shape) in Delhi")
-    print("-" * 70)
-    complex_zone = [
-        (28.6400, 77.2200),
-        (28.6400, 77.2250),
-        (28.6350, 77.2250),
-        (28.6350, 77.2300),
-        (28.6300, 77.2300),
-        (28.6300, 77.2200),
-        (28.6400, 77.2200),
-    ]
-
-    for precision in [7, 8]:
-        print(f"\nPrecision {precision}:")
-        _, time_grid = benchmark_polyfill(
-            complex_zone, precision, "grid", "Grid Scan"
-        )
-        _, time_quad = benchmark_polyfill(
-            complex_zone, precision, "quadtree", "Quadtree"
-        )
-        speedup = time_grid / time_quad if time_quad > 0 else float("inf")
-        print(f"  Speedup: {speedup:.2f}x faster")
+    results = iter(run_cases(cases, serial=args.serial))
+    print_mode_note(args.serial)
+
+    for index, (title, _, precisions) in enumerate(SCENARIOS):
+        print(("\n" if index == 0 else "\n\n") + title)
+        print("-" * 70)
+
+        for precision in precisions:
+            print(f"\nPrecision {precision}:")
+            timings = {}
+            for algorithm, label in ALGORITHMS:
+                num_codes, elapsed = next(results)
+                print(f"  {label:15} {num_codes:6} codes in {elapsed:8.4f}s")
+                timings[algorithm] = elapsed
+
+            if args.serial:
+                time_grid, time_quad = timings["grid"], timings["quadtree"]
+                speedup = time_grid / time_quad if time_quad > 0 else float("inf")
+                print(f"  Speedup: {speedup:.2f}x faster")
 
     print("\n" + "=" * 70)
     print("Summary:")
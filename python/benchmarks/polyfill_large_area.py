@@ -1,39 +1,68 @@
 """
 Performance benchmark showing where quadtree excels: large areas at high precision.
 
-Run with: python benchmarks/polyfill_large_area.py
+Run with: python benchmarks/polyfill_large_area.py [--serial]
+
+Cases are independent, so by default they run in parallel across CPU cores.
+Pass --serial to run them one at a time in a single process (for fair,
+contention-free timing comparisons); grid-vs-quadtree speedups are only
+printed then.
 
 Requires: pip install digipinpy[geo]
 """
 
-import time
-from typing import List, Tuple
-
-try:
-    from shapely.geometry import Polygon
-    from digipin import polyfill
-except ImportError:
-    print("Error: This benchmark requires geospatial dependencies.")
-    print("Run: pip install digipinpy[geo]")
-    exit(1)
-
-
-def benchmark_polyfill(
-    polygon_coords: List[Tuple[float, float]],
-    precision: int,
-    algorithm: str,
-    name: str,
-) -> Tuple[int, float]:
-    """Benchmark a polyfill operation."""
-    start = time.time()
-    codes = polyfill(polygon_coords, precision=precision, algorithm=algorithm)
-    elapsed = time.time() - start
-
-    print(f"  {name:15} {len(codes):8} codes in {elapsed:10.4f}s")
-    return len(codes), elapsed
-
+from _runner import ALGORITHMS, parse_args, print_mode_note, run_cases
+
+# Very Large Zone: ~1000 km² (state-level)
+HUGE_ZONE = [
+    (28.9000, 76.9000),
+    (28.9000, 77.4000),
+    (28.4000, 77.4000),
+    (28.4000, 76.9000),
+    (28.9000, 76.9000),
+]
+
+# High Precision on Medium Zone
+CITY_ZONE = [
+    (12.9800, 77.5900),
+    (12.9800, 77.6100),
+    (12.9600, 77.6100),
+    (12.9600, 77.5900),
+    (12.9800, 77.5900),
+]
+
+# Sparse polygon (thin corridor)
+CORRIDOR = [
+    (28.7000, 77.1000),
+    (28.7010, 77.1000),
+    (28.5010, 77.3000),
+    (28.5000, 77.3000),
+    (28.7000, 77.1000),
+]
+
+# (title, zone, [(precision, label), ...])
+SCENARIOS = [
+    (
+        "1. Very Large Zone (~1000 km²) - Entire Delhi NCR Region",
+        HUGE_ZONE,
+        [(7, "~250m cells"), (8, "~60m cells")],
+    ),
+    (
+        "2. High Precision (~15m) on City Zone (~25 km²)",
+        CITY_ZONE,
+        [(9, "~15m cells")],
+    ),
+    (
+        "3. Sparse Polygon: Thin Corridor (Highway corridor)",
+        CORRIDOR,
+        [(8, "~60m cells")],
+    ),
+]
+
+
+def main(argv=None):
+    args = parse_args(__doc__.strip().splitlines()[0], argv)
 
-def main():
     print("=" * 80)
     print("DIGIPIN Polyfill: Where Quadtree Optimization Shines")
     print("=" * 80)
@@ -43,62 +72,31 @@ def main():
     print("  3. Sparse polygons (where most cells are skipped)")
     print()
 
-    # Very Large Zone: ~1000 km² (state-level)
-    print("\n1. Very Large Zone (~1000 km²) - Entire Delhi NCR Region")
-    print("-" * 80)
-    huge_zone = [
-        (28.9000, 76.9000),
-        (28.9000, 77.4000),
-        (28.4000, 77.4000),
-        (28.4000, 76.9000),
-        (28.9000, 76.9000),
+    cases = [
+        (zone, precision, algorithm)
+        for _, zone, precisions in SCENARIOS
+        for precision, _ in precisions
+        for algorithm, _ in ALGORITHMS
     ]
-
-    print("\nAt Precision 7 (~250m cells):")
-    _, time_grid = benchmark_polyfill(huge_zone, 7, "grid", "Grid Scan")
-    _, time_quad = benchmark_polyfill(huge_zone, 7, "quadtree", "Quadtree")
-    speedup = time_grid / time_quad if time_quad > 0 else 1.0
-    print(f"  Speedup: {speedup:.2f}x")
-
-    print("\nAt Precision 8 (~60m cells):")
-    _, time_grid = benchmark_polyfill(huge_zone, 8, "grid", "Grid Scan")
-    _, time_quad = benchmark_polyfill(huge_zone, 8, "quadtree", "Quadtree")
-    speedup = time_grid / time_quad if time_quad > 0 else 1.0
-    print(f"  Speedup: {speedup:.2f}x")
-
-    # High Precision on Medium Zone
-    print("\n\n2. High Precision (~15m) on City Zone (~25 km²)")
-    print("-" * 80)
-    city_zone = [
-        (12.9800, 77.5900),
-        (12.9800, 77.6100),
-        (12.9600, 77.6100),
-        (12.9600, 77.5900),
-        (12.9800, 77.5900),
-    ]
-
-    print("\nAt Precision 9 (~15m cells):")
-    _, time_grid = benchmark_polyfill(city_zone, 9, "grid", "Grid Scan")
-    _, time_quad = benchmark_polyfill(city_zone, 9, "quadtree", "Quadtree")
-    speedup = time_grid / time_quad if time_quad > 0 else 1.0
-    print(f"  Speedup: {speedup:.2f}x")
-
-    # Sparse polygon (thin corridor)
-    print("\n\n3. Sparse Polygon: Thin Corridor (Highway corridor)")
-    print("-" * 80)
-    corridor = [
-        (28.7000, 77.1000),
-        (28.7010, 77.1000),
-        (28.5010, 77.3000),
-        (28.5000, 77.3000),
-        (28.7000, 77.1000),
-    ]
-
-    print("\nAt Precision 8 (~60m cells):")
-    _, time_grid = benchmark_polyfill(corridor, 8, "grid", "Grid Scan")
-    _, time_quad = benchmark_polyfill(corridor, 8, "quadtree", "Quadtree")
-    speedup = time_grid / time_quad if time_quad > 0 else 1.0
-    print(f"  Speedup: {speedup:.2f}x")
+    results = iter(run_cases(cases, serial=args.serial))
+    print_mode_note(args.serial)
+
+    for index, (title, _, precisions) in enumerate(SCENARIOS):
+        print(("\n" if index == 0 else "\n\n") + title)
+        print("-" * 80)
+
+        for precision, cell_label in precisions:
+            print(f"\nAt Precision {precision} ({cell_label}):")
+            timings = {}
+            for algorithm, label in ALGORITHMS:
+                num_codes, elapsed = next(results)
+                print(f"  {label:15} {num_codes:8} codes in {elapsed:10.4f}s")
+                timings[algorithm] = elapsed
+
+            if args.serial:
+                time_grid, time_quad = timings["grid"], timings["quadtree"]
+                speedup = time_grid / time_quad if time_quad > 0 else 1.0
+                print(f"  Speedup: {speedup:.2f}x")
 
     print("\n" + "=" * 80)
     print("Key Findings:")
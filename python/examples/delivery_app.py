@@ -1,5 +1,7 @@
 """
 Real-world example: Simple delivery tracking system using DIGIPIN
+
+Requires: pip install numpy  (for vectorized distance calculation)
 """
 
 import sys
@@ -9,8 +11,37 @@ import io
 if sys.platform == 'win32':
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
 
-from digipin import encode, decode, get_bounds, is_valid
+from digipin import encode, decode, get_grid_size
 from datetime import datetime
+from functools import lru_cache
+
+import numpy as np
+
+
+@lru_cache(maxsize=None)
+def cell_area_m2(precision):
+    """Approximate area of a grid cell at a precision (depends only on level)."""
+    lat_step, lon_step = get_grid_size(precision)
+    return (lat_step * 111000) * (lon_step * 111000)  # rough m²
+
+
+EARTH_RADIUS_M = 6371000
+
+
+def calculate_distances(lats, lons):
+    """Haversine distances (meters) between consecutive points, vectorized."""
+    lat = np.radians(lats)
+    lon = np.radians(lons)
+
+    dlat = np.diff(lat)
+    dlon = np.diff(lon)
+
+    a = (
+        np.sin(dlat / 2) ** 2
+        + np.cos(lat[:-1]) * np.cos(lat[1:]) * np.sin(dlon / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_M * np.arcsin(np.sqrt(a))
+
 
 class DeliveryLocation:
     """Represents a delivery location with DIGIPIN code."""
@@ -26,8 +57,7 @@ class DeliveryLocation:
 
     def get_address_summary(self):
         """Get a summary of the location."""
-        min_lat, max_lat, min_lon, max_lon = get_bounds(self.code)
-        area = (max_lat - min_lat) * (max_lon - min_lon) * 111000 * 111000  # rough m²
+        area = cell_area_m2(len(self.code))
 
         return {
             'name': self.name,
@@ -43,21 +73,34 @@ class DeliveryTrip:
     def __init__(self, trip_id):
         self.trip_id = trip_id
         self.stops = []
+        # Column-wise (SoA) copies of the stops for bulk geo operations
+        self._lats = []
+        self._lons = []
+        self._route = []
+        self._codes = set()  # Index of route codes for O(1) verification
         self.created_at = datetime.now()
 
     def add_stop(self, name, lat, lon):
         """Add a delivery stop."""
         location = DeliveryLocation(name, lat, lon)
         self.stops.append(location)
+        self._lats.append(location.lat)
+        self._lons.append(location.lon)
+        self._route.append(location.code)
+        self._codes.add(location.code)
         return location.code
 
     def get_route(self):
         """Get the delivery route."""
-        return [stop.code for stop in self.stops]
+        return list(self._route)
+
+    def distances(self):
+        """Distances (meters) of each leg of the route, as a NumPy array."""
+        return calculate_distances(np.asarray(self._lats), np.asarray(self._lons))
 
     def verify_location(self, code):
         """Verify if a code is in the delivery route."""
-        return code in self.get_route()
+        return code in self._codes
 
     def print_route(self):
         """Print the delivery route."""
@@ -117,27 +160,13 @@ print(f"DIGIPIN Code: {details['code']}")
 print(f"Coordinates: {details['coordinates']}")
 print(f"Precision Area: {details['precision_area']}")
 
-# Calculate distance (rough estimate)
+# Calculate distance (great-circle)
 print("\n" + "=" * 70)
 print("Distance Calculation")
 print("=" * 70)
 
-
-def calculate_distance(lat1, lon1, lat2, lon2):
-    """Simple distance calculation (Euclidean approximation)."""
-    # This is a rough approximation; use haversine for accurate results
-    dlat = (lat2 - lat1) * 111000  # meters
-    dlon = (lon2 - lon1) * 111000 * 0.78  # adjusted for latitude
-    return (dlat**2 + dlon**2) ** 0.5
-
-
 print("\nDistances between stops:")
-for i in range(len(trip.stops) - 1):
-    stop1 = trip.stops[i]
-    stop2 = trip.stops[i + 1]
-
-    distance = calculate_distance(stop1.lat, stop1.lon, stop2.lat, stop2.lon)
-
+for stop1, stop2, distance in zip(trip.stops, trip.stops[1:], trip.distances()):
     print(f"  {stop1.code} → {stop2.code}: {distance/1000:.2f} km")
 
 # Generate shareable codes
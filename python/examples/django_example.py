@@ -20,6 +20,7 @@ Documentation:
 
 try:
     from django.db import models
+    from django.db.models.functions import Substr
     from digipin.django_ext import DigipinField
 
     class DeliveryLocation(models.Model):
@@ -29,9 +30,22 @@ try:
         name = models.CharField(max_length=100)
         address = models.TextField(blank=True)
 
-        # The DigipinField handles validation and normalization automatically
+        # The DigipinField handles validation and normalization automatically.
+        # db_index=True also gives PostgreSQL a varchar_pattern_ops index,
+        # which the 'within' prefix lookup needs to avoid sequential scans.
         digipin = DigipinField(db_index=True)
 
+        # Level-2 region prefix, computed once on write by the database
+        # (GENERATED ALWAYS AS ... STORED) so grouping by region reads an
+        # indexed column instead of running substr() on every row.
+        # Requires Django 5.0+.
+        region = models.GeneratedField(
+            expression=Substr('digipin', 1, 2),
+            output_field=models.CharField(max_length=2),
+            db_persist=True,
+            db_index=True,
+        )
+
         created_at = models.DateTimeField(auto_now_add=True)
         updated_at = models.DateTimeField(auto_now=True)
 
@@ -115,6 +129,18 @@ try:
         )
         print(f"Active warehouses in region: {active_in_region.count()}")
 
+        # Scanning a large region: stream rows instead of caching the
+        # whole result set on the queryset
+        for location in delhi_locations.iterator(chunk_size=2000):
+            pass  # process(location)
+
+        # Or fetch it in pages keyed on (digipin, pk). Unlike OFFSET,
+        # every page costs the same no matter how deep it is.
+        from digipin.django_ext import paginate_by_digipin
+
+        for page in paginate_by_digipin(delhi_locations, page_size=2000):
+            print(f"Page of {len(page)}: {page[0].digipin}..{page[-1].digipin}")
+
 
     def example_standard_queries():
         """Standard Django queries work as expected."""
@@ -138,15 +164,12 @@ try:
 
     def example_aggregation():
         """Aggregation and annotation examples."""
-        from django.db.models import Count, Q
+        from django.db.models import Count
 
-        # Count locations per region (first 2 chars)
-        from django.db.models.functions import Substr
-
-        # Group by region prefix
+        # Count locations per region (first 2 chars), grouped on the
+        # stored 'region' column rather than a per-row Substr()
         by_region = (
             DeliveryLocation.objects
-            .annotate(region=Substr('digipin', 1, 2))
             .values('region')
             .annotate(count=Count('id'))
             .order_by('-count')
@@ -161,19 +184,16 @@ try:
         Finding locations in the same area as a reference point.
         This uses the hierarchical properties of DIGIPIN.
         """
-        from digipin import get_neighbors
-
-        # Get a reference location
-        reference = DeliveryLocation.objects.first()
+        # Get a reference location, loading only the columns used below.
+        # Touching a deferred field (e.g. reference.address) later would
+        # cost an extra query, so keep this list in sync with its uses.
+        reference = DeliveryLocation.objects.only('id', 'name', 'digipin').first()
         if reference:
-            # Get neighboring DIGIPIN codes (application level)
-            neighbors = get_neighbors(reference.digipin)
-
-            # Find locations in neighboring cells
+            # Find locations in the 8 neighboring cells. The lookup emits a
+            # single BETWEEN range (plus an exact IN filter) when the
+            # neighbors share a prefix, so it is one index range scan.
             nearby = DeliveryLocation.objects.filter(
-                digipin__in=neighbors
-            ).exclude(
-                id=reference.id  # Exclude the reference itself
+                digipin__is_neighbor=reference.digipin
             )
 
             print(f"Locations near {reference.name}: {nearby.count()}")
@@ -191,11 +211,6 @@ try:
         list_filter = ['created_at']
         search_fields = ['name', 'digipin', 'address']
 
-        # Group by region in admin
-        def get_queryset(self, request):
-            qs = super().get_queryset(request)
-            return qs.select_related()
-
 
     @admin.register(Warehouse)
     class WarehouseAdmin(admin.ModelAdmin):
@@ -210,6 +225,9 @@ try:
 
     try:
         from rest_framework import serializers, viewsets
+        from rest_framework.decorators import action
+        from rest_framework.response import Response
+        from digipin.django_ext import neighbors_of
 
         class DeliveryLocationSerializer(serializers.ModelSerializer):
             class Meta:
@@ -236,6 +254,17 @@ try:
 
                 return queryset
 
+            # GET /locations/nearby/?codes=39J49LL8T4,39J49LL8T9
+            @action(detail=False)
+            def nearby(self, request):
+                # One query for every reference, instead of one per code
+                codes = request.query_params.get('codes', '').split(',')
+                queryset = self.get_queryset().filter(
+                    neighbors_of(code for code in codes if code)
+                )
+                serializer = self.get_serializer(queryset, many=True)
+                return Response(serializer.data)
+
     except ImportError:
         print("Django REST Framework not installed. Skipping DRF examples.")
 
@@ -4,10 +4,17 @@ FastAPI Microservice Example for DIGIPIN
 This script runs a complete high-performance geocoding server.
 Run it with: uvicorn examples.fastapi_server:app --reload
 
+For load, run it directly (``python examples/fastapi_server.py``): it starts
+one worker process per CPU core (override with WEB_CONCURRENCY).
+The [fastapi] extra installs ``uvicorn[standard]``, so the workers use uvloop
+and httptools where those are available.
+
 Requirements:
     pip install digipinpy[fastapi]
 """
 
+import os
+
 import uvicorn
 from fastapi import FastAPI
 from fastapi.responses import RedirectResponse
@@ -36,5 +43,9 @@ async def root():
 
 
 if __name__ == "__main__":
-    print("Starting DIGIPIN Server on http://127.0.0.1:8000")
-    uvicorn.run(app, host="127.0.0.1", port=8000)
+    workers = int(os.environ.get("WEB_CONCURRENCY", os.cpu_count() or 1))
+    print(f"Starting DIGIPIN Server on http://127.0.0.1:8000 ({workers} workers)")
+    # Multiple workers need an import string rather than the app object.
+    # loop/http default to "auto", which picks uvloop and httptools when
+    # installed.
+    uvicorn.run("fastapi_server:app", host="127.0.0.1", port=8000, workers=workers)
@@ -8,6 +8,13 @@ Run this example:
     pip install digipinpy[flask]
     python examples/flask_example.py
 
+``python examples/flask_example.py`` uses Flask's single-threaded development
+server. To serve real traffic, create the database once and run the app under
+gunicorn with one worker per core:
+    cd examples
+    python -c "from flask_example import init_db; init_db()"
+    gunicorn -w $(nproc) -b 127.0.0.1:5000 flask_example:app
+
 Then visit:
     http://localhost:5000/api/digipin/health
     http://localhost:5000/warehouses
@@ -15,8 +22,13 @@ Then visit:
 
 from flask import Flask, request, jsonify
 from flask_sqlalchemy import SQLAlchemy
-from digipin.flask_ext import DigipinType, create_digipin_blueprint, validate_coordinates_request
-from digipin import encode, decode, get_neighbors, is_valid as is_valid_digipin
+from digipin.flask_ext import (
+    DigipinType,
+    create_digipin_blueprint,
+    validate_coordinates_request,
+    within_any,
+)
+from digipin import encode, batch_decode, decode_cached, is_valid as is_valid_digipin
 
 # -------------------------------------------------------------------------
 # App Setup
@@ -52,7 +64,8 @@ class Warehouse(db.Model):
 
     def to_dict(self):
         """Convert to dictionary for JSON serialization."""
-        lat, lon = decode(self.code)
+        # Listing endpoints decode the same codes on every request
+        lat, lon = decode_cached(self.code)
         return {
             'id': self.id,
             'code': self.code,
@@ -62,6 +75,31 @@ class Warehouse(db.Model):
         }
 
 
+def select_warehouses(*criteria):
+    """
+    Fetch warehouses as plain rows, already serialized.
+
+    Listing endpoints only need column values, so they skip ORM object
+    construction and decode all codes in one batch_decode() call.
+    """
+    rows = db.session.execute(
+        db.select(
+            Warehouse.id, Warehouse.code, Warehouse.name, Warehouse.capacity
+        ).where(*criteria)
+    ).all()
+    coordinates = batch_decode([row.code for row in rows])
+    return [
+        {
+            'id': row.id,
+            'code': row.code,
+            'name': row.name,
+            'capacity': row.capacity,
+            'coordinates': {'lat': lat, 'lon': lon}
+        }
+        for row, (lat, lon) in zip(rows, coordinates)
+    ]
+
+
 # -------------------------------------------------------------------------
 # Register Pre-built DIGIPIN API Blueprint
 # -------------------------------------------------------------------------
@@ -90,8 +128,7 @@ def list_warehouses():
 
     Example: GET /warehouses
     """
-    warehouses = Warehouse.query.all()
-    return jsonify([w.to_dict() for w in warehouses])
+    return jsonify(select_warehouses())
 
 
 @app.route('/warehouses', methods=['POST'])
@@ -171,25 +208,18 @@ def find_nearby_warehouses():
     from digipin import get_disk
     search_area = get_disk(customer_code, radius=radius)
 
-    # Query warehouses in this area
-    # We use prefix matching since warehouses are stored at precision 10
-    # but we're searching at precision 8
-    nearby = []
-    for code_prefix in search_area:
-        warehouses = Warehouse.query.filter(
-            Warehouse.code.like(f'{code_prefix}%')
-        ).all()
-        nearby.extend(warehouses)
-
-    # Remove duplicates and convert to dict
-    unique_warehouses = {w.id: w for w in nearby}.values()
+    # Query warehouses in this area with a single query. Warehouses are
+    # stored at precision 10 and the area is precision 8 cells, so each cell
+    # is a prefix; within_any() turns them into index range scans on the
+    # (unique, hence indexed) code column.
+    nearby = select_warehouses(within_any(Warehouse.code, search_area))
 
     return jsonify({
         'search_center': customer_code,
         'radius': radius,
         'search_area_size': len(search_area),
-        'warehouses_found': len(unique_warehouses),
-        'warehouses': [w.to_dict() for w in unique_warehouses]
+        'warehouses_found': len(nearby),
+        'warehouses': nearby
     })
 
 
@@ -205,14 +235,12 @@ def warehouses_in_region(region_code):
     if not is_valid_digipin(code):
         return jsonify({'error': 'Invalid DIGIPIN region code'}), 400
 
-    warehouses = Warehouse.query.filter(
-        Warehouse.code.like(f'{code}%')
-    ).all()
+    warehouses = select_warehouses(within_any(Warehouse.code, [code]))
 
     return jsonify({
         'region': code,
         'count': len(warehouses),
-        'warehouses': [w.to_dict() for w in warehouses]
+        'warehouses': warehouses
     })
 
 
@@ -304,6 +332,7 @@ if __name__ == '__main__':
     print("       -d '{\"lat\": 28.6, \"lon\": 77.2, \"radius\": 2}'")
     print("\n" + "="*60 + "\n")
 
+    # Development server only; see the module docstring for gunicorn.
     # Security: Use environment variable to control debug mode
     # Never use debug=True in production (enables code execution via browser)
     import os
@@ -18,6 +18,7 @@ from digipin import (
     get_neighbors,
     get_ring,
     get_disk,
+    get_disk_centers,
     get_surrounding_cells,
     expand_search_area,
 )
@@ -129,6 +130,14 @@ def example_4_restaurant_search():
     search_area = get_disk(user_code, radius=search_radius)
     print(f"\nSearch area ({search_radius*3.8:.1f}m radius): {len(search_area)} cells")
 
+    # When only coordinates are needed (e.g. ranking by distance), get the
+    # cell centers directly instead of decoding every code in the area
+    centers = get_disk_centers(user_code, radius=search_radius)
+    nearest = min(
+        centers, key=lambda c: (c[0] - user_lat) ** 2 + (c[1] - user_lon) ** 2
+    )
+    print(f"Closest cell center: ({nearest[0]:.6f}, {nearest[1]:.6f})")
+
     # In a real app:
     # restaurants = Restaurant.objects.filter(
     #     digipin__in=search_area
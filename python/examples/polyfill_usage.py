@@ -8,13 +8,7 @@ Requirements:
     pip install digipinpy[geo]
 """
 
-try:
-    from digipin import polyfill, decode
-    from shapely.geometry import Polygon
-except ImportError:
-    print("Error: This example requires geospatial dependencies.")
-    print("Run: pip install digipinpy[geo]")
-    exit(1)
+from digipin import polyfill, decode, encode
 
 
 def run_demo():
@@ -45,11 +39,12 @@ def run_demo():
         return
 
     # 3. Verification (Check centers)
+    # shapely is only needed from here on; polyfill() imports it itself
+    from shapely.geometry import Point, Polygon
+
     print("\nVerifying first 3 codes:")
     poly_shape = Polygon([(lon, lat) for lat, lon in delivery_zone_coords])
 
-    from shapely.geometry import Point
-
     for code in codes[:3]:
         lat, lon = decode(code)
         # Note: Shapely uses (x, y) = (lon, lat)
@@ -60,8 +55,6 @@ def run_demo():
     # 4. Use case example: Check if address is in delivery zone
     print("\n--- Use Case: Address Validation ---")
     test_address = (28.6310, 77.2200)  # Should be inside
-    from digipin import encode
-
     test_code = encode(test_address[0], test_address[1], precision=8)
     print(f"Test Address: {test_address} -> {test_code}")
 
@@ -72,4 +65,9 @@ def run_demo():
 
 
 if __name__ == "__main__":
-    run_demo()
+    try:
+        run_demo()
+    except ImportError:
+        print("Error: This example requires geospatial dependencies.")
+        print("Run: pip install digipinpy[geo]")
+        exit(1)
@@ -72,6 +72,8 @@ Visualization (Optional):
         m.save('map.html')
 """
 
+from functools import lru_cache
+
 __version__ = "1.8.0"
 __author__ = "SAMARTHA H V"
 __license__ = "MIT"
@@ -90,9 +92,24 @@ try:
         encode_fast as _encode_impl,
         decode_fast as _decode_impl,
         get_bounds_fast as _get_bounds_impl,
-        batch_encode_fast as _batch_encode_impl,
-        batch_decode_fast as _batch_decode_impl,
+        batch_encode_fast as _batch_encode_fast,
+        batch_decode_fast as _batch_decode_fast,
+        is_valid_fast as _is_valid_impl,
     )
+    from .encoder import batch_encode as _batch_encode_py
+    from .decoder import batch_decode as _batch_decode_py
+
+    # NumPy array input takes the vectorized pure-Python path, which beats a
+    # per-element C loop; lists keep using the compiled batch functions.
+    def _batch_encode_impl(coordinates, **kwargs):
+        if hasattr(coordinates, "__array__"):
+            return _batch_encode_py(coordinates, **kwargs)
+        return _batch_encode_fast(coordinates, **kwargs)
+
+    def _batch_decode_impl(codes):
+        if hasattr(codes, "__array__"):
+            return _batch_decode_py(codes)
+        return _batch_decode_fast(codes)
 
     _BACKEND = "cython"
     _PERFORMANCE_MULTIPLIER = "10-15x"
@@ -104,6 +121,7 @@ except ImportError:
         get_bounds as _get_bounds_impl,
         batch_decode as _batch_decode_impl,
     )
+    from .utils import is_valid_digipin as _is_valid_impl
 
     _BACKEND = "python"
     _PERFORMANCE_MULTIPLIER = "1x (baseline)"
@@ -140,10 +158,20 @@ decode = _decode_impl
 get_bounds = _get_bounds_impl
 batch_encode = _batch_encode_impl
 batch_decode = _batch_decode_impl
+is_valid = _is_valid_impl
+
+# Memoized encode/decode for workloads that see the same inputs over and over,
+# such as web handlers serving the same warehouses. A cache hit costs ~0.1us,
+# against ~1us (encode) and ~1.7us (decode) in pure Python; the compiled
+# backend is about as fast as a hit. Keys are the exact arguments: rounding
+# coordinates would move points near a grid line into the neighboring cell.
+encode_cached = lru_cache(maxsize=65536)(encode)
+decode_cached = lru_cache(maxsize=65536)(decode)
 
 # Import remaining functions from pure Python modules
 from .encoder import encode_with_bounds
 from .decoder import (
+    batch_bounds,
     decode_with_bounds,
     get_parent,
     is_within,
@@ -152,11 +180,14 @@ from .neighbors import (
     get_neighbors,
     get_ring,
     get_disk,
+    get_disk_centers,
     get_surrounding_cells,
     expand_search_area,
+    neighbor_bbox,
 )
 from .utils import (
-    is_valid_digipin as is_valid,
+    batch_is_valid_digipin as batch_is_valid,
+    batch_is_valid_coordinate,
     is_valid_coordinate,
     get_precision_info,
     get_grid_size,
@@ -180,14 +211,26 @@ except ImportError:
     get_polygon_boundary = None  # type: ignore
     polyfill_quadtree = None  # type: ignore
 
-# Visualization functions (optional - requires folium)
-try:
-    from .viz import plot_pins, plot_coverage, plot_neighbors
-except ImportError:
-    # Allow import of package even if folium is missing
-    plot_pins = None  # type: ignore[assignment]
-    plot_coverage = None  # type: ignore[assignment]
-    plot_neighbors = None  # type: ignore[assignment]
+# Visualization functions (optional - requires folium). Importing folium
+# takes hundreds of milliseconds, far more than the rest of the package, so
+# the viz module is only loaded on first access to one of these names.
+_VIZ_FUNCTIONS = ("plot_pins", "plot_coverage", "plot_neighbors")
+
+
+def __getattr__(name):
+    if name in _VIZ_FUNCTIONS:
+        try:
+            from . import viz
+        except ImportError:
+            # Allow use of package even if folium is missing
+            value = None
+        else:
+            value = getattr(viz, name)
+        globals()[name] = value
+        return value
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 # Public API
 __all__ = [
@@ -195,9 +238,13 @@ __all__ = [
     "encode",
     "decode",
     "is_valid",
+    "encode_cached",
+    "decode_cached",
     # Batch operations
     "batch_encode",
     "batch_decode",
+    "batch_bounds",
+    "batch_is_valid",
     # Hierarchical operations
     "get_bounds",
     "encode_with_bounds",
@@ -208,8 +255,10 @@ __all__ = [
     "get_neighbors",
     "get_ring",
     "get_disk",
+    "get_disk_centers",
     "get_surrounding_cells",
     "expand_search_area",
+    "neighbor_bbox",
     # Geospatial operations (NEW in v1.4.0)
     "polyfill",
     "polyfill_quadtree",
@@ -220,6 +269,7 @@ __all__ = [
     "plot_neighbors",
     # Utilities
     "is_valid_coordinate",
+    "batch_is_valid_coordinate",
     "get_precision_info",
     "get_grid_size",
     "get_approx_distance",
@@ -26,6 +26,12 @@ cdef double LON_MAX = 99.5
 cdef int GRID_SUBDIVISION = 4
 cdef int DIGIPIN_LEVELS = 10
 
+# Fixed-point encoding: level-10 cell size and the distance from a grid line
+# (in finest-cell units) inside which the bisection loop decides the cell
+cdef double FINEST_LAT_SPAN = (LAT_MAX - LAT_MIN) / 1048576.0  # 4**10
+cdef double FINEST_LON_SPAN = (LON_MAX - LON_MIN) / 1048576.0
+cdef double EDGE_MARGIN = 1e-6
+
 # Spiral grid as C char array for fast lookup
 cdef char* SPIRAL_GRID[4]
 SPIRAL_GRID[0] = b"FC98"  # Row 0
@@ -34,9 +40,13 @@ SPIRAL_GRID[2] = b"K456"  # Row 2
 SPIRAL_GRID[3] = b"LMPT"  # Row 3
 
 # Reverse lookup table: ASCII char code -> (row, col)
-# Using a 256-element lookup table for O(1) access
+# Using a 256-element lookup table for O(1) access. Both letter cases are
+# filled so codes never need an upper() copy before lookup.
 cdef int[256][2] SYMBOL_TO_POS
 
+# Membership table: ASCII char code -> 1 if a valid symbol (either case)
+cdef unsigned char[256] VALID_SYMBOL
+
 # Initialize lookup table at module import
 cdef void _init_lookup_table():
     """Initialize reverse symbol lookup table."""
@@ -47,6 +57,7 @@ cdef void _init_lookup_table():
     for i in range(256):
         SYMBOL_TO_POS[i][0] = -1
         SYMBOL_TO_POS[i][1] = -1
+        VALID_SYMBOL[i] = 0
 
     # Populate valid symbols
     for row in range(4):
@@ -54,6 +65,10 @@ cdef void _init_lookup_table():
             symbol = SPIRAL_GRID[row][col]
             SYMBOL_TO_POS[<int>symbol][0] = row
             SYMBOL_TO_POS[<int>symbol][1] = col
+            SYMBOL_TO_POS[<int>symbol | 0x20][0] = row  # Lowercase
+            SYMBOL_TO_POS[<int>symbol | 0x20][1] = col
+            VALID_SYMBOL[<int>symbol] = 1
+            VALID_SYMBOL[<int>symbol | 0x20] = 1  # Lowercase (digits unchanged)
 
 # Call initialization
 _init_lookup_table()
@@ -87,17 +102,43 @@ cpdef str encode_fast(double lat, double lon, int precision=10):
             f"Precision must be 1-{DIGIPIN_LEVELS}, got {precision}"
         )
 
+    cdef char[10] code_chars
+    _encode_into(lat, lon, precision, code_chars)
+
+    # Convert char array to Python string
+    return code_chars[:precision].decode('ascii')
+
+
+cdef inline void _encode_into(
+    double lat, double lon, int precision, char* out
+) noexcept nogil:
+    """Write the DIGIPIN symbols for an in-bounds point into out."""
     # C-level variables for maximum speed
     cdef double min_lat = LAT_MIN
     cdef double max_lat = LAT_MAX
     cdef double min_lon = LON_MIN
     cdef double max_lon = LON_MAX
     cdef double lat_span, lon_span
-    cdef int row, col, level
-    cdef char[10] code_chars
-    cdef int code_idx = 0
-
-    # Hierarchical subdivision
+    cdef int row, col, level, shift
+
+    # Fixed-point fast path: every bisection bound is an exact binary
+    # fraction, so each level's row/col is one base-4 digit of the level-10
+    # cell index along that axis (same scheme as the Python encoder)
+    cdef double x = (lat - LAT_MIN) / FINEST_LAT_SPAN
+    cdef double y = (lon - LON_MIN) / FINEST_LON_SPAN
+    cdef unsigned int q_lat = <unsigned int>x
+    cdef unsigned int q_lon = <unsigned int>y
+
+    if (
+        EDGE_MARGIN < x - q_lat < 1.0 - EDGE_MARGIN
+        and EDGE_MARGIN < y - q_lon < 1.0 - EDGE_MARGIN
+    ):
+        for level in range(precision):
+            shift = 18 - 2 * level
+            out[level] = SPIRAL_GRID[3 - ((q_lat >> shift) & 3)][(q_lon >> shift) & 3]
+        return
+
+    # Near a grid line: hierarchical subdivision, as in the reference loop
     for level in range(precision):
         # Calculate grid cell size
         lat_span = (max_lat - min_lat) / 4.0
@@ -120,8 +161,7 @@ cpdef str encode_fast(double lat, double lon, int precision=10):
             col = 3
 
         # Get symbol from grid
-        code_chars[code_idx] = SPIRAL_GRID[row][col]
-        code_idx += 1
+        out[level] = SPIRAL_GRID[row][col]
 
         # Update bounds (official logic)
         max_lat = min_lat + lat_span * (4 - row)
@@ -129,8 +169,41 @@ cpdef str encode_fast(double lat, double lon, int precision=10):
         min_lon = min_lon + lon_span * col
         max_lon = min_lon + lon_span
 
-    # Convert char array to Python string
-    return code_chars[:precision].decode('ascii')
+
+cpdef bytes encode_array_fast(
+    const double[::1] lats, const double[::1] lons, int precision=10
+):
+    """
+    Encode contiguous coordinate arrays into one packed buffer.
+
+    Runs the whole loop in C without the GIL, so other Python threads can
+    encode concurrently. Coordinates must already be validated.
+
+    Args:
+        lats: C-contiguous float64 latitudes
+        lons: C-contiguous float64 longitudes (same length as lats)
+        precision: Code length (1-10)
+
+    Returns:
+        bytes of length N * precision; code i is out[i*precision:(i+1)*precision]
+    """
+    if lats.shape[0] != lons.shape[0]:
+        raise ValueError("lats and lons must have the same length")
+    if not (1 <= precision <= DIGIPIN_LEVELS):
+        raise ValueError(
+            f"Precision must be 1-{DIGIPIN_LEVELS}, got {precision}"
+        )
+
+    cdef Py_ssize_t n = lats.shape[0]
+    cdef Py_ssize_t i
+    cdef bytearray buffer = bytearray(n * precision)
+    cdef char* out = buffer
+
+    with nogil:
+        for i in range(n):
+            _encode_into(lats[i], lons[i], precision, out + i * precision)
+
+    return bytes(buffer)
 
 
 cpdef tuple decode_fast(str code):
@@ -145,8 +218,7 @@ cpdef tuple decode_fast(str code):
 
     Performance: ~500,000 ops/sec (10x faster than Python)
     """
-    # Validate and normalize code
-    code = code.upper()
+    # Validate code (case is handled by the lookup table)
     cdef int code_len = len(code)
 
     if code_len < 1 or code_len > DIGIPIN_LEVELS:
@@ -162,13 +234,12 @@ cpdef tuple decode_fast(str code):
     cdef double lat_span, lon_span
     cdef double lat1, lat2, lon1, lon2
     cdef int row, col
-    cdef char symbol_char
-    cdef bytes code_bytes = code.encode('ascii')
-    cdef int i
+    cdef Py_UCS4 symbol_char
 
     # Process each character
-    for i in range(code_len):
-        symbol_char = code_bytes[i]
+    for symbol_char in code:
+        if symbol_char > 255:
+            raise ValueError(f"Invalid character '{symbol_char}' in code")
 
         # Lookup position (O(1) array access)
         row = SYMBOL_TO_POS[<int>symbol_char][0]
@@ -176,7 +247,7 @@ cpdef tuple decode_fast(str code):
 
         if row == -1:
             raise ValueError(
-                f"Invalid character '{chr(symbol_char)}' in code"
+                f"Invalid character '{symbol_char}' in code"
             )
 
         # Calculate grid cell size
@@ -213,8 +284,7 @@ cpdef tuple get_bounds_fast(str code):
 
     Performance: ~500,000 ops/sec
     """
-    # Validate code
-    code = code.upper()
+    # Validate code (case is handled by the lookup table)
     cdef int code_len = len(code)
 
     if code_len < 1 or code_len > DIGIPIN_LEVELS:
@@ -229,13 +299,12 @@ cpdef tuple get_bounds_fast(str code):
     cdef double max_lon = LON_MAX
     cdef double lat_span, lon_span
     cdef int row, col
-    cdef char symbol_char
-    cdef bytes code_bytes = code.encode('ascii')
-    cdef int i
+    cdef Py_UCS4 symbol_char
 
     # Process each character
-    for i in range(code_len):
-        symbol_char = code_bytes[i]
+    for symbol_char in code:
+        if symbol_char > 255:
+            raise ValueError(f"Invalid character '{symbol_char}' in code")
 
         # Lookup position
         row = SYMBOL_TO_POS[<int>symbol_char][0]
@@ -243,7 +312,7 @@ cpdef tuple get_bounds_fast(str code):
 
         if row == -1:
             raise ValueError(
-                f"Invalid character '{chr(symbol_char)}' in code"
+                f"Invalid character '{symbol_char}' in code"
             )
 
         # Calculate grid cell size
@@ -259,6 +328,39 @@ cpdef tuple get_bounds_fast(str code):
     return (min_lat, max_lat, min_lon, max_lon)
 
 
+cpdef bint is_valid_fast(object code, bint strict=False):
+    """
+    Cython-optimized DIGIPIN format validation.
+
+    Args:
+        code: DIGIPIN code to validate
+        strict: If True, requires exactly 10 characters
+
+    Returns:
+        True if valid format (case-insensitive)
+
+    Performance: single pass over the code with a 256-entry lookup table
+    """
+    if not isinstance(code, str):
+        return False
+
+    cdef str code_str = <str>code
+    cdef Py_ssize_t code_len = len(code_str)
+    cdef Py_UCS4 ch
+
+    if strict:
+        if code_len != DIGIPIN_LEVELS:
+            return False
+    elif code_len < 1 or code_len > DIGIPIN_LEVELS:
+        return False
+
+    for ch in code_str:
+        if ch > 255 or not VALID_SYMBOL[ch]:
+            return False
+
+    return True
+
+
 # Batch operations for even better performance
 cpdef list batch_encode_fast(list coordinates, int precision=10):
     """
@@ -5,7 +5,10 @@ Implements hierarchical 4x4 grid subdivision decoding to convert DIGIPIN
 codes back to latitude/longitude coordinates.
 """
 
-from typing import Tuple
+import os
+import warnings
+from functools import lru_cache
+from typing import TYPE_CHECKING, List, Optional, Tuple, Union, overload
 from .utils import (
     LAT_MIN,
     LAT_MAX,
@@ -13,10 +16,63 @@ from .utils import (
     LON_MAX,
     DIGIPIN_LEVELS,
     GRID_SUBDIVISION,
+    SYMBOL_TO_POSITION,
+    _BATCH_VECTORIZE_MIN,
     validate_digipin,
     get_position_from_symbol,
 )
 
+if TYPE_CHECKING:
+    import numpy as np
+
+# Cell (lat, lon) size in degrees for each code length
+_CELL_SPANS = [
+    (
+        (LAT_MAX - LAT_MIN) / GRID_SUBDIVISION**level,
+        (LON_MAX - LON_MIN) / GRID_SUBDIVISION**level,
+    )
+    for level in range(DIGIPIN_LEVELS + 1)
+]
+
+# Number of code prefixes whose bounds get_bounds() keeps memoized. Every
+# prefix of a code is cached, so the default covers a few hundred full codes
+# plus all of their parents; raise it for large hierarchical traversals.
+_DEFAULT_BOUNDS_CACHE_SIZE = 4096
+
+
+def _read_cache_size() -> int:
+    """
+    Read the bounds cache size from the DIGIPIN_CACHE_SIZE environment variable.
+
+    Unset or blank values use the default. Anything that is not a
+    non-negative integer also uses the default, with a warning, rather
+    than making ``import digipin`` fail.
+
+    Returns:
+        Maximum number of memoized prefixes (0 disables the cache)
+    """
+    value = os.environ.get("DIGIPIN_CACHE_SIZE", "").strip()
+    if not value:
+        return _DEFAULT_BOUNDS_CACHE_SIZE
+
+    try:
+        size = int(value)
+    except ValueError:
+        size = -1
+
+    if size < 0:
+        warnings.warn(
+            f"Ignoring invalid DIGIPIN_CACHE_SIZE={value!r}; expected a "
+            f"non-negative integer, using {_DEFAULT_BOUNDS_CACHE_SIZE}",
+            RuntimeWarning,
+        )
+        return _DEFAULT_BOUNDS_CACHE_SIZE
+
+    return size
+
+
+_BOUNDS_CACHE_SIZE = _read_cache_size()
+
 
 def decode(code: str) -> Tuple[float, float]:
     """
@@ -53,37 +109,21 @@ def decode(code: str) -> Tuple[float, float]:
     # Validate and normalize code
     code = validate_digipin(code)
 
-    # Initialize to full bounding box
-    min_lat, max_lat = LAT_MIN, LAT_MAX
-    min_lon, max_lon = LON_MIN, LON_MAX
-
-    # Process each character to narrow down the grid
+    # Every bisection bound is an exact binary fraction, so the loop over
+    # levels collapses to the cell's integer (row, col) index at this
+    # precision - one base-4 digit per symbol - scaled by the cell size.
+    # This gives bit-for-bit the same center as subdividing level by level.
+    lat_index = lon_index = 0
     for char in code:
-        # Get grid position from symbol (using official grid)
-        row, col = get_position_from_symbol(char)
+        row, col = SYMBOL_TO_POSITION[char]
+        lat_index = (lat_index << 2) | (3 - row)  # Rows count from the north
+        lon_index = (lon_index << 2) | col
 
-        # Calculate grid cell size at this level
-        lat_span = (max_lat - min_lat) / GRID_SUBDIVISION
-        lon_span = (max_lon - min_lon) / GRID_SUBDIVISION
-
-        # Update bounds using official decoding logic
-        # Latitude bounds (calculated from top/maxLat)
-        lat1 = max_lat - lat_span * (row + 1)
-        lat2 = max_lat - lat_span * row
-
-        # Longitude bounds (calculated from left/minLon)
-        lon1 = min_lon + lon_span * col
-        lon2 = min_lon + lon_span * (col + 1)
-
-        # Update for next iteration
-        min_lat = lat1
-        max_lat = lat2
-        min_lon = lon1
-        max_lon = lon2
+    lat_span, lon_span = _CELL_SPANS[len(code)]
 
     # Return center point of final grid cell
-    center_lat = (min_lat + max_lat) / 2
-    center_lon = (min_lon + max_lon) / 2
+    center_lat = LAT_MIN + (lat_index + 0.5) * lat_span
+    center_lon = LON_MIN + (lon_index + 0.5) * lon_span
 
     return center_lat, center_lon
 
@@ -116,29 +156,36 @@ def get_bounds(code: str) -> Tuple[float, float, float, float]:
             f"got {len(code_upper)}"
         )
 
-    # Initialize to full bounding box
-    min_lat, max_lat = LAT_MIN, LAT_MAX
-    min_lon, max_lon = LON_MIN, LON_MAX
+    return _get_prefix_bounds(code_upper)
+
+
+@lru_cache(maxsize=_BOUNDS_CACHE_SIZE)
+def _get_prefix_bounds(prefix: str) -> Tuple[float, float, float, float]:
+    """
+    Bounding box of a normalized (uppercase) code prefix.
 
-    # Process each character
-    for char in code_upper:
-        # Get grid position
-        row, col = get_position_from_symbol(char)
+    Each prefix is derived from its parent's cached bounds, so sibling cells
+    visited together (e.g. during polyfill) share all of the parent work.
+    """
+    if not prefix:
+        return LAT_MIN, LAT_MAX, LON_MIN, LON_MAX
 
-        # Calculate grid cell size
-        lat_span = (max_lat - min_lat) / GRID_SUBDIVISION
-        lon_span = (max_lon - min_lon) / GRID_SUBDIVISION
+    min_lat, max_lat, min_lon, max_lon = _get_prefix_bounds(prefix[:-1])
 
-        # Update to selected sub-grid
-        new_min_lat = max_lat - (row + 1) * lat_span
-        new_max_lat = max_lat - row * lat_span
-        new_min_lon = min_lon + col * lon_span
-        new_max_lon = min_lon + (col + 1) * lon_span
+    # Get grid position
+    row, col = get_position_from_symbol(prefix[-1])
 
-        min_lat, max_lat = new_min_lat, new_max_lat
-        min_lon, max_lon = new_min_lon, new_max_lon
+    # Calculate grid cell size
+    lat_span = (max_lat - min_lat) / GRID_SUBDIVISION
+    lon_span = (max_lon - min_lon) / GRID_SUBDIVISION
 
-    return min_lat, max_lat, min_lon, max_lon
+    # Select sub-grid
+    return (
+        max_lat - (row + 1) * lat_span,
+        max_lat - row * lat_span,
+        min_lon + col * lon_span,
+        min_lon + (col + 1) * lon_span,
+    )
 
 
 def decode_with_bounds(code: str) -> dict:
@@ -160,29 +207,227 @@ def decode_with_bounds(code: str) -> dict:
         >>> result['bounds']
         (28.622785..., 28.622791..., 77.213029..., 77.213036...)
     """
-    lat, lon = decode(code)
-    bounds = get_bounds(code)
+    code_upper = code.upper()
+    lat, lon = decode(code_upper)
+    bounds = get_bounds(code_upper)
+
+    return {"code": code_upper, "lat": lat, "lon": lon, "bounds": bounds}
+
 
-    return {"code": code.upper(), "lat": lat, "lon": lon, "bounds": bounds}
+@overload
+def batch_decode(codes: list) -> List[Tuple[float, float]]: ...
 
 
-def batch_decode(codes: list) -> list:
+@overload
+def batch_decode(codes: "np.ndarray") -> "np.ndarray": ...
+
+
+def batch_decode(
+    codes: Union[list, "np.ndarray"],
+) -> Union[List[Tuple[float, float]], "np.ndarray"]:
     """
     Decode multiple DIGIPIN codes in batch.
 
+    A NumPy array of codes is decoded column-wise in one vectorized pass and
+    returns an (N, 2) array of (lat, lon); lists return a list of tuples,
+    and long lists take the same vectorized pass when NumPy is installed.
+
     Args:
-        codes: List of DIGIPIN codes
+        codes: List of DIGIPIN codes, or a NumPy array of codes
 
     Returns:
-        List of (lat, lon) tuples
+        List of (lat, lon) tuples ((N, 2) NumPy array for array input)
 
     Example:
         >>> batch_decode(['39J49LL8T4', '58C4K9FF72'])
         [(28.622788..., 77.213033...), (12.9716..., 77.5946...)]
     """
+    if hasattr(codes, "__array__"):
+        return _batch_decode_array(codes)
+
+    if isinstance(codes, list) and len(codes) >= _BATCH_VECTORIZE_MIN:
+        centers = _batch_decode_list(codes)
+        if centers is not None:
+            return centers
+
     return [decode(code) for code in codes]
 
 
+def _batch_decode_list(codes: list) -> Optional[List[Tuple[float, float]]]:
+    """
+    Vectorized batch_decode() for a list of codes.
+
+    Returns None when NumPy is unavailable or any code is invalid, leaving
+    the per-code loop to decode the list or raise decode()'s own error.
+    """
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        return None
+
+    try:
+        return list(map(tuple, _batch_decode_array(codes).tolist()))
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=None)
+def _symbol_position_table() -> "np.ndarray":
+    """
+    Byte value -> (row, col) lookup table, built once on first use.
+
+    Both letter cases map to the same position, so codes need no per-code
+    upper() before lookup; -1 marks bytes outside the alphabet.
+    """
+    import numpy as np
+
+    table = np.full((256, 2), -1, dtype=np.int64)
+    for symbol, position in SYMBOL_TO_POSITION.items():
+        table[ord(symbol)] = position
+        table[ord(symbol.lower())] = position
+    table.flags.writeable = False
+    return table
+
+
+def _grouped_positions(codes: list):
+    """
+    Validate codes and yield their grid positions grouped by code length.
+
+    Yields:
+        Tuples of (indices, positions) where indices are the input positions
+        of the codes in the group and positions has shape (n, length, 2)
+        holding (row, col) per character
+
+    Raises:
+        ValueError: If any code has an invalid length or character
+    """
+    import numpy as np
+
+    if not all(isinstance(code, str) for code in codes):
+        raise ValueError("DIGIPIN code must be a string")
+
+    lengths = np.fromiter(map(len, codes), dtype=np.int64, count=len(codes))
+
+    if lengths.min() < 1 or lengths.max() > DIGIPIN_LEVELS:
+        bad = codes[int(np.argmax((lengths < 1) | (lengths > DIGIPIN_LEVELS)))]
+        raise ValueError(
+            f"Code length must be between 1 and {DIGIPIN_LEVELS}, got {len(bad)}"
+        )
+
+    lookup = _symbol_position_table()
+
+    for length in np.unique(lengths).tolist():
+        indices = np.flatnonzero(lengths == length)
+        if indices.size == len(codes):
+            joined = "".join(codes)
+        else:
+            joined = "".join([codes[i] for i in indices.tolist()])
+        # Non-ASCII characters become a single '?' each and fail the lookup
+        chars = np.frombuffer(joined.encode("ascii", errors="replace"), np.uint8)
+        positions = lookup[chars.reshape(-1, length)]
+
+        invalid = (positions[:, :, 0] < 0).any(axis=1)
+        if invalid.any():
+            bad = codes[indices[int(np.argmax(invalid))]].upper()
+            raise ValueError(f"Invalid DIGIPIN code: '{bad}'")
+
+        yield indices, positions
+
+
+def _batch_decode_array(codes) -> "np.ndarray":
+    """Vectorized batch_decode() for arrays of codes."""
+    import numpy as np
+
+    codes = np.asarray(codes).ravel().tolist()
+    centers = np.empty((len(codes), 2))
+    if not codes:
+        return centers
+
+    for indices, positions in _grouped_positions(codes):
+        # Same fixed-point arithmetic as decode(): the integer cell index is
+        # one base-4 digit per level, scaled by the cell size
+        length = positions.shape[1]
+        digit_weights = GRID_SUBDIVISION ** np.arange(length - 1, -1, -1)
+        lat_index = (3 - positions[:, :, 0]) @ digit_weights
+        lon_index = positions[:, :, 1] @ digit_weights
+
+        lat_span, lon_span = _CELL_SPANS[length]
+        centers[indices, 0] = LAT_MIN + (lat_index + 0.5) * lat_span
+        centers[indices, 1] = LON_MIN + (lon_index + 0.5) * lon_span
+
+    return centers
+
+
+def batch_bounds(codes: list) -> "np.ndarray":
+    """
+    Get the bounding boxes of many DIGIPIN codes as a NumPy array.
+
+    Codes are translated to grid positions through a 256-entry lookup table
+    and subdivided level by level over whole arrays, so the per-code cost is
+    a few vectorized operations instead of a Python loop. Codes of different
+    lengths are processed in one group per length.
+
+    Requires NumPy (``pip install numpy``).
+
+    Args:
+        codes: List of DIGIPIN codes (1-10 characters each)
+
+    Returns:
+        Array of shape (N, 4) with rows of (min_lat, max_lat, min_lon, max_lon),
+        identical to calling get_bounds() on each code
+
+    Raises:
+        ImportError: If NumPy is not installed
+        ValueError: If any code has an invalid length or character
+
+    Example:
+        >>> bounds = batch_bounds(['39J4', '58C4'])
+        >>> bounds[0]
+        array([28.515625, 28.65625 , 77.140625, 77.28125 ])
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        raise ImportError(
+            "NumPy is required for batch_bounds. Install it with: pip install numpy"
+        )
+
+    bounds = np.empty((len(codes), 4))
+    if not codes:
+        return bounds
+
+    for indices, positions in _grouped_positions(codes):
+        count = indices.shape[0]
+        min_lat = np.full(count, LAT_MIN)
+        max_lat = np.full(count, LAT_MAX)
+        min_lon = np.full(count, LON_MIN)
+        max_lon = np.full(count, LON_MAX)
+
+        # Same per-level arithmetic as get_bounds()
+        for level in range(positions.shape[1]):
+            row = positions[:, level, 0]
+            col = positions[:, level, 1]
+
+            lat_span = (max_lat - min_lat) / GRID_SUBDIVISION
+            lon_span = (max_lon - min_lon) / GRID_SUBDIVISION
+
+            min_lat, max_lat = (
+                max_lat - (row + 1) * lat_span,
+                max_lat - row * lat_span,
+            )
+            min_lon, max_lon = (
+                min_lon + col * lon_span,
+                min_lon + (col + 1) * lon_span,
+            )
+
+        bounds[indices, 0] = min_lat
+        bounds[indices, 1] = max_lat
+        bounds[indices, 2] = min_lon
+        bounds[indices, 3] = max_lon
+
+    return bounds
+
+
 def get_parent(code: str, level: int) -> str:
     """
     Get parent DIGIPIN code at a higher (coarser) level.
@@ -16,8 +16,14 @@ Usage:
     Warehouse.objects.filter(location_code__startswith='39')
 """
 
+import operator
+import os
+from functools import reduce
+from typing import Iterable, Iterator, List
+
 try:
     from django.db import models
+    from django.db.models import Q
     from django.core.exceptions import ValidationError
     from django.utils.translation import gettext_lazy as _
 except ImportError:
@@ -28,6 +34,7 @@ except ImportError:
 
 from .utils import is_valid_digipin, validate_digipin
 from .decoder import is_within
+from .neighbors import get_neighbors
 
 
 class DigipinField(models.CharField):
@@ -98,6 +105,14 @@ class WithinLookup(models.Lookup):
     Example: Address.objects.filter(digipin__within='39J4')
 
     Translates to SQL: digipin LIKE '39J4%'
+
+    Index usage:
+        A left-anchored LIKE can only be served by a B-tree index whose
+        ordering is byte-wise. On PostgreSQL with a non-C collation, that
+        means a ``varchar_pattern_ops`` index. Declaring the field with
+        ``DigipinField(db_index=True)`` makes Django create one (the extra
+        ``*_like`` index) alongside the regular index, so ``within``
+        queries become index range scans instead of sequential scans.
     """
 
     lookup_name = "within"
@@ -108,22 +123,117 @@ class WithinLookup(models.Lookup):
 
         # In SQL, we implement 'within' as a LIKE prefix match
         # Logic: if row_value LIKE 'parent_code%'
-        # The LIKE pattern is constructed as: rhs_params[0] + '%'
-        return f"{lhs} LIKE %s", [f"{rhs_params[0]}%"]
+        # The pattern is escaped and the backend's own prefix operator is
+        # used (e.g. SQLite needs an ESCAPE clause), exactly as Django does
+        # for startswith, so the planner can use a prefix index.
+        prefix = connection.ops.prep_for_like_query(rhs_params[0])
+        return f"{lhs} {connection.operators['startswith'] % '%s'}", [
+            *params,
+            f"{prefix}%",
+        ]
 
 
 @DigipinField.register_lookup
 class IsNeighborLookup(models.Lookup):
     """
-    Custom lookup to check if a DB value is a neighbor of the query value.
-    Note: This is complex to implement purely in SQL for all databases without
-    stored procedures. For V1, we stick to 'within' which is most useful.
+    Allows filtering to the 8 cells surrounding a code.
+    Example: Address.objects.filter(digipin__is_neighbor='39J49LL8T4')
+
+    Translates to SQL: digipin IN ('39J49LL8T2', ..., '39J49LL8TP')
+
+    When the neighbors share a long common prefix (the usual case at high
+    precision), the IN list is preceded by
+    ``digipin BETWEEN lo AND hi`` (see neighbor_bbox()). The planner can
+    then read the neighbors with one index range scan instead of eight
+    probes, and the IN list filters out non-neighbors inside the range.
     """
 
     lookup_name = "is_neighbor"
 
+    # Shortest common prefix of (lo, hi) worth emitting a range for
+    range_prefix_length = 7
+
     def as_sql(self, compiler, connection):
-        raise NotImplementedError(
-            "Neighbor lookups are not yet supported at the database level. "
-            "Use application-side filtering with get_neighbors() instead."
+        lhs, lhs_params = compiler.compile(self.lhs)
+        neighbors = get_neighbors(self.rhs)
+
+        placeholders = ", ".join(["%s"] * len(neighbors))
+        sql = f"{lhs} IN ({placeholders})"
+        params = [*lhs_params, *neighbors]
+
+        lo, hi = min(neighbors), max(neighbors)
+        if len(os.path.commonprefix([lo, hi])) >= self.range_prefix_length:
+            sql = f"{lhs} BETWEEN %s AND %s AND {sql}"
+            params = [*lhs_params, lo, hi, *params]
+
+        return sql, params
+
+
+def neighbors_of(codes: Iterable[str], field: str = "digipin") -> Q:
+    """
+    Build a filter matching the neighbors of any of several codes.
+
+    Combines one ``is_neighbor`` lookup per distinct code with OR, so
+    neighbors of a whole batch of references are fetched in a single query
+    instead of one query per reference.
+
+    Args:
+        codes: Reference DIGIPIN codes.
+        field: Name of the DigipinField to filter on.
+
+    Returns:
+        A Q object for use in ``filter()``. Empty input gives a Q that
+        matches nothing.
+
+    Example:
+        >>> Warehouse.objects.filter(neighbors_of(['39J49LL8T4', '39J49LL8T9']))
+    """
+    lookup = f"{field}__is_neighbor"
+    queries = [Q(**{lookup: code}) for code in dict.fromkeys(codes)]
+    if not queries:
+        return Q(pk__in=[])
+    return reduce(operator.or_, queries)
+
+
+def paginate_by_digipin(
+    queryset, page_size: int = 2000, field: str = "digipin"
+) -> Iterator[List[models.Model]]:
+    """
+    Iterate over a queryset in pages ordered by DIGIPIN code.
+
+    Uses keyset pagination: each page is fetched with
+    ``WHERE (digipin, pk) > (last_digipin, last_pk)`` rather than an
+    OFFSET. Every page is then an index range read, no matter how deep into
+    the table it is, whereas OFFSET re-reads all earlier rows. The primary
+    key breaks ties, so rows that share a code are never skipped or
+    repeated.
+
+    Args:
+        queryset: Queryset to page through (any existing ordering is
+                  replaced).
+        page_size: Maximum number of rows per page.
+        field: Name of the DigipinField to order by.
+
+    Yields:
+        Lists of model instances, at most page_size long.
+
+    Example:
+        >>> for page in paginate_by_digipin(Location.objects.all()):
+        ...     process(page)
+    """
+    if page_size < 1:
+        raise ValueError(f"page_size must be positive, got {page_size}")
+
+    queryset = queryset.order_by(field, "pk")
+    page = list(queryset[:page_size])
+    while page:
+        yield page
+        if len(page) < page_size:
+            return
+        last = page[-1]
+        code = getattr(last, field)
+        page = list(
+            queryset.filter(
+                Q(**{f"{field}__gt": code}) | Q(**{field: code, "pk__gt": last.pk})
+            )[:page_size]
         )
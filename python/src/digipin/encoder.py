@@ -8,7 +8,17 @@ This is the CORE algorithm that converts latitude/longitude coordinates
 into 10-character DIGIPIN codes using spiral anticlockwise labeling.
 """
 
-from typing import Tuple
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Union,
+    overload,
+)
 from .utils import (
     LAT_MIN,
     LAT_MAX,
@@ -16,10 +26,115 @@ from .utils import (
     LON_MAX,
     DIGIPIN_LEVELS,
     GRID_SUBDIVISION,
+    SPIRAL_GRID,
+    _BATCH_VECTORIZE_MIN,
+    batch_is_valid_coordinate,
     validate_coordinate,
-    get_symbol_from_position,
 )
 
+if TYPE_CHECKING:
+    import numpy as np
+
+try:
+    # Compiled, GIL-free array kernel (optional Cython extension)
+    from .core_fast import encode_array_fast as _encode_array_fast
+except ImportError:
+    _encode_array_fast = None
+
+# Fixed-point fast path. Every bisection bound is an exact binary fraction,
+# so the level-10 cell index along each axis is just the integer part of
+# (coord - min) / finest_span, and each level's row/col is one base-4 digit
+# of it. Points within _EDGE_MARGIN of a grid line (where the reference
+# loop's rounding decides the cell) fall back to the loop.
+_FINEST_LAT_SPAN = (LAT_MAX - LAT_MIN) / GRID_SUBDIVISION**DIGIPIN_LEVELS
+_FINEST_LON_SPAN = (LON_MAX - LON_MIN) / GRID_SUBDIVISION**DIGIPIN_LEVELS
+_EDGE_MARGIN = 1e-6  # In finest-cell units; loop rounding error is ~1e-10
+
+# Two levels per lookup: index is (lat digits << 4) | lon digits
+_LEVEL_PAIR_SYMBOLS = [
+    SPIRAL_GRID[3 - (lat_digits >> 2)][lon_digits >> 2]
+    + SPIRAL_GRID[3 - (lat_digits & 3)][lon_digits & 3]
+    for lat_digits in range(16)
+    for lon_digits in range(16)
+]
+
+
+def _code_from_finest_index(q_lat: int, q_lon: int) -> str:
+    """
+    Build the full-precision code for a level-10 cell index.
+
+    Args:
+        q_lat: Row index counted from the south, 0 <= q_lat < 4**10
+        q_lon: Column index counted from the west, 0 <= q_lon < 4**10
+
+    Returns:
+        10-character DIGIPIN code
+    """
+    pairs = _LEVEL_PAIR_SYMBOLS
+    return (
+        pairs[(q_lat >> 12 & 0xF0) | (q_lon >> 16)]
+        + pairs[(q_lat >> 8 & 0xF0) | (q_lon >> 12 & 0xF)]
+        + pairs[(q_lat >> 4 & 0xF0) | (q_lon >> 8 & 0xF)]
+        + pairs[(q_lat & 0xF0) | (q_lon >> 4 & 0xF)]
+        + pairs[(q_lat << 4 & 0xF0) | (q_lon & 0xF)]
+    )
+
+
+# Encoders specialized for a single precision, built on first use
+_SPECIALIZED_ENCODERS: Dict[int, Callable[[float, float], str]] = {}
+
+
+def _build_specialized_encoder(precision: int) -> Callable[[float, float], str]:
+    """
+    Generate an encoder with the subdivision loop unrolled for one precision.
+
+    The generated function performs exactly the same floating-point steps as
+    the loop in encode(), but with the level count baked in, the first
+    level's spans folded to constants, and the final (unused) bounds update
+    dropped. Inputs must already be validated.
+    """
+    first_lat_span = (LAT_MAX - LAT_MIN) / GRID_SUBDIVISION
+    first_lon_span = (LON_MAX - LON_MIN) / GRID_SUBDIVISION
+
+    lines = [
+        "def _encode(lat, lon):",
+        f"    min_lat = {LAT_MIN!r}",
+        f"    min_lon = {LON_MIN!r}",
+    ]
+
+    for level in range(precision):
+        if level == 0:
+            lat_span, lon_span = repr(first_lat_span), repr(first_lon_span)
+        else:
+            lines += [
+                f"    lat_span = (max_lat - min_lat) / {GRID_SUBDIVISION}",
+                f"    lon_span = (max_lon - min_lon) / {GRID_SUBDIVISION}",
+            ]
+            lat_span, lon_span = "lat_span", "lon_span"
+
+        lines += [
+            f"    row = 3 - int((lat - min_lat) / {lat_span})",
+            f"    col = int((lon - min_lon) / {lon_span})",
+            "    row = 0 if row < 0 else (3 if row > 3 else row)",
+            "    col = 0 if col < 0 else (3 if col > 3 else col)",
+            f"    s{level} = SPIRAL_GRID[row][col]",
+        ]
+
+        if level < precision - 1:
+            lines += [
+                f"    max_lat = min_lat + {lat_span} * (4 - row)",
+                f"    min_lat = min_lat + {lat_span} * (3 - row)",
+                f"    min_lon = min_lon + {lon_span} * col",
+                f"    max_lon = min_lon + {lon_span}",
+            ]
+
+    lines.append("    return " + " + ".join(f"s{level}" for level in range(precision)))
+
+    namespace: Dict[str, Any] = {"SPIRAL_GRID": SPIRAL_GRID}
+    exec("\n".join(lines), namespace)
+    encode_fn: Callable[[float, float], str] = namespace["_encode"]
+    return encode_fn
+
 
 def encode(lat: float, lon: float, *, precision: int = 10) -> str:
     """
@@ -69,68 +184,267 @@ def encode(lat: float, lon: float, *, precision: int = 10) -> str:
             f"Precision must be between 1 and {DIGIPIN_LEVELS}, got {precision}"
         )
 
-    # Initialize bounding box
-    min_lat, max_lat = LAT_MIN, LAT_MAX
-    min_lon, max_lon = LON_MIN, LON_MAX
+    x = (lat - LAT_MIN) / _FINEST_LAT_SPAN
+    y = (lon - LON_MIN) / _FINEST_LON_SPAN
+    q_lat = int(x)
+    q_lon = int(y)
 
-    code = ""
+    if (
+        _EDGE_MARGIN < x - q_lat < 1 - _EDGE_MARGIN
+        and _EDGE_MARGIN < y - q_lon < 1 - _EDGE_MARGIN
+    ):
+        code = _code_from_finest_index(q_lat, q_lon)
+        return code if precision == DIGIPIN_LEVELS else code[:precision]
 
-    # Hierarchical subdivision: 10 levels
-    for level in range(1, precision + 1):
-        # Calculate grid cell size at this level
-        lat_span = (max_lat - min_lat) / GRID_SUBDIVISION
-        lon_span = (max_lon - min_lon) / GRID_SUBDIVISION
+    # Near a grid line: dispatch to the encoder specialized for this precision
+    specialized = _SPECIALIZED_ENCODERS.get(precision)
+    if specialized is None:
+        specialized = _build_specialized_encoder(precision)
+        _SPECIALIZED_ENCODERS[precision] = specialized
+
+    return specialized(lat, lon)
+
+
+def _encode_arrays(
+    lats: "np.ndarray", lons: "np.ndarray", precision: int
+) -> "np.ndarray":
+    """
+    Encode arrays of in-bounds coordinates to DIGIPIN codes in one pass.
+
+    Uses the same fixed-point scheme as encode(), but on whole coordinate
+    arrays, so the per-point cost is a handful of NumPy operations instead
+    of a Python function call. Points near a grid line go through the
+    level-by-level loop instead, as in encode(). When the Cython extension
+    is built, the work runs in C without the GIL. Inputs must already be
+    validated.
+
+    Args:
+        lats: 1-D float array of latitudes
+        lons: 1-D float array of longitudes
+        precision: Code length (1-10)
+
+    Returns:
+        Array of dtype ``S{precision}`` (ASCII bytes), in input order
+    """
+    import numpy as np
+
+    if _encode_array_fast is not None:
+        packed = _encode_array_fast(
+            np.ascontiguousarray(lats, dtype=np.float64),
+            np.ascontiguousarray(lons, dtype=np.float64),
+            precision,
+        )
+        return np.frombuffer(packed, dtype=f"S{precision}")
+
+    symbols = np.frombuffer(
+        "".join("".join(row) for row in SPIRAL_GRID).encode("ascii"), dtype=np.uint8
+    )
+
+    x = (lats - LAT_MIN) / _FINEST_LAT_SPAN
+    y = (lons - LON_MIN) / _FINEST_LON_SPAN
+    q_lat = x.astype(np.intp)
+    q_lon = y.astype(np.intp)
+
+    # Two levels per lookup, as in encode(): each uint16 of pair_symbols is
+    # the two ASCII bytes of a _LEVEL_PAIR_SYMBOLS entry
+    pair_symbols = np.frombuffer(
+        "".join(_LEVEL_PAIR_SYMBOLS).encode("ascii"), dtype=np.uint16
+    )
+    num_pairs = (precision + 1) // 2
+    chars = np.empty((lats.shape[0], 2 * num_pairs), dtype=np.uint8)
+    char_pairs = chars.view(np.uint16)
+
+    # Digits are extracted in place into two scratch arrays, so each pair
+    # of levels costs a few passes over memory and no temporaries
+    index = np.empty_like(q_lat)
+    lon_digits = np.empty_like(q_lon)
+    for pair in range(num_pairs):
+        shift = 4 * (DIGIPIN_LEVELS // 2 - 1 - pair)
+        np.right_shift(q_lat, shift, out=index)
+        index &= 0xF
+        index <<= 4
+        np.right_shift(q_lon, shift, out=lon_digits)
+        lon_digits &= 0xF
+        index |= lon_digits
+        char_pairs[:, pair] = pair_symbols.take(index)
+
+    if precision % 2:
+        chars = np.ascontiguousarray(chars[:, :precision])
+
+    x -= q_lat
+    y -= q_lon
+    near_edge = (x <= _EDGE_MARGIN) | (x >= 1 - _EDGE_MARGIN)
+    near_edge |= (y <= _EDGE_MARGIN) | (y >= 1 - _EDGE_MARGIN)
+    if near_edge.any():
+        chars[near_edge] = _subdivide_arrays(
+            lats[near_edge], lons[near_edge], precision, symbols
+        )
 
-        # Determine which 4x4 sub-grid contains the point
-        # Row: 0 (North) to 3 (South)
-        # Col: 0 (West) to 3 (East)
+    return chars.view(f"S{precision}").ravel()
 
-        # Calculate grid position (from official implementation)
-        # Row is REVERSED: calculate from bottom (min_lat) then flip
-        row = 3 - int((lat - min_lat) / lat_span)
 
-        # Column: calculate from left (min_lon)
-        col = int((lon - min_lon) / lon_span)
+def _subdivide_arrays(
+    lats: "np.ndarray", lons: "np.ndarray", precision: int, symbols: "np.ndarray"
+) -> "np.ndarray":
+    """Array version of the reference loop; returns (N, precision) bytes."""
+    import numpy as np
 
-        # Clamp to valid range [0, 3]
-        row = max(0, min(row, 3))
-        col = max(0, min(col, 3))
+    count = lats.shape[0]
+    chars = np.empty((count, precision), dtype=np.uint8)
 
-        # Get symbol for this grid position using official grid
-        symbol = get_symbol_from_position(row, col)
-        code += symbol
+    min_lat = np.full(count, LAT_MIN)
+    max_lat = np.full(count, LAT_MAX)
+    min_lon = np.full(count, LON_MIN)
+    max_lon = np.full(count, LON_MAX)
+
+    for level in range(precision):
+        lat_span = (max_lat - min_lat) / GRID_SUBDIVISION
+        lon_span = (max_lon - min_lon) / GRID_SUBDIVISION
+
+        # Same truncation and clamping as the scalar encoder
+        row = 3 - ((lats - min_lat) / lat_span).astype(np.int64)
+        col = ((lons - min_lon) / lon_span).astype(np.int64)
+        np.clip(row, 0, 3, out=row)
+        np.clip(col, 0, 3, out=col)
+
+        chars[:, level] = symbols[row * GRID_SUBDIVISION + col]
 
-        # Update bounds using official logic (reversed for row)
-        # Row bounds (note the reversed logic from official JS implementation)
         max_lat = min_lat + lat_span * (4 - row)
         min_lat = min_lat + lat_span * (3 - row)
-
-        # Column bounds
         min_lon = min_lon + lon_span * col
         max_lon = min_lon + lon_span
 
-    return code
+    return chars
+
+
+@overload
+def batch_encode(coordinates: list, **kwargs: Any) -> List[str]: ...
+
+
+@overload
+def batch_encode(coordinates: "np.ndarray", **kwargs: Any) -> "np.ndarray": ...
 
 
-def batch_encode(coordinates: list, **kwargs) -> list:
+def batch_encode(
+    coordinates: Union[list, "np.ndarray"], **kwargs: Any
+) -> Union[List[str], "np.ndarray"]:
     """
     Encode multiple coordinate pairs in batch.
 
+    A NumPy array (or any array-like exposing ``__array__``, such as a
+    DataFrame) of shape (N, 2) is encoded column-wise in one vectorized
+    pass and returns a NumPy array of codes; lists return a list, and long
+    numeric lists take the same vectorized pass when NumPy is installed.
+
     Args:
-        coordinates: List of (lat, lon) tuples
+        coordinates: List of (lat, lon) tuples, or an (N, 2) array
         **kwargs: Additional arguments passed to encode()
 
     Returns:
-        List of DIGIPIN codes
+        List of DIGIPIN codes (NumPy string array for array input)
 
     Example:
         >>> coords = [(28.622788, 77.213033), (12.9716, 77.5946)]
         >>> batch_encode(coords)
         ['39J49LL8T4', '58C4K9FF72']
     """
+    if hasattr(coordinates, "__array__"):
+        return _batch_encode_array(coordinates, **kwargs)
+
+    if isinstance(coordinates, list) and len(coordinates) >= _BATCH_VECTORIZE_MIN:
+        codes = _batch_encode_list(coordinates, **kwargs)
+        if codes is not None:
+            return codes
+
     return [encode(lat, lon, **kwargs) for lat, lon in coordinates]
 
 
+def _batch_encode_list(coordinates: list, **kwargs) -> Optional[List[str]]:
+    """
+    Vectorized batch_encode() for a list of (lat, lon) pairs.
+
+    Returns None when the fast path does not apply (no NumPy, non-numeric
+    or ragged input, or invalid values), leaving the per-pair loop to encode
+    the list or raise encode()'s own error for the offending pair.
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        return None
+
+    try:
+        coords = np.array(coordinates)
+    except ValueError:
+        return None
+    if coords.dtype.kind not in "iuf" or coords.ndim != 2 or coords.shape[1] != 2:
+        return None
+
+    try:
+        return list(_batch_encode_array(coords, **kwargs).tolist())
+    except (TypeError, ValueError):
+        return None
+
+
+def _batch_encode_array(coordinates, *, precision: int = 10) -> "np.ndarray":
+    """Vectorized batch_encode() for (N, 2) arrays of (lat, lon)."""
+    import numpy as np
+
+    coords = np.asarray(coordinates, dtype=np.float64)
+    if coords.ndim != 2 or coords.shape[1] != 2:
+        raise ValueError(f"Coordinate array must have shape (N, 2), got {coords.shape}")
+
+    return _encode_columns(coords[:, 0], coords[:, 1], precision)
+
+
+def _encode_columns(lats, lons, precision: int = 10) -> "np.ndarray":
+    """
+    Validate and encode separate latitude and longitude columns.
+
+    Args:
+        lats: 1-D array-like of latitudes
+        lons: 1-D array-like of longitudes, same length as lats
+        precision: Code length (1-10)
+
+    Returns:
+        NumPy array of DIGIPIN codes (str), in input order
+
+    Raises:
+        ValueError: If precision is invalid or any coordinate is out of bounds
+    """
+    return _encode_column_bytes(lats, lons, precision).astype(str)
+
+
+def _encode_column_bytes(lats, lons, precision: int = 10) -> "np.ndarray":
+    """
+    Like _encode_columns(), but return the kernel's ``S{precision}`` array.
+
+    Skips the conversion to str for callers that can consume ASCII bytes
+    directly (e.g. to build an Arrow string array).
+    """
+    import numpy as np
+
+    if not (1 <= precision <= DIGIPIN_LEVELS):
+        raise ValueError(
+            f"Precision must be between 1 and {DIGIPIN_LEVELS}, got {precision}"
+        )
+
+    lats = np.ascontiguousarray(lats, dtype=np.float64)
+    lons = np.ascontiguousarray(lons, dtype=np.float64)
+    if lats.ndim != 1 or lats.shape != lons.shape:
+        raise ValueError(
+            f"Latitude and longitude must be 1-D and the same length, "
+            f"got shapes {lats.shape} and {lons.shape}"
+        )
+
+    # NaN fails both comparisons, so it is reported as out of bounds too
+    in_bounds = batch_is_valid_coordinate(lats, lons)
+    if not in_bounds.all():
+        first = int(np.argmin(in_bounds))
+        validate_coordinate(float(lats[first]), float(lons[first]))
+
+    return _encode_arrays(lats, lons, precision)
+
+
 def encode_with_bounds(lat: float, lon: float, **kwargs) -> dict:
     """
     Encode coordinates and return code with grid cell bounds.
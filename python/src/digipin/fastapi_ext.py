@@ -14,15 +14,17 @@ Usage:
 try:
     from fastapi import APIRouter, HTTPException, Query
     from pydantic import BaseModel, Field, field_validator
+    from typing_extensions import Annotated, TypedDict
 except ImportError:
     raise ImportError(
         "FastAPI and Pydantic are required. "
         "Install with: pip install digipinpy[fastapi]"
     )
 
-from typing import List, Optional, Dict, Any
-from .encoder import encode, batch_encode
-from .decoder import decode, batch_decode, get_bounds, get_parent
+from typing import List, Optional, Dict, Any, Sequence, Tuple
+from . import decode_cached, encode_cached
+from .encoder import batch_encode, _encode_columns
+from .decoder import batch_decode, get_bounds, get_parent, _batch_decode_array
 from .neighbors import get_neighbors, get_disk, get_ring
 from .utils import is_valid_coordinate, is_valid_digipin
 
@@ -36,6 +38,19 @@ class Coordinate(BaseModel):
     lon: float = Field(..., ge=63.5, le=99.5, description="Longitude (East)")
 
 
+# Batch payloads use a TypedDict with the same fields and bounds as
+# Coordinate: Pydantic validates each item as a plain dict instead of building
+# a model instance, which makes 10,000-item batches several times cheaper to
+# parse and serialize.
+
+
+class CoordinateItem(TypedDict):
+    """Coordinate inside batch requests and responses."""
+
+    lat: Annotated[float, Field(ge=2.5, le=38.5, description="Latitude (North)")]
+    lon: Annotated[float, Field(ge=63.5, le=99.5, description="Longitude (East)")]
+
+
 class DigipinRequest(BaseModel):
     code: str = Field(..., min_length=1, max_length=10, description="DIGIPIN Code")
 
@@ -58,15 +73,26 @@ class DecodeResponse(BaseModel):
     bounds: Optional[List[float]] = None
 
 
+# Upper bound on items per batch request, so one request cannot tie up a
+# worker indefinitely; larger jobs should be split across requests
+MAX_BATCH_SIZE = 10_000
+
+
 class BatchEncodeRequest(BaseModel):
-    coordinates: List[Coordinate] = Field(
-        ..., description="List of coordinates to encode"
+    coordinates: List[CoordinateItem] = Field(
+        ...,
+        max_length=MAX_BATCH_SIZE,
+        description=f"List of coordinates to encode (at most {MAX_BATCH_SIZE})",
     )
     precision: int = Field(10, ge=1, le=10, description="Precision level (1-10)")
 
 
 class BatchDecodeRequest(BaseModel):
-    codes: List[str] = Field(..., description="List of DIGIPIN codes to decode")
+    codes: List[str] = Field(
+        ...,
+        max_length=MAX_BATCH_SIZE,
+        description=f"List of DIGIPIN codes to decode (at most {MAX_BATCH_SIZE})",
+    )
 
 
 class ValidateResponse(BaseModel):
@@ -76,6 +102,64 @@ class ValidateResponse(BaseModel):
     error: Optional[str] = None
 
 
+# Every route declares a response model: FastAPI then serializes the return
+# value straight to JSON bytes with Pydantic instead of going through
+# jsonable_encoder and json.dumps, which is over twice as fast for the
+# large batch and disk responses.
+
+
+class NeighborsResponse(BaseModel):
+    center: str
+    neighbors: List[str]
+    count: int
+
+
+class DiskResponse(BaseModel):
+    center: str
+    radius: int
+    grid_size: str
+    cells: List[str]
+    count: int
+
+
+class RingResponse(BaseModel):
+    center: str
+    radius: int
+    cells: List[str]
+    count: int
+
+
+class ParentResponse(BaseModel):
+    original: str
+    parent: str
+    original_level: int
+    parent_level: int
+
+
+class BatchEncodeResponse(BaseModel):
+    precision: int
+    count: int
+    codes: List[str]
+
+
+class BatchDecodeResponse(BaseModel):
+    count: int
+    coordinates: List[CoordinateItem]
+
+
+class BoundsResponse(BaseModel):
+    code: str
+    bounds: Dict[str, float]
+    center: Dict[str, float]
+    dimensions: Dict[str, float]
+
+
+class HealthResponse(BaseModel):
+    status: str
+    service: str
+    version: str
+
+
 # -------------------------------------------------------------------------
 # API Router
 # -------------------------------------------------------------------------
@@ -83,10 +167,32 @@ class ValidateResponse(BaseModel):
 router = APIRouter(tags=["DIGIPIN"])
 
 
+def _encode_batch(coords: List[Tuple[float, float]], precision: int) -> List[str]:
+    """Encode a request's coordinates in one vectorized pass if NumPy is present."""
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        return batch_encode(coords, precision=precision)
+
+    lats = [lat for lat, _ in coords]
+    lons = [lon for _, lon in coords]
+    return list(_encode_columns(lats, lons, precision).tolist())
+
+
+def _decode_batch(codes: List[str]) -> List[Sequence[float]]:
+    """Decode a request's codes in one vectorized pass if NumPy is present."""
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        return list(batch_decode(codes))
+
+    return list(_batch_decode_array(codes).tolist())
+
+
 @router.post("/encode", response_model=EncodeResponse)
 async def encode_coordinate(coord: Coordinate, precision: int = Query(10, ge=1, le=10)):
     """Encode a latitude/longitude pair into a DIGIPIN code."""
-    code = encode(coord.lat, coord.lon, precision=precision)
+    code = encode_cached(coord.lat, coord.lon, precision=precision)
     return {"code": code, "precision": precision}
 
 
@@ -96,7 +202,7 @@ async def decode_code(code: str, include_bounds: bool = False):
     if not is_valid_digipin(code):
         raise HTTPException(status_code=400, detail="Invalid DIGIPIN code")
 
-    lat, lon = decode(code)
+    lat, lon = decode_cached(code)
     response: Dict[str, Any] = {"lat": lat, "lon": lon}
 
     if include_bounds:
@@ -105,7 +211,7 @@ async def decode_code(code: str, include_bounds: bool = False):
     return response
 
 
-@router.get("/neighbors/{code}")
+@router.get("/neighbors/{code}", response_model=NeighborsResponse)
 async def get_adjacent_cells(code: str, direction: str = "all"):
     """Get neighboring grid cells."""
     if not is_valid_digipin(code):
@@ -118,7 +224,7 @@ async def get_adjacent_cells(code: str, direction: str = "all"):
         raise HTTPException(status_code=400, detail=str(e))
 
 
-@router.get("/disk/{code}")
+@router.get("/disk/{code}", response_model=DiskResponse)
 async def get_search_area(
     code: str,
     radius: int = Query(1, ge=0, le=100, description="Search radius in cells"),
@@ -147,7 +253,7 @@ async def get_search_area(
         raise HTTPException(status_code=400, detail=str(e))
 
 
-@router.get("/ring/{code}")
+@router.get("/ring/{code}", response_model=RingResponse)
 async def get_ring_cells(
     code: str, radius: int = Query(1, ge=1, le=100, description="Ring radius in cells")
 ):
@@ -164,7 +270,7 @@ async def get_ring_cells(
         raise HTTPException(status_code=400, detail=str(e))
 
 
-@router.get("/parent/{code}")
+@router.get("/parent/{code}", response_model=ParentResponse)
 async def get_parent_code(
     code: str,
     level: int = Query(..., ge=1, le=10, description="Target precision level"),
@@ -185,18 +291,18 @@ async def get_parent_code(
         raise HTTPException(status_code=400, detail=str(e))
 
 
-@router.post("/batch/encode")
+@router.post("/batch/encode", response_model=BatchEncodeResponse)
 async def batch_encode_coordinates(request: BatchEncodeRequest):
     """Batch encode multiple coordinates to DIGIPIN codes."""
     try:
-        coords = [(c.lat, c.lon) for c in request.coordinates]
-        codes = batch_encode(coords, precision=request.precision)
+        coords = [(c["lat"], c["lon"]) for c in request.coordinates]
+        codes = _encode_batch(coords, request.precision)
         return {"precision": request.precision, "count": len(codes), "codes": codes}
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
 
-@router.post("/batch/decode")
+@router.post("/batch/decode", response_model=BatchDecodeResponse)
 async def batch_decode_codes(request: BatchDecodeRequest):
     """Batch decode multiple DIGIPIN codes to coordinates."""
     # Validate all codes first
@@ -207,7 +313,7 @@ async def batch_decode_codes(request: BatchDecodeRequest):
         )
 
     try:
-        coords = batch_decode(request.codes)
+        coords = _decode_batch(request.codes)
         return {
             "count": len(coords),
             "coordinates": [{"lat": lat, "lon": lon} for lat, lon in coords],
@@ -225,8 +331,9 @@ async def validate_code(code: str, strict: bool = False):
     - strict=True: Requires exactly 10 characters
     """
     valid = is_valid_digipin(code, strict=strict)
+    code_upper = code.upper()
 
-    response = {"code": code.upper() if valid else code, "valid": valid}
+    response = {"code": code_upper if valid else code, "valid": valid}
 
     if valid:
         response["precision"] = len(code)
@@ -239,7 +346,7 @@ async def validate_code(code: str, strict: bool = False):
         elif strict and len(code) != 10:
             errors.append(f"Strict mode requires 10 characters, got {len(code)}")
         else:
-            invalid_chars = [c for c in code.upper() if c not in "23456789CFJKLMPT"]
+            invalid_chars = [c for c in code_upper if c not in "23456789CFJKLMPT"]
             if invalid_chars:
                 errors.append(f"Invalid characters: {', '.join(set(invalid_chars))}")
 
@@ -248,7 +355,7 @@ async def validate_code(code: str, strict: bool = False):
     return response
 
 
-@router.get("/bounds/{code}")
+@router.get("/bounds/{code}", response_model=BoundsResponse)
 async def get_cell_bounds(code: str):
     """Get the geographic bounding box for a DIGIPIN code."""
     if not is_valid_digipin(code):
@@ -274,7 +381,7 @@ async def get_cell_bounds(code: str):
         raise HTTPException(status_code=400, detail=str(e))
 
 
-@router.get("/health")
+@router.get("/health", response_model=HealthResponse)
 async def health_check():
     """Health check endpoint for monitoring."""
     return {"status": "healthy", "service": "digipin-api", "version": "1.0.0"}
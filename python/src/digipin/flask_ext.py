@@ -27,7 +27,7 @@ Usage:
 
 try:
     from flask import request, jsonify
-    from sqlalchemy import TypeDecorator, String
+    from sqlalchemy import TypeDecorator, String, and_, false, or_
     from sqlalchemy.types import UserDefinedType
 except ImportError:
     raise ImportError(
@@ -36,10 +36,13 @@ except ImportError:
     )
 
 from functools import wraps
-from typing import Callable, Any, Optional
-from .utils import is_valid_digipin, is_valid_coordinate
-from .decoder import decode
-from .encoder import encode
+from typing import Callable, Any, Iterable, List, Optional, Tuple
+from .utils import (
+    DIGIPIN_ALPHABET,
+    is_valid_digipin,
+    is_valid_coordinate,
+    validate_digipin,
+)
 
 # -------------------------------------------------------------------------
 # SQLAlchemy Custom Type
@@ -72,9 +75,9 @@ class DigipinType(TypeDecorator):
         >>> db.session.add(loc)
         >>> db.session.commit()
         >>>
-        >>> # Query with prefix matching
+        >>> # Query by region (indexed prefix range, see within_any())
         >>> delhi_locations = Location.query.filter(
-        ...     Location.code.like('39%')
+        ...     within_any(Location.code, ['39'])
         ... ).all()
     """
 
@@ -115,6 +118,81 @@ class DigipinType(TypeDecorator):
         return str(value).upper()
 
 
+# -------------------------------------------------------------------------
+# Query Helpers
+# -------------------------------------------------------------------------
+
+# Symbols in the order the database compares them (digits before letters)
+_SORTED_SYMBOLS = sorted(DIGIPIN_ALPHABET)
+
+
+def _prefix_upper_bound(prefix: str) -> Optional[str]:
+    """
+    Smallest string sorting after every code that starts with ``prefix``.
+
+    Made of DIGIPIN symbols only, so it passes DigipinType validation when
+    bound as a parameter. None if there is no such string (e.g. 'TT').
+    """
+    for i in range(len(prefix) - 1, -1, -1):
+        rank = _SORTED_SYMBOLS.index(prefix[i])
+        if rank + 1 < len(_SORTED_SYMBOLS):
+            return prefix[:i] + _SORTED_SYMBOLS[rank + 1]
+    return None
+
+
+def _prefix_ranges(prefixes: Iterable[str]) -> List[Tuple[str, Optional[str]]]:
+    """Merge prefixes into sorted, disjoint ``[low, high)`` code ranges."""
+    ranges: List[Tuple[str, Optional[str]]] = []
+    for prefix in sorted({validate_digipin(p) for p in prefixes}):
+        high = _prefix_upper_bound(prefix)
+        if ranges and (ranges[-1][1] is None or prefix <= ranges[-1][1]):
+            # Nested in or adjacent to the previous range: extend it
+            low, prev_high = ranges[-1]
+            if prev_high is not None and high is not None:
+                high = max(prev_high, high)
+            else:
+                high = None
+            ranges[-1] = (low, high)
+        else:
+            ranges.append((prefix, high))
+    return ranges
+
+
+def within_any(column, prefixes: Iterable[str]):
+    """
+    Build a filter matching codes inside any of several regions.
+
+    Each prefix becomes a range ``prefix <= code < upper_bound`` instead of
+    ``LIKE 'prefix%'``. The database can answer a range from the column's
+    index. Nested and adjacent prefixes are merged into one range, so a
+    whole search area (e.g. the cells of get_disk()) is fetched in a single
+    query rather than one query per cell.
+
+    Args:
+        column: DIGIPIN column, e.g. ``Warehouse.code``
+        prefixes: Region codes (1-10 characters, case-insensitive)
+
+    Returns:
+        SQLAlchemy boolean expression for use in ``filter()``. Empty input
+        gives an expression that matches nothing.
+
+    Raises:
+        ValueError: If any prefix is not a valid DIGIPIN code
+
+    Example:
+        >>> from digipin import get_disk
+        >>> cells = get_disk('39J49LL8', radius=2)
+        >>> Warehouse.query.filter(within_any(Warehouse.code, cells)).all()
+    """
+    clauses = [
+        column >= low if high is None else and_(column >= low, column < high)
+        for low, high in _prefix_ranges(prefixes)
+    ]
+    if not clauses:
+        return false()
+    return or_(*clauses)
+
+
 # -------------------------------------------------------------------------
 # Request Validation Decorators
 # -------------------------------------------------------------------------
@@ -286,6 +364,7 @@ def create_digipin_blueprint(url_prefix: str = "/api/digipin"):
     """
     from flask import Blueprint, current_app
 
+    from . import decode_cached, encode_cached
     from .neighbors import get_neighbors, get_disk
     from .decoder import get_bounds
 
@@ -301,7 +380,7 @@ def create_digipin_blueprint(url_prefix: str = "/api/digipin"):
         if not (1 <= precision <= 10):
             return jsonify({"error": "Precision must be between 1 and 10"}), 400
 
-        code = encode(data["lat"], data["lon"], precision=precision)
+        code = encode_cached(data["lat"], data["lon"], precision=precision)
         return jsonify({"code": code, "precision": precision})
 
     @bp.route("/decode/<code>", methods=["GET"])
@@ -318,12 +397,13 @@ def create_digipin_blueprint(url_prefix: str = "/api/digipin"):
                 400,
             )
 
-        lat, lon = decode(code)
-        response = {"code": code.upper(), "lat": lat, "lon": lon}
+        code_upper = code.upper()
+        lat, lon = decode_cached(code_upper)
+        response = {"code": code_upper, "lat": lat, "lon": lon}
 
         # Optional: Include bounds
         if request.args.get("include_bounds", "false").lower() == "true":
-            bounds = get_bounds(code)
+            bounds = get_bounds(code_upper)
             response["bounds"] = {
                 "min_lat": bounds[0],
                 "max_lat": bounds[1],
@@ -0,0 +1,217 @@
+"""
+Packed Integer DIGIPIN Codes
+
+Each DIGIPIN symbol is one cell of a 4x4 grid, i.e. 4 bits, so a full
+10-character code fits in a 40-bit integer. Storing codes this way in an
+``array.array('Q')`` or a ``numpy.uint64`` array takes 8 bytes per code
+instead of a ~60-byte ``str`` object, and hierarchy tests become integer
+shifts.
+
+Layout:
+-------
+One nibble per level, most significant first, so a code's level-k prefix
+is ``value >> 4 * (10 - k)``. Each nibble is ``(row << 2) | col`` with the
+row counted from the south and the column from the west. This is the cell's
+geometric position rather than its spiral label. Packed values therefore
+sort in row-major order within each parent cell, not in string order.
+"""
+
+from typing import TYPE_CHECKING, Tuple
+from .decoder import decode
+from .encoder import (
+    _EDGE_MARGIN,
+    _FINEST_LAT_SPAN,
+    _FINEST_LON_SPAN,
+    _LEVEL_PAIR_SYMBOLS,
+    encode,
+)
+from .utils import (
+    LAT_MIN,
+    LON_MIN,
+    DIGIPIN_LEVELS,
+    SYMBOL_TO_POSITION,
+    validate_coordinate,
+    validate_digipin,
+)
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+def _interleave(lat_digits: int, lon_digits: int) -> int:
+    """Interleave two base-4 digits of each index into one packed byte."""
+    return (
+        (lat_digits >> 2) << 6
+        | (lon_digits >> 2) << 4
+        | (lat_digits & 3) << 2
+        | (lon_digits & 3)
+    )
+
+
+# Packed byte (two levels) -> index into _LEVEL_PAIR_SYMBOLS, and back
+_BYTE_TO_PAIR = [0] * 256
+for _pair in range(256):
+    _BYTE_TO_PAIR[_interleave(_pair >> 4, _pair & 0xF)] = _pair
+_PAIR_TO_BYTE = [_interleave(pair >> 4, pair & 0xF) for pair in range(256)]
+
+# Packed byte -> the two symbols it encodes
+_BYTE_SYMBOLS = [_LEVEL_PAIR_SYMBOLS[_BYTE_TO_PAIR[byte]] for byte in range(256)]
+
+# Symbol -> packed nibble
+_SYMBOL_NIBBLE = {
+    symbol: (3 - row) << 2 | col for symbol, (row, col) in SYMBOL_TO_POSITION.items()
+}
+
+
+def _pack_symbols(code: str) -> int:
+    """Pack an uppercase code of any length, one nibble per symbol."""
+    value = 0
+    for char in code:
+        value = (value << 4) | _SYMBOL_NIBBLE[char]
+    return value
+
+
+def code_to_u64(code: str) -> int:
+    """
+    Pack a full-precision DIGIPIN code into an integer.
+
+    Args:
+        code: 10-character DIGIPIN code (case-insensitive)
+
+    Returns:
+        40-bit packed code
+
+    Raises:
+        ValueError: If the code is invalid or not 10 characters
+
+    Example:
+        >>> u64_to_code(code_to_u64('39J49LL8T4'))
+        '39J49LL8T4'
+    """
+    return _pack_symbols(validate_digipin(code, strict=True))
+
+
+def u64_to_code(value: int) -> str:
+    """
+    Unpack an integer produced by code_to_u64() or encode_u64().
+
+    Args:
+        value: 40-bit packed code
+
+    Returns:
+        10-character DIGIPIN code
+    """
+    if not 0 <= value < 1 << (4 * DIGIPIN_LEVELS):
+        raise ValueError(f"Packed DIGIPIN must fit in 40 bits, got {value}")
+
+    symbols = _BYTE_SYMBOLS
+    return (
+        symbols[value >> 32]
+        + symbols[value >> 24 & 0xFF]
+        + symbols[value >> 16 & 0xFF]
+        + symbols[value >> 8 & 0xFF]
+        + symbols[value & 0xFF]
+    )
+
+
+def encode_u64(lat: float, lon: float) -> int:
+    """
+    Encode coordinates directly to a packed full-precision code.
+
+    Equivalent to ``code_to_u64(encode(lat, lon))`` without building the
+    intermediate string.
+
+    Args:
+        lat: Latitude in degrees North (must be 2.5° to 38.5°)
+        lon: Longitude in degrees East (must be 63.5° to 99.5°)
+
+    Returns:
+        40-bit packed code
+
+    Raises:
+        ValueError: If coordinates are outside official bounding box
+    """
+    validate_coordinate(lat, lon)
+
+    x = (lat - LAT_MIN) / _FINEST_LAT_SPAN
+    y = (lon - LON_MIN) / _FINEST_LON_SPAN
+    q_lat = int(x)
+    q_lon = int(y)
+
+    if not (
+        _EDGE_MARGIN < x - q_lat < 1 - _EDGE_MARGIN
+        and _EDGE_MARGIN < y - q_lon < 1 - _EDGE_MARGIN
+    ):
+        # Near a grid line: let encode() settle which cell the point is in
+        return _pack_symbols(encode(lat, lon))
+
+    to_byte = _PAIR_TO_BYTE
+    return (
+        to_byte[(q_lat >> 12 & 0xF0) | (q_lon >> 16)] << 32
+        | to_byte[(q_lat >> 8 & 0xF0) | (q_lon >> 12 & 0xF)] << 24
+        | to_byte[(q_lat >> 4 & 0xF0) | (q_lon >> 8 & 0xF)] << 16
+        | to_byte[(q_lat & 0xF0) | (q_lon >> 4 & 0xF)] << 8
+        | to_byte[(q_lat << 4 & 0xF0) | (q_lon & 0xF)]
+    )
+
+
+def decode_u64(value: int) -> Tuple[float, float]:
+    """
+    Decode a packed code to the center of its cell.
+
+    Args:
+        value: 40-bit packed code
+
+    Returns:
+        Tuple of (latitude, longitude), identical to decode()
+    """
+    return decode(u64_to_code(value))
+
+
+def is_within_u64(value: int, parent_code: str) -> bool:
+    """
+    Check whether a packed code lies inside a parent region.
+
+    The string form is ``code.startswith(parent_code)``; packed, it is a
+    single shift and compare.
+
+    Args:
+        value: 40-bit packed code
+        parent_code: Parent DIGIPIN code (1-10 characters, case-insensitive)
+
+    Returns:
+        True if the packed code is within the parent region
+
+    Example:
+        >>> is_within_u64(code_to_u64('39J49LL8T4'), '39J4')
+        True
+    """
+    parent = validate_digipin(parent_code)
+    shift = 4 * (DIGIPIN_LEVELS - len(parent))
+    return value >> shift == _pack_symbols(parent)
+
+
+def codes_to_strings(values) -> "np.ndarray":
+    """
+    Unpack an array of packed codes to DIGIPIN strings in one pass.
+
+    Args:
+        values: Array-like of packed codes (e.g. ``numpy.uint64`` array)
+
+    Returns:
+        NumPy array of 10-character codes, in input order
+    """
+    import numpy as np
+
+    packed = np.asarray(values, dtype=np.uint64)
+    pair_chars = np.frombuffer(
+        "".join(_BYTE_SYMBOLS).encode("ascii"), dtype=np.uint8
+    ).reshape(256, 2)
+
+    chars = np.empty((packed.shape[0], DIGIPIN_LEVELS), dtype=np.uint8)
+    for pair in range(DIGIPIN_LEVELS // 2):
+        shift = np.uint64(8 * (DIGIPIN_LEVELS // 2 - 1 - pair))
+        byte = ((packed >> shift) & np.uint64(0xFF)).astype(np.intp)
+        chars[:, 2 * pair : 2 * pair + 2] = pair_chars[byte]
+
+    return chars.view(f"S{DIGIPIN_LEVELS}").ravel().astype(str)
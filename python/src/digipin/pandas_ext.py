@@ -20,20 +20,29 @@ Install with:
 """
 
 import pandas as pd
-from typing import Union
-from .encoder import encode
-from .decoder import decode, get_parent
-from .utils import is_valid_digipin as is_valid
+from typing import Any, Union
+from .encoder import _encode_column_bytes, _encode_columns
+from .decoder import _batch_decode_array, get_parent
+from .utils import batch_is_valid_digipin
 from .neighbors import get_neighbors
 
 
+def _arrow_strings(codes, dtype) -> pd.api.extensions.ExtensionArray:
+    """Wrap an ASCII ``S{n}`` array as Arrow strings without str objects."""
+    import pyarrow as pa
+
+    return pd.array(pa.array(codes).cast(pa.string()), dtype=dtype)
+
+
 @pd.api.extensions.register_dataframe_accessor("digipin")
 class DigipinAccessor:
     """
     Custom pandas accessor for DIGIPIN operations.
 
     This accessor adds a 'digipin' namespace to pandas DataFrames,
-    enabling efficient vectorized-like operations for geocoding.
+    enabling vectorized geocoding: encode, decode and is_valid process whole
+    columns as NumPy arrays (in compiled code when the Cython extension is
+    built) instead of calling the scalar functions row by row.
 
     Examples:
         >>> import pandas as pd
@@ -50,6 +59,7 @@ class DigipinAccessor:
         lat_col: Union[str, pd.Series],
         lon_col: Union[str, pd.Series],
         precision: int = 10,
+        dtype: Any = object,
     ) -> pd.Series:
         """
         Encode coordinate columns into DIGIPIN codes.
@@ -58,24 +68,33 @@ class DigipinAccessor:
             lat_col: Name of latitude column OR Series/list of latitudes
             lon_col: Name of longitude column OR Series/list of longitudes
             precision: Length of DIGIPIN code (1-10), default=10
+            dtype: dtype of the returned Series. The default ``object`` holds
+                one Python ``str`` per row. A pyarrow-backed string dtype
+                (``"string[pyarrow]"``, or ``"str"`` on pandas 3) keeps all
+                codes in one Arrow buffer, roughly a quarter of the memory,
+                and ``.str`` methods then run inside Arrow. Requires pyarrow.
 
         Returns:
-            pd.Series: Column of DIGIPIN codes
+            pd.Series: Column of DIGIPIN codes with the requested dtype
 
         Examples:
             >>> df['code'] = df.digipin.encode('latitude', 'longitude')
             >>> df['code'] = df.digipin.encode('lat', 'lon', precision=8)
+            >>> df['code'] = df.digipin.encode('lat', 'lon', dtype='string[pyarrow]')
         """
         # Resolve inputs to iterables
         lats = self._obj[lat_col] if isinstance(lat_col, str) else lat_col
         lons = self._obj[lon_col] if isinstance(lon_col, str) else lon_col
 
-        # Use list comprehension (faster than .apply for string operations)
-        results = [
-            encode(lat, lon, precision=precision) for lat, lon in zip(lats, lons)
-        ]
+        # Whole columns are validated and encoded in one array pass
+        dtype = pd.api.types.pandas_dtype(dtype)
+        if isinstance(dtype, pd.StringDtype) and dtype.storage == "pyarrow":
+            # Straight from the kernel's ASCII bytes into an Arrow buffer
+            results = _arrow_strings(_encode_column_bytes(lats, lons, precision), dtype)
+        else:
+            results = _encode_columns(lats, lons, precision)
 
-        return pd.Series(results, index=self._obj.index, name="digipin")
+        return pd.Series(results, index=self._obj.index, name="digipin", dtype=dtype)
 
     def decode(self, code_col: Union[str, pd.Series]) -> pd.DataFrame:
         """
@@ -85,7 +104,8 @@ class DigipinAccessor:
             code_col: Name of column containing DIGIPIN codes OR Series of codes
 
         Returns:
-            pd.DataFrame: Two columns ['latitude', 'longitude']
+            pd.DataFrame: Two float64 columns ['latitude', 'longitude'],
+            backed by a single (N, 2) array
 
         Examples:
             >>> coords = df.digipin.decode('digipin_code')
@@ -93,8 +113,7 @@ class DigipinAccessor:
         """
         codes = self._obj[code_col] if isinstance(code_col, str) else code_col
 
-        # Use list comprehension
-        results = [decode(code) for code in codes]
+        results = _batch_decode_array(pd.Series(codes, dtype=object).to_numpy())
 
         return pd.DataFrame(
             results, columns=["latitude", "longitude"], index=self._obj.index
@@ -116,7 +135,7 @@ class DigipinAccessor:
         """
         codes = self._obj[code_col] if isinstance(code_col, str) else code_col
         return pd.Series(
-            [is_valid(c) for c in codes], index=self._obj.index, dtype=bool
+            batch_is_valid_digipin(list(codes)), index=self._obj.index, dtype=bool
         )
 
     def get_parent(self, code_col: Union[str, pd.Series], level: int) -> pd.Series:
@@ -9,17 +9,172 @@ Requires:
 """
 
 try:
-    from shapely.geometry import Polygon, Point, box
+    import numpy as np
+    import shapely
+    from shapely.geometry import Polygon, box
     from shapely.prepared import prep
 
     SHAPELY_AVAILABLE = True
 except ImportError:
     SHAPELY_AVAILABLE = False
 
-from typing import List, Union, Tuple
-from .encoder import encode
-from .decoder import get_bounds
-from .utils import get_grid_size
+from functools import lru_cache
+from typing import Any, List, Union, Tuple
+from .encoder import _encode_arrays
+from .decoder import batch_bounds, get_bounds
+from .utils import (
+    LAT_MAX,
+    LAT_MIN,
+    LON_MAX,
+    LON_MIN,
+    GRID_SUBDIVISION,
+    get_grid_size,
+)
+
+
+def _encode_cells(lats: "np.ndarray", lons: "np.ndarray", precision: int) -> List[str]:
+    """
+    Encode arrays of in-bounds cell centers to DIGIPIN codes in one pass.
+
+    Thin wrapper over the shared array encoder that returns a list of str,
+    matching the per-cell output of :func:`digipin.encoder.encode`.
+
+    Args:
+        lats: 1-D array of latitudes (must be inside the DIGIPIN bounding box)
+        lons: 1-D array of longitudes (must be inside the DIGIPIN bounding box)
+        precision: Code length (1-10)
+
+    Returns:
+        List of DIGIPIN codes, in the same order as the input arrays
+    """
+    return list(_encode_arrays(lats, lons, precision).astype(str).tolist())
+
+
+@lru_cache(maxsize=32)
+def _prepare_geofence(geofence: Any) -> Tuple["Polygon", Any]:
+    """
+    Build (if needed) and prepare a polygon, memoized per geofence.
+
+    Callers that fill the same zone repeatedly reuse both the constructed
+    Polygon and its prepared index instead of rebuilding them every call.
+
+    Args:
+        geofence: A shapely Polygon, or a tuple of (lat, lon) tuples
+
+    Returns:
+        Tuple of (polygon, prepared polygon)
+    """
+    if isinstance(geofence, tuple):
+        # Swap input from (lat, lon) to (x=lon, y=lat) for Shapely
+        geofence = Polygon([(lon, lat) for lat, lon in geofence])
+
+    return geofence, prep(geofence)
+
+
+def _misses_grid(polygon: "Polygon") -> bool:
+    """
+    Check whether a polygon lies entirely outside the DIGIPIN grid.
+
+    A plain comparison of bounding boxes, so geofences elsewhere in the
+    world are rejected before any arrays or geometry are built. Empty
+    polygons, whose bounds are NaN, also count as missing the grid.
+
+    Args:
+        polygon: Shapely polygon in (lon, lat) order
+
+    Returns:
+        True if the polygon's bounding box does not touch India's, or is
+        not finite
+    """
+    bounds = polygon.bounds
+    if not np.all(np.isfinite(bounds)):
+        return True
+
+    min_lon, min_lat, max_lon, max_lat = bounds
+    return bool(
+        max_lat < LAT_MIN or min_lat > LAT_MAX or max_lon < LON_MIN or min_lon > LON_MAX
+    )
+
+
+# Cells per side of a grid-scan tile
+_TILE_SIZE = 64
+
+
+def _scan_tiles(
+    polygon: "Polygon",
+    prepared_poly: Any,
+    lats: "np.ndarray",
+    lons: "np.ndarray",
+    lat_step: float,
+    lon_step: float,
+) -> Tuple["np.ndarray", "np.ndarray"]:
+    """
+    Test a grid of cell centers against a polygon, one tile at a time.
+
+    The grid is split into square tiles of _TILE_SIZE cells. Each tile's
+    cell-aligned bounding box is tested once against the prepared polygon:
+    tiles that miss it are skipped, tiles strictly inside it are accepted
+    wholesale, and only tiles crossing the boundary test their individual
+    centers with a vectorized contains call.
+
+    Only the indices of accepted centers are kept, so memory grows with the
+    result rather than with the polygon's bounding box.
+
+    Args:
+        polygon: Shapely polygon in (lon, lat) order
+        prepared_poly: Prepared version of polygon
+        lats: 1-D array of cell-center latitudes
+        lons: 1-D array of cell-center longitudes
+        lat_step: Cell height in degrees
+        lon_step: Cell width in degrees
+
+    Returns:
+        Tuple of (row, column) index arrays into lats and lons for the
+        centers inside the polygon, in row-major order
+    """
+    rows = []
+    cols = []
+
+    for i in range(0, lats.size, _TILE_SIZE):
+        tile_lats = lats[i : i + _TILE_SIZE]
+        band_rows = []
+        band_cols = []
+        for j in range(0, lons.size, _TILE_SIZE):
+            tile_lons = lons[j : j + _TILE_SIZE]
+            tile_box = box(
+                tile_lons[0] - lon_step / 2,
+                tile_lats[0] - lat_step / 2,
+                tile_lons[-1] + lon_step / 2,
+                tile_lats[-1] + lat_step / 2,
+            )
+
+            if not prepared_poly.intersects(tile_box):
+                continue
+
+            if prepared_poly.contains_properly(tile_box):
+                # Every center is strictly inside the polygon
+                inside = np.ones((tile_lats.size, tile_lons.size), dtype=bool)
+            else:
+                # For points, contains is equivalent to contains_properly
+                lon_grid, lat_grid = np.meshgrid(tile_lons, tile_lats)
+                inside = shapely.contains_xy(polygon, lon_grid, lat_grid)
+
+            tile_rows, tile_cols = np.nonzero(inside)
+            band_rows.append(tile_rows + i)
+            band_cols.append(tile_cols + j)
+
+        if band_rows:
+            # Tiles run west to east, so a stable sort by row restores
+            # row-major order across the band
+            band_row = np.concatenate(band_rows)
+            order = np.argsort(band_row, kind="stable")
+            rows.append(band_row[order])
+            cols.append(np.concatenate(band_cols)[order])
+
+    if not rows:
+        return np.empty(0, dtype=np.intp), np.empty(0, dtype=np.intp)
+
+    return np.concatenate(rows), np.concatenate(cols)
 
 
 def polyfill(
@@ -80,46 +235,44 @@ def polyfill(
     # Legacy grid scan algorithm below
     # (kept for backwards compatibility and testing)
 
-    # 1. Normalize Input
+    # 1. Normalize Input (memoized, so repeated geofences are built and
+    # prepared only once). Coordinate lists are keyed by their values.
     if isinstance(polygon, list):
-        # Swap input from (lat, lon) to (x=lon, y=lat) for Shapely
-        # Shapely uses Cartesian (x, y), so we map (lon, lat)
-        shell = [(lon, lat) for lat, lon in polygon]
-        polygon = Polygon(shell)
+        polygon, prepared_poly = _prepare_geofence(tuple(map(tuple, polygon)))
+    else:
+        polygon, prepared_poly = _prepare_geofence(polygon)
 
     if not (1 <= precision <= 10):
         raise ValueError("Precision must be between 1 and 10")
 
+    # Also rejects empty polygons, so the bounds below are finite
+    if _misses_grid(polygon):
+        return []
+
     # 2. Get Bounding Box
     min_lon, min_lat, max_lon, max_lat = polygon.bounds
 
     # 3. Determine Grid Step Size
     lat_step, lon_step = get_grid_size(precision)
 
-    # Optimize: Use prepared geometry for faster contains checks
-    prepared_poly = prep(polygon)
-
-    codes = []
-
-    # 4. Grid Scan Algorithm
-    # Start from bottom-left, move to top-right
-    current_lat = min_lat + (lat_step / 2)
-
-    while current_lat < max_lat:
-        current_lon = min_lon + (lon_step / 2)
-        while current_lon < max_lon:
-            # Check if point is inside
-            if prepared_poly.contains(Point(current_lon, current_lat)):
-                # Encode this center point
-                # Note: encode expects (lat, lon)
-                try:
-                    code = encode(current_lat, current_lon, precision=precision)
-                    codes.append(code)
-                except ValueError:
-                    pass  # Skip points outside India bounds
-
-            current_lon += lon_step
-        current_lat += lat_step
+    # 4. Tiled Grid Scan over DIGIPIN cells
+    # Work in integer cell indices at this precision: the polygon's bounding
+    # box becomes a range of rows (latitudes, from the south) and columns
+    # (longitudes, from the west), clipped to India's grid, and each cell is
+    # tested at its true center - the same point polyfill_quadtree() tests.
+    # _misses_grid() has already ruled out non-finite bounds.
+    cells = GRID_SUBDIVISION**precision
+    row_min = max(int(np.floor((min_lat - LAT_MIN) / lat_step)), 0)
+    row_max = min(int(np.floor((max_lat - LAT_MIN) / lat_step)), cells - 1)
+    col_min = max(int(np.floor((min_lon - LON_MIN) / lon_step)), 0)
+    col_max = min(int(np.floor((max_lon - LON_MIN) / lon_step)), cells - 1)
+
+    lats = LAT_MIN + (np.arange(row_min, row_max + 1) + 0.5) * lat_step
+    lons = LON_MIN + (np.arange(col_min, col_max + 1) + 0.5) * lon_step
+    rows, cols = _scan_tiles(polygon, prepared_poly, lats, lons, lat_step, lon_step)
+
+    # 5. Encode accepted centers
+    codes = _encode_cells(lats[rows], lons[cols], precision)
 
     return codes
 
@@ -138,15 +291,25 @@ def get_polygon_boundary(codes: List[str]) -> Tuple[float, float, float, float]:
     if not codes:
         return (0.0, 0.0, 0.0, 0.0)
 
-    # Initialize with first code
-    min_lat, max_lat, min_lon, max_lon = get_bounds(codes[0])
+    try:
+        bounds = batch_bounds(codes)
+    except ImportError:
+        # NumPy not installed - reduce in pure Python
+        min_lat, max_lat, min_lon, max_lon = get_bounds(codes[0])
+
+        for code in codes[1:]:
+            c_min_lat, c_max_lat, c_min_lon, c_max_lon = get_bounds(code)
 
-    for code in codes[1:]:
-        c_min_lat, c_max_lat, c_min_lon, c_max_lon = get_bounds(code)
+            min_lat = min(min_lat, c_min_lat)
+            max_lat = max(max_lat, c_max_lat)
+            min_lon = min(min_lon, c_min_lon)
+            max_lon = max(max_lon, c_max_lon)
 
-        min_lat = min(min_lat, c_min_lat)
-        max_lat = max(max_lat, c_max_lat)
-        min_lon = min(min_lon, c_min_lon)
-        max_lon = max(max_lon, c_max_lon)
+        return min_lat, max_lat, min_lon, max_lon
 
-    return min_lat, max_lat, min_lon, max_lon
+    return (
+        float(bounds[:, 0].min()),
+        float(bounds[:, 1].max()),
+        float(bounds[:, 2].min()),
+        float(bounds[:, 3].max()),
+    )
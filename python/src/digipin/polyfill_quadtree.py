@@ -14,29 +14,44 @@ Requires:
     pip install digipinpy[geo]
 """
 
-from typing import List, Union, Tuple, Set, Any
+from itertools import compress
+from typing import List, Union, Tuple, Any
 
 try:
-    from shapely.geometry import Polygon, Point, box
-    from shapely.prepared import prep
+    import numpy as np
+    import shapely
+    from shapely.geometry import Polygon, box
 
     SHAPELY_AVAILABLE = True
 except ImportError:
     SHAPELY_AVAILABLE = False
     # Define placeholders to satisfy type checker
     Polygon = None  # type: ignore
-    Point = None  # type: ignore
     box = None  # type: ignore
-    prep = None  # type: ignore
-from .encoder import encode
 from .decoder import get_bounds
-from .utils import get_grid_size, GRID_SUBDIVISION
+from .polyfill import _misses_grid, _prepare_geofence
+from .utils import (
+    DIGIPIN_ALPHABET,
+    LAT_MAX,
+    LAT_MIN,
+    LON_MAX,
+    LON_MIN,
+    SYMBOL_TO_POSITION,
+    GRID_SUBDIVISION,
+)
+
+# Grid (row, col) of each child cell, in DIGIPIN_ALPHABET order
+_CHILD_ROWS = [SYMBOL_TO_POSITION[symbol][0] for symbol in DIGIPIN_ALPHABET]
+_CHILD_COLS = [SYMBOL_TO_POSITION[symbol][1] for symbol in DIGIPIN_ALPHABET]
 
 
 def _get_cell_polygon(code: str) -> "Polygon":
     """
     Convert a DIGIPIN code to a shapely Polygon representing its bounds.
 
+    Kept as a single-cell utility; polyfill_quadtree() builds each level's
+    boxes in one shapely.box() call instead.
+
     Args:
         code: DIGIPIN code
 
@@ -52,6 +67,9 @@ def _get_cell_center(code: str) -> Tuple[float, float]:
     """
     Get the center point of a DIGIPIN cell.
 
+    Kept as a single-cell utility; _fill_level() derives every center of a
+    level from its bounds array.
+
     Args:
         code: DIGIPIN code
 
@@ -72,6 +90,9 @@ def _get_cell_relationship(cell_code: str, prepared_poly: Any) -> str:
     - inside: cell center is inside polygon AND all corners are inside
     - intersects: cell overlaps polygon but not fully inside
 
+    Kept as a single-cell utility and as the reference for _fill_level(),
+    which applies the same rules to a whole level at once.
+
     Args:
         cell_code: DIGIPIN code to check
         prepared_poly: Prepared shapely polygon for fast queries
@@ -96,100 +117,180 @@ def _get_cell_relationship(cell_code: str, prepared_poly: Any) -> str:
     return "intersects"
 
 
-def _expand_cell_fully(
-    code: str, target_precision: int, prepared_poly: Any
-) -> List[str]:
+def _expand_cells_fully(codes: List[str], target_precision: int) -> List[str]:
     """
-    Recursively expand a DIGIPIN cell to target precision, checking centers.
+    Expand equal-length DIGIPIN cells to all of their descendants at once.
 
-    Even when a coarse cell is completely inside the polygon,
-    we still need to check center points at the target precision
-    to match the grid scan behavior exactly.
+    Only called for cells whose bounding box is completely contained in the
+    polygon. Every descendant center lies strictly inside such a cell, so no
+    further geometry tests are needed - the whole subtree is emitted directly,
+    parents in input order and each parent's descendants in code order.
 
     Args:
-        code: Parent DIGIPIN code (known to be inside polygon)
+        codes: Parent DIGIPIN codes, all of the same length
         target_precision: Desired final precision level
-        prepared_poly: Prepared polygon for checking centers
 
     Returns:
-        List of all descendant codes whose centers are inside the polygon
+        List of all descendant codes at target precision
     """
-    current_level = len(code)
+    if not codes:
+        return codes
 
-    # Base case: at target precision - check center point
-    if current_level >= target_precision:
-        lat, lon = _get_cell_center(code)
-        if prepared_poly.contains(Point(lon, lat)):
-            return [code]
-        else:
-            return []
+    # One level per pass: each pass appends a symbol to every code built so
+    # far, which is about twice as fast as joining product() tuples
+    for _ in range(target_precision - len(codes[0])):
+        codes = [prefix + symbol for prefix in codes for symbol in DIGIPIN_ALPHABET]
+
+    return codes
+
+
+def _child_bounds(bounds: "np.ndarray") -> "np.ndarray":
+    """
+    Bounding boxes of the 16 children of each cell, from the parents' boxes.
+
+    Uses the same per-level arithmetic as get_bounds(), so the results are
+    identical to decoding each child code, without touching any strings.
+
+    Args:
+        bounds: Array of shape (N, 4) with rows of
+                (min_lat, max_lat, min_lon, max_lon)
 
-    # Recursive case: generate all 16 children and expand each
-    from .utils import DIGIPIN_ALPHABET
+    Returns:
+        Array of shape (16 * N, 4): each parent's children in
+        DIGIPIN_ALPHABET order, parents in input order
+    """
+    min_lat, max_lat, min_lon, max_lon = bounds.T[:, :, np.newaxis]
+    rows = np.array(_CHILD_ROWS)
+    cols = np.array(_CHILD_COLS)
 
-    cells = []
-    for symbol in DIGIPIN_ALPHABET:
-        child_code = code + symbol
-        cells.extend(_expand_cell_fully(child_code, target_precision, prepared_poly))
+    lat_span = (max_lat - min_lat) / GRID_SUBDIVISION
+    lon_span = (max_lon - min_lon) / GRID_SUBDIVISION
 
-    return cells
+    children = np.empty((bounds.shape[0], len(DIGIPIN_ALPHABET), 4))
+    children[..., 0] = max_lat - (rows + 1) * lat_span
+    children[..., 1] = max_lat - rows * lat_span
+    children[..., 2] = min_lon + cols * lon_span
+    children[..., 3] = min_lon + (cols + 1) * lon_span
+    return children.reshape(-1, 4)
 
 
-def _polyfill_recursive(
-    code: str,
+def _fill_level(
+    codes: List[str],
+    bounds: "np.ndarray",
     target_precision: int,
-    prepared_poly: Any,
-    result: Set[str],
-) -> None:
+    polygon: "Polygon",
+    result: List[str],
+    is_rectangle: bool = False,
+) -> Tuple[List[str], "np.ndarray"]:
     """
-    Recursive quadtree polyfill worker.
+    Classify one quadtree level of cells against a polygon in a few array calls.
+
+    Applies the same rules as _get_cell_relationship() to every cell at once:
+    cells whose box misses the polygon are dropped, cells whose box it
+    contains are emitted into result with all their descendants, and
+    boundary cells are subdivided. At the target precision a cell is kept if
+    its center lies inside the polygon, which also covers every fully
+    contained cell.
+
+    Cells whose box misses the polygon's own bounding box are rejected with
+    plain array comparisons before any geometry is built. When the polygon is
+    its own bounding box, those comparisons answer every predicate exactly
+    and no geometry is built at all.
 
     Args:
-        code: Current DIGIPIN cell being processed
+        codes: DIGIPIN codes of equal length (the current frontier)
+        bounds: Array of shape (N, 4) with the bounds of each code
         target_precision: Target precision level (1-10)
-        prepared_poly: Prepared shapely polygon
-        result: Set to accumulate results (modified in-place)
+        polygon: Prepared shapely polygon in (lon, lat) order
+        result: List that codes found at target precision are appended to
+        is_rectangle: True if the polygon equals its axis-aligned bounding box
+
+    Returns:
+        Tuple of (next frontier codes, next frontier bounds)
     """
-    current_level = len(code)
-
-    # Get relationship between this cell and polygon
-    relationship = _get_cell_relationship(code, prepared_poly)
-
-    if relationship == "outside":
-        # Completely outside - skip this branch entirely
-        return
-
-    elif relationship == "inside":
-        # Completely inside - add all descendants at target precision
-        # But still check center points to match grid scan behavior
-        if current_level >= target_precision:
-            # At target precision - check center point
-            lat, lon = _get_cell_center(code)
-            if prepared_poly.contains(Point(lon, lat)):
-                result.add(code)
+    min_lat, max_lat, min_lon, max_lon = bounds.T
+    poly_min_lon, poly_min_lat, poly_max_lon, poly_max_lat = polygon.bounds
+
+    # Touching boxes still intersect, hence the inclusive comparisons
+    hits = (
+        (min_lat <= poly_max_lat)
+        & (max_lat >= poly_min_lat)
+        & (min_lon <= poly_max_lon)
+        & (max_lon >= poly_min_lon)
+    )
+    candidates = np.flatnonzero(hits)
+
+    if len(codes[0]) >= target_precision:
+        center_lon = (min_lon[candidates] + max_lon[candidates]) / 2
+        center_lat = (min_lat[candidates] + max_lat[candidates]) / 2
+        if is_rectangle:
+            # Centers on the boundary are outside, as with contains_xy
+            hits[candidates] = (
+                (poly_min_lon < center_lon)
+                & (center_lon < poly_max_lon)
+                & (poly_min_lat < center_lat)
+                & (center_lat < poly_max_lat)
+            )
         else:
-            # Expand this cell to target precision, checking centers
-            expanded = _expand_cell_fully(code, target_precision, prepared_poly)
-            result.update(expanded)
-
-    else:  # relationship == "intersects"
-        # Cell crosses boundary - need to subdivide
-        if current_level >= target_precision:
-            # At target precision - check center point
-            # (This matches original polyfill behavior)
-            min_lat, max_lat, min_lon, max_lon = get_bounds(code)
-            center_lat = (min_lat + max_lat) / 2
-            center_lon = (min_lon + max_lon) / 2
-
-            if prepared_poly.contains(Point(center_lon, center_lat)):
-                result.add(code)
-        else:
-            # Not at target yet - subdivide into 16 children
-            from .utils import DIGIPIN_ALPHABET
+            hits[candidates] = shapely.contains_xy(polygon, center_lon, center_lat)
+        result.extend(compress(codes, hits))
+        return [], bounds[:0]
+
+    if is_rectangle:
+        # Overlapping boxes are exactly the hits; a box is contained when
+        # it lies within the rectangle, edges included
+        inside = (
+            hits
+            & (min_lat >= poly_min_lat)
+            & (max_lat <= poly_max_lat)
+            & (min_lon >= poly_min_lon)
+            & (max_lon <= poly_max_lon)
+        )
+        return _split_level(codes, bounds, target_precision, hits, inside, result)
+
+    cells = shapely.box(
+        min_lon[candidates],
+        min_lat[candidates],
+        max_lon[candidates],
+        max_lat[candidates],
+    )
+    hits[candidates] = shapely.intersects(polygon, cells)
+    inside = np.zeros_like(hits)
+    inside[candidates] = shapely.contains(polygon, cells)
+    return _split_level(codes, bounds, target_precision, hits, inside, result)
+
+
+def _split_level(
+    codes: List[str],
+    bounds: "np.ndarray",
+    target_precision: int,
+    hits: "np.ndarray",
+    inside: "np.ndarray",
+    result: List[str],
+) -> Tuple[List[str], "np.ndarray"]:
+    """
+    Emit a level's contained cells and subdivide its boundary cells.
 
-            for symbol in DIGIPIN_ALPHABET:
-                child_code = code + symbol
-                _polyfill_recursive(child_code, target_precision, prepared_poly, result)
+    Args:
+        codes: DIGIPIN codes of equal length (the current frontier)
+        bounds: Array of shape (N, 4) with the bounds of each code
+        target_precision: Target precision level (1-10)
+        hits: Boolean mask of cells whose box intersects the polygon
+        inside: Boolean mask of cells whose box the polygon contains
+        result: List that the contained cells' descendants are appended to
+
+    Returns:
+        Tuple of (next frontier codes, next frontier bounds)
+    """
+    boundary = hits & ~inside
+
+    result.extend(_expand_cells_fully(list(compress(codes, inside)), target_precision))
+    frontier = [
+        code + symbol
+        for code in compress(codes, boundary)
+        for symbol in DIGIPIN_ALPHABET
+    ]
+    return frontier, _child_bounds(bounds[boundary])
 
 
 def polyfill_quadtree(
@@ -234,37 +335,35 @@ def polyfill_quadtree(
             "Install it with: pip install digipinpy[geo]"
         )
 
-    # 1. Normalize Input - Use a new variable to avoid type confusion
-    poly_geom: "Polygon"
-
+    # 1. Normalize Input and prepare it for fast spatial queries. Memoized
+    # and shared with the grid scan in polyfill(), so a geofence filled
+    # repeatedly (or by both algorithms) is built and prepared only once.
     if isinstance(polygon, list):
-        # Swap input from (lat, lon) to (x=lon, y=lat) for Shapely
-        shell = [(lon, lat) for lat, lon in polygon]
-        poly_geom = Polygon(shell)
+        poly_geom, _ = _prepare_geofence(tuple(map(tuple, polygon)))
     else:
-        poly_geom = polygon
+        poly_geom, _ = _prepare_geofence(polygon)
 
     if not (1 <= precision <= 10):
         raise ValueError("Precision must be between 1 and 10")
 
-    # 2. Prepare polygon for fast spatial queries
-    prepared_poly = prep(poly_geom)
-
-    # 3. Determine starting level for recursion
-    # For small polygons, start at level 1-2
-    # For very large polygons, might start at level 1
-    # For now, always start at level 1 (can be optimized later)
-    start_level = 1
+    if _misses_grid(poly_geom):
+        return []
 
-    # 4. Initialize result set (use set to avoid duplicates)
-    result: Set[str] = set()
+    # 2. Walk the quadtree one level at a time, starting from the 16 Level 1
+    # cells that cover all of India. Only cells crossing the polygon boundary
+    # are subdivided, and each level is tested with vectorized predicates.
+    # Axis-aligned rectangles (any vertex order, no holes) are tested with
+    # plain comparisons against their bounds instead of GEOS predicates
+    is_rectangle = poly_geom.equals(poly_geom.envelope)
 
-    # 5. Start recursion from all Level 1 cells
-    # Level 1 has 16 cells covering all of India
-    from .utils import DIGIPIN_ALPHABET
+    result: List[str] = []
+    frontier = list(DIGIPIN_ALPHABET)
+    frontier_bounds = _child_bounds(np.array([[LAT_MIN, LAT_MAX, LON_MIN, LON_MAX]]))
 
-    for symbol in DIGIPIN_ALPHABET:
-        _polyfill_recursive(symbol, precision, prepared_poly, result)
+    while frontier:
+        frontier, frontier_bounds = _fill_level(
+            frontier, frontier_bounds, precision, poly_geom, result, is_rectangle
+        )
 
-    # 6. Convert to sorted list for consistent output
+    # 3. Sort for consistent output
     return sorted(result)
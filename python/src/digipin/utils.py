@@ -8,7 +8,12 @@ This module provides core utilities for the hierarchical 4x4 grid system
 with spiral anticlockwise labeling pattern.
 """
 
-from typing import Tuple
+import re
+from functools import lru_cache
+from typing import TYPE_CHECKING, Sequence, Tuple
+
+if TYPE_CHECKING:
+    import numpy as np
 
 # ============================================================================
 # OFFICIAL DIGIPIN SPECIFICATION CONSTANTS
@@ -33,6 +38,11 @@ DIGIPIN_ALPHABET += "CFJKLMPT"  # Letters: C,F,J,K,L,M,P,T
 if len(DIGIPIN_ALPHABET) != 16:
     raise RuntimeError("DIGIPIN alphabet must have exactly 16 symbols")
 
+# Every byte that may appear in a valid code (either case). Deleting these
+# with bytes.translate() leaves an empty result only for valid codes, which
+# checks the whole code in a single C-level pass.
+_VALID_SYMBOL_BYTES = (DIGIPIN_ALPHABET + DIGIPIN_ALPHABET.lower()).encode("ascii")
+
 # Official spiral anticlockwise labeling pattern (4x4 grid)
 # This is the HEART of DIGIPIN - provides directional properties!
 #
@@ -67,6 +77,19 @@ DIGIPIN_LEVELS = 10
 # Grid subdivision factor (4x4 at each level)
 GRID_SUBDIVISION = 4
 
+# Whole-code patterns for is_valid_digipin(): one C-level match checks length
+# and symbols together. Both cases are listed explicitly rather than using
+# re.IGNORECASE, which would also accept Unicode case folds such as the
+# Kelvin sign for "K".
+_VALID_SYMBOL_CLASS = "[" + DIGIPIN_ALPHABET + DIGIPIN_ALPHABET.lower() + "]"
+_VALID_CODE_RE = re.compile(f"{_VALID_SYMBOL_CLASS}{{1,{DIGIPIN_LEVELS}}}")
+_VALID_FULL_CODE_RE = re.compile(f"{_VALID_SYMBOL_CLASS}{{{DIGIPIN_LEVELS}}}")
+
+# Lists at least this long are converted to NumPy arrays by batch_encode()
+# and batch_decode() and processed in one vectorized pass; below it the
+# conversion costs more than the per-item loop it replaces
+_BATCH_VECTORIZE_MIN = 64
+
 
 # ============================================================================
 # COORDINATE VALIDATION
@@ -93,6 +116,46 @@ def is_valid_coordinate(lat: float, lon: float) -> bool:
     return (LAT_MIN <= lat <= LAT_MAX) and (LON_MIN <= lon <= LON_MAX)
 
 
+def batch_is_valid_coordinate(lats, lons) -> "np.ndarray":
+    """
+    Check many coordinates against the bounding box at once.
+
+    Applies the same rule as is_valid_coordinate() element-wise over whole
+    arrays. NaN fails every comparison and infinities are out of range, so
+    both are reported as invalid.
+
+    Requires NumPy (``pip install numpy``).
+
+    Args:
+        lats: Array-like of latitudes
+        lons: Array-like of longitudes (same shape as lats)
+
+    Returns:
+        Boolean array, True where the coordinate is inside the bounding box
+
+    Raises:
+        ImportError: If NumPy is not installed
+
+    Example:
+        >>> batch_is_valid_coordinate([28.6, 50.0, float('nan')], [77.2, 77.2, 77.2])
+        array([ True, False, False])
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        raise ImportError(
+            "NumPy is required for batch validation. "
+            "Install it with: pip install numpy"
+        )
+
+    lats = np.asarray(lats, dtype=np.float64)
+    lons = np.asarray(lons, dtype=np.float64)
+
+    valid = (lats >= LAT_MIN) & (lats <= LAT_MAX)
+    valid &= (lons >= LON_MIN) & (lons <= LON_MAX)
+    return valid
+
+
 def validate_coordinate(lat: float, lon: float) -> None:
     """
     Validate coordinates and raise exception if out of bounds.
@@ -180,10 +243,13 @@ def get_position_from_symbol(symbol: str) -> Tuple[int, int]:
 # ============================================================================
 
 
+@lru_cache(maxsize=16)
 def get_grid_size(level: int) -> Tuple[float, float]:
     """
     Calculate grid cell size at a given level.
 
+    Results are cached, since only ten levels exist.
+
     Args:
         level: DIGIPIN level (1-10)
 
@@ -210,11 +276,13 @@ def get_grid_size(level: int) -> Tuple[float, float]:
     return lat_cell_size, lon_cell_size
 
 
+@lru_cache(maxsize=16)
 def get_approx_distance(level: int) -> float:
     """
     Get approximate linear distance (in meters) for grid cell at given level.
 
-    Uses average at equator: 1 degree ≈ 111 km
+    Uses average at equator: 1 degree ≈ 111 km. Results are cached, like
+    get_grid_size().
 
     Args:
         level: DIGIPIN level (1-10)
@@ -273,19 +341,81 @@ def is_valid_digipin(code: str, strict: bool = False) -> bool:
     if not isinstance(code, str):
         return False
 
-    # Length validation
+    # Strict mode needs exactly 10 characters, flexible mode 1 to 10; all
+    # characters must be in the official alphabet (case-insensitive)
+    pattern = _VALID_FULL_CODE_RE if strict else _VALID_CODE_RE
+    return pattern.fullmatch(code) is not None
+
+
+def _has_invalid_symbols(code: str) -> bool:
+    """Return True if any character of code is outside the DIGIPIN alphabet."""
+    return bool(code.encode("ascii", "replace").translate(None, _VALID_SYMBOL_BYTES))
+
+
+def batch_is_valid_digipin(codes: Sequence, strict: bool = False) -> "np.ndarray":
+    """
+    Validate many DIGIPIN codes at once.
+
+    Applies the same rules as is_valid_digipin() to every element, but checks
+    the characters of all codes in a single vectorized table lookup over one
+    joined byte buffer instead of calling the validator once per code.
+    Intended for bulk ingestion pipelines.
+
+    Requires NumPy (``pip install numpy``).
+
+    Args:
+        codes: Sequence of candidate codes (non-string entries are invalid)
+        strict: If True, requires exactly 10 characters (default: False)
+
+    Returns:
+        Boolean array of shape (N,), True where the code is valid
+
+    Raises:
+        ImportError: If NumPy is not installed
+
+    Example:
+        >>> batch_is_valid_digipin(["39J49LL8T4", "39j4", "123", None])
+        array([ True,  True, False, False])
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        raise ImportError(
+            "NumPy is required for batch validation. "
+            "Install it with: pip install numpy"
+        )
+
+    lengths = np.fromiter(
+        (len(code) if isinstance(code, str) else -1 for code in codes),
+        dtype=np.int64,
+        count=len(codes),
+    )
+
     if strict:
-        # Strict mode: exactly 10 characters
-        if len(code) != DIGIPIN_LEVELS:
-            return False
+        valid = lengths == DIGIPIN_LEVELS
     else:
-        # Flexible mode: 1 to 10 characters
-        if not (1 <= len(code) <= DIGIPIN_LEVELS):
-            return False
+        valid = (lengths >= 1) & (lengths <= DIGIPIN_LEVELS)
 
-    # All characters must be in official alphabet
-    code_upper = code.upper()
-    return all(char in DIGIPIN_ALPHABET for char in code_upper)
+    candidates = np.flatnonzero(valid)
+    if candidates.size == 0:
+        return valid
+
+    # Join every candidate into one buffer. Non-ASCII characters become a
+    # single '?' each, so per-code offsets stay aligned and they fail below.
+    if candidates.size == len(codes):
+        joined = "".join(codes)
+    else:
+        joined = "".join([codes[i] for i in candidates.tolist()])
+    chars = np.frombuffer(joined.encode("ascii", "replace"), dtype=np.uint8)
+
+    # Byte -> is-symbol table, then AND-reduce each code's slice of the buffer
+    allowed = np.zeros(256, dtype=bool)
+    allowed[np.frombuffer(_VALID_SYMBOL_BYTES, dtype=np.uint8)] = True
+    candidate_lengths = lengths[candidates]
+    starts = np.cumsum(candidate_lengths) - candidate_lengths
+    valid[candidates] = np.logical_and.reduceat(allowed[chars], starts)
+
+    return valid
 
 
 def validate_digipin(code: str, strict: bool = False) -> str:
@@ -331,7 +461,10 @@ def validate_digipin(code: str, strict: bool = False) -> str:
 
     code_upper = code.upper()
 
-    # Check each character
+    if not _has_invalid_symbols(code):
+        return code_upper
+
+    # Locate the first offending character for the error message
     for i, char in enumerate(code_upper):
         if char not in DIGIPIN_ALPHABET:
             raise ValueError(
@@ -364,32 +497,49 @@ def get_precision_info(level: int = 10) -> dict:
         >>> info['code_length']
         10
     """
+    info = _PRECISION_INFO.get(level)
+    if info is None:
+        raise ValueError(f"Level must be between 1 and {DIGIPIN_LEVELS}")
+
+    # Copy, so callers can modify the result without touching the table
+    return dict(info)
+
+
+_LEVEL_DESCRIPTIONS = {
+    1: "Regional level (~1000 km)",
+    2: "State level (~250 km)",
+    3: "District level (~62 km)",
+    4: "City level (~15 km)",
+    5: "Locality level (~4 km)",
+    6: "Neighborhood level (~1 km)",
+    7: "Block level (~250 m)",
+    8: "Building level (~60 m)",
+    9: "Property level (~15 m)",
+    10: "Precise location (~3.8 m)",
+}
+
+
+def _get_level_description(level: int) -> str:
+    """Get human-readable description for a level."""
+    return _LEVEL_DESCRIPTIONS.get(level, f"Level {level}")
+
+
+def _build_precision_info(level: int) -> dict:
+    """Compute the get_precision_info() entry for one level."""
     lat_deg, lon_deg = get_grid_size(level)
-    distance_m = get_approx_distance(level)
 
     return {
         "level": level,
         "code_length": level,
         "grid_size_lat_deg": lat_deg,
         "grid_size_lon_deg": lon_deg,
-        "approx_distance_m": distance_m,
+        "approx_distance_m": get_approx_distance(level),
         "total_cells": (GRID_SUBDIVISION**level) ** 2,
         "description": _get_level_description(level),
     }
 
 
-def _get_level_description(level: int) -> str:
-    """Get human-readable description for a level."""
-    descriptions = {
-        1: "Regional level (~1000 km)",
-        2: "State level (~250 km)",
-        3: "District level (~62 km)",
-        4: "City level (~15 km)",
-        5: "Locality level (~4 km)",
-        6: "Neighborhood level (~1 km)",
-        7: "Block level (~250 m)",
-        8: "Building level (~60 m)",
-        9: "Property level (~15 m)",
-        10: "Precise location (~3.8 m)",
-    }
-    return descriptions.get(level, f"Level {level}")
+# Only ten levels exist, so every entry is computed once at import
+_PRECISION_INFO = {
+    level: _build_precision_info(level) for level in range(1, DIGIPIN_LEVELS + 1)
+}
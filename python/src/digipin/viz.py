@@ -12,6 +12,7 @@ import warnings
 try:
     import folium
     from folium import plugins
+    from branca.element import MacroElement, Template
 
     FOLIUM_AVAILABLE = True
 except ImportError:
@@ -19,12 +20,56 @@ except ImportError:
     # Define placeholders to satisfy type checker
     folium = None  # type: ignore
     plugins = None  # type: ignore
+    MacroElement = object  # type: ignore
+    Template = None  # type: ignore
     warnings.warn(
         "Folium not available. Install with: pip install digipinpy[viz]", ImportWarning
     )
 
 from . import decode, get_bounds, is_valid
 
+# Unclustered plots with at least this many pins draw them all from one
+# batched layer. A folium CircleMarker/Popup/Rectangle per pin costs over 1ms
+# each to render, so 1,000 pins took ~1.5s and 2.4MB of HTML.
+_BATCH_RENDER_MIN = 100
+
+
+class _PinLayer(MacroElement):
+    """
+    All of plot_pins()' markers, popups and bounds in a single map element.
+
+    Renders one JSON array of pins and a short Leaflet loop that draws the
+    same circle markers and rectangles as the per-pin folium objects.
+    """
+
+    _TEMPLATE = """
+        {% macro script(this, kwargs) %}
+            {{ this.pins|tojson }}.forEach(function (pin) {
+                var marker = L.circleMarker([pin.lat, pin.lon], {
+                    radius: 8, color: pin.color, fill: true,
+                    fillColor: pin.color, fillOpacity: 0.6, weight: 2
+                }).addTo({{ this._parent.get_name() }});
+                if (pin.popup !== null) {
+                    marker.bindPopup(pin.popup, {maxWidth: 300});
+                }
+                if (pin.bounds !== null) {
+                    var box = L.rectangle(pin.bounds, {
+                        color: pin.color, fill: false, weight: 1.5, opacity: 0.4
+                    }).addTo({{ this._parent.get_name() }});
+                    if (pin.label !== null) {
+                        box.bindPopup(pin.label);
+                    }
+                }
+            });
+        {% endmacro %}
+    """
+
+    def __init__(self, pins: List[dict]):
+        super().__init__()
+        self._name = "DigipinPins"
+        self._template = Template(self._TEMPLATE)
+        self.pins = pins
+
 
 def plot_pins(
     codes: Union[str, List[str]],
@@ -51,6 +96,9 @@ def plot_pins(
         cluster: Use marker clustering for large datasets (recommended for >100 codes)
         max_clusters: Maximum number of markers to render (prevents browser freeze)
 
+    Without clustering, 100 or more codes are drawn by one batched layer
+    instead of a folium object per marker, which renders far faster.
+
     Returns:
         folium.Map object that can be saved with .save('map.html')
 
@@ -146,6 +194,10 @@ def plot_pins(
     if cluster:
         marker_cluster = plugins.MarkerCluster()
 
+    # Large unclustered plots are collected into one batched layer
+    batch = not cluster and len(valid_codes) >= _BATCH_RENDER_MIN
+    pins = []
+
     # Add markers for each code
     for code in valid_codes:
         lat, lon = decode(code)
@@ -167,9 +219,28 @@ def plot_pins(
                 <b>Precision:</b> Level {precision}
             </div>
             """
-            popup = folium.Popup(popup_html, max_width=300)
         else:
-            popup = None
+            popup_html = None
+
+        if batch:
+            bounds = None
+            if show_bounds:
+                min_lat, max_lat, min_lon, max_lon = get_bounds(code)
+                bounds = [[min_lat, min_lon], [max_lat, max_lon]]
+
+            pins.append(
+                {
+                    "lat": lat,
+                    "lon": lon,
+                    "color": color,
+                    "popup": popup_html,
+                    "bounds": bounds,
+                    "label": f"Bounds: {code}" if show_labels else None,
+                }
+            )
+            continue
+
+        popup = folium.Popup(popup_html, max_width=300) if show_labels else None
 
         # Create marker
         marker = folium.CircleMarker(
@@ -203,9 +274,11 @@ def plot_pins(
                 popup=f"Bounds: {code}" if show_labels else None,
             ).add_to(map_object)
 
-    # Add cluster to map
+    # Add cluster or batched layer to map
     if cluster:
         marker_cluster.add_to(map_object)
+    elif pins:
+        _PinLayer(pins).add_to(map_object)
 
     # Add legend if color-coding by precision
     if color_by_precision:
@@ -4,12 +4,9 @@ Additional edge case tests for encoder.py, decoder.py, and utils.py.
 These tests target specific uncovered lines to increase coverage.
 """
 
-import pytest
-import sys
-from pathlib import Path
+from typing import Any, List
 
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+import pytest
 
 from digipin import encoder, decoder, utils
 
@@ -17,14 +14,57 @@ from digipin import encoder, decoder, utils
 class TestEncoderEdgeCases:
     """Additional edge cases for encoder.py."""
 
-    def test_encode_precision_boundaries(self):
+    @pytest.mark.parametrize("precision", range(1, 11))
+    def test_encode_precision_boundaries(self, precision):
         """Test encoding at each precision level (1-10)."""
         lat, lon = 28.622788, 77.213033
 
+        result = encoder.encode(lat, lon, precision=precision)
+        assert len(result) == precision
+        assert all(c in utils.DIGIPIN_ALPHABET for c in result)
+
+    def test_encode_point_within_own_cell(self):
+        """Test that each precision's encoder puts the point inside its cell."""
+        lat, lon = 19.0760, 72.8777
+
         for precision in range(1, 11):
-            result = encoder.encode(lat, lon, precision=precision)
-            assert len(result) == precision
-            assert all(c in utils.DIGIPIN_ALPHABET for c in result)
+            code = encoder.encode(lat, lon, precision=precision)
+            min_lat, max_lat, min_lon, max_lon = decoder.get_bounds(code)
+            assert min_lat <= lat <= max_lat
+            assert min_lon <= lon <= max_lon
+
+    def test_encode_fixed_point_matches_reference_loop(self):
+        """Test the fixed-point fast path against the bisection loop."""
+        import math
+        import random
+
+        rng = random.Random(0)
+        lat_span = (utils.LAT_MAX - utils.LAT_MIN) / 4**10
+        lon_span = (utils.LON_MAX - utils.LON_MIN) / 4**10
+
+        points = [
+            (rng.uniform(utils.LAT_MIN, utils.LAT_MAX), rng.uniform(63.5, 99.5))
+            for _ in range(2000)
+        ]
+        # Points on and one ulp either side of finest-level grid lines
+        for _ in range(200):
+            lat = utils.LAT_MIN + rng.randrange(1, 4**10) * lat_span
+            lon = utils.LON_MIN + rng.randrange(1, 4**10) * lon_span
+            for d_lat in (-math.inf, 0, math.inf):
+                for d_lon in (-math.inf, 0, math.inf):
+                    points.append(
+                        (
+                            math.nextafter(lat, d_lat) if d_lat else lat,
+                            math.nextafter(lon, d_lon) if d_lon else lon,
+                        )
+                    )
+
+        for precision in (1, 5, 10):
+            reference = encoder._build_specialized_encoder(precision)
+            for lat, lon in points:
+                assert encoder.encode(lat, lon, precision=precision) == reference(
+                    lat, lon
+                )
 
     def test_encode_at_exact_min_bounds(self):
         """Test encoding at exact minimum bounds."""
@@ -84,6 +124,53 @@ class TestEncoderEdgeCases:
         # First result should correspond to first input
         assert result[0] == "39J49LL8T4"
 
+    def test_batch_encode_array_matches_scalar(self):
+        """Test that array input is encoded identically to encode()."""
+        np = pytest.importorskip("numpy")
+        coords = np.array(
+            [
+                (28.622788, 77.213033),
+                (12.9716, 77.5946),
+                (utils.LAT_MIN, utils.LON_MIN),
+                (utils.LAT_MAX, utils.LON_MAX),
+            ]
+        )
+
+        for precision in (1, 6, 10):
+            result = encoder.batch_encode(coords, precision=precision)
+            expected = [
+                encoder.encode(lat, lon, precision=precision)
+                for lat, lon in coords.tolist()
+            ]
+            assert result.tolist() == expected
+
+        with pytest.raises(ValueError, match="out of bounds"):
+            encoder.batch_encode(np.array([(28.6, 77.2), (1.0, 77.2)]))
+
+    def test_batch_long_list_matches_scalar(self):
+        """Long lists take the vectorized path but return the same lists."""
+        import random
+
+        rng = random.Random(7)
+        coords = [(rng.uniform(2.5, 38.5), rng.uniform(63.5, 99.5)) for _ in range(500)]
+        coords += [(utils.LAT_MIN, utils.LON_MIN), (utils.LAT_MAX, utils.LON_MAX)]
+
+        codes = encoder.batch_encode(coords, precision=8)
+        assert codes == [encoder.encode(lat, lon, precision=8) for lat, lon in coords]
+
+        mixed = [code[: 1 + i % 8].lower() for i, code in enumerate(codes)]
+        assert decoder.batch_decode(mixed) == [decoder.decode(c) for c in mixed]
+
+    def test_batch_long_list_reports_scalar_errors(self):
+        """An invalid item in a long list raises the scalar function's error."""
+        coords = [(28.622788, 77.213033)] * 100 + [(50.0, 77.0)]
+        with pytest.raises(ValueError, match="Latitude 50.0"):
+            encoder.batch_encode(coords)
+
+        codes = ["39J49LL8T4"] * 100 + ["39J0"]
+        with pytest.raises(ValueError, match="Invalid character '0'"):
+            decoder.batch_decode(codes)
+
 
 class TestDecoderEdgeCases:
     """Additional edge cases for decoder.py."""
@@ -97,17 +184,15 @@ class TestDecoderEdgeCases:
         assert lat1 == lat2 == lat3
         assert lon1 == lon2 == lon3
 
-    def test_decode_all_precision_levels(self):
+    @pytest.mark.parametrize("level", range(1, 11))
+    def test_decode_all_precision_levels(self, level):
         """Test decoding codes at all precision levels."""
-        base_code = "39J49LL8T4"
+        code = "39J49LL8T4"[:level]
+        lat, lon = decoder.decode(code)
 
-        for level in range(1, 11):
-            code = base_code[:level]
-            lat, lon = decoder.decode(code)
-
-            # Should return valid coordinates
-            assert utils.LAT_MIN <= lat <= utils.LAT_MAX
-            assert utils.LON_MIN <= lon <= utils.LON_MAX
+        # Should return valid coordinates
+        assert utils.LAT_MIN <= lat <= utils.LAT_MAX
+        assert utils.LON_MIN <= lon <= utils.LON_MAX
 
     def test_decode_with_bounds_complete(self):
         """Test decode_with_bounds returns all fields."""
@@ -186,13 +271,58 @@ class TestDecoderEdgeCases:
         codes = ["39J49LL8T4", "33J5T26TFP", "368TF2K98T"]
         results = decoder.batch_decode(codes)
 
-        # Should have same length
-        assert len(results) == len(codes)
+        # Every position holds its own code's center, Delhi first
+        assert results == [decoder.decode(code) for code in codes]
+        assert results[0] == pytest.approx((28.622788, 77.213033), abs=5e-5)
+
+    def test_batch_bounds_matches_get_bounds(self):
+        """Test that batch_bounds agrees with get_bounds for mixed lengths."""
+        pytest.importorskip("numpy")
+        codes = ["39J49LL8T4", "39j4", "3", "33J5T26TFP", "368TF2"]
+        bounds = decoder.batch_bounds(codes)
+
+        assert bounds.shape == (len(codes), 4)
+        for row, code in zip(bounds.tolist(), codes):
+            assert tuple(row) == decoder.get_bounds(code)
+
+    def test_batch_bounds_invalid(self):
+        """Test that batch_bounds rejects invalid codes."""
+        pytest.importorskip("numpy")
+        assert decoder.batch_bounds([]).shape == (0, 4)
+
+        with pytest.raises(ValueError):
+            decoder.batch_bounds(["39J4", "39A4"])
+        with pytest.raises(ValueError):
+            decoder.batch_bounds(["39J49LL8T42"])
+
+    def test_batch_decode_array_matches_scalar(self):
+        """Test that array input is decoded identically to decode()."""
+        np = pytest.importorskip("numpy")
+        codes = np.array(["39J49LL8T4", "39j4", "3", "33J5T26TFP"])
+        centers = decoder.batch_decode(codes)
+
+        assert centers.shape == (len(codes), 2)
+        for row, code in zip(centers.tolist(), codes.tolist()):
+            assert tuple(row) == decoder.decode(code)
+
+        with pytest.raises(ValueError):
+            decoder.batch_decode(np.array(["39J4", "39A4"]))
+
+    def test_cache_size_env_var(self, monkeypatch):
+        """Test that DIGIPIN_CACHE_SIZE is parsed without breaking import."""
+        default = decoder._DEFAULT_BOUNDS_CACHE_SIZE
+
+        monkeypatch.delenv("DIGIPIN_CACHE_SIZE", raising=False)
+        assert decoder._read_cache_size() == default
 
-        # First result should be Delhi
-        lat1, lon1 = results[0]
-        assert 28.6 < lat1 < 28.7
-        assert 77.2 < lon1 < 77.3
+        for value, expected in (("", default), (" 128 ", 128), ("0", 0)):
+            monkeypatch.setenv("DIGIPIN_CACHE_SIZE", value)
+            assert decoder._read_cache_size() == expected
+
+        for value in ("abc", "-5", "1.5"):
+            monkeypatch.setenv("DIGIPIN_CACHE_SIZE", value)
+            with pytest.warns(RuntimeWarning, match="DIGIPIN_CACHE_SIZE"):
+                assert decoder._read_cache_size() == default
 
 
 class TestUtilsEdgeCases:
@@ -241,13 +371,10 @@ class TestUtilsEdgeCases:
         with pytest.raises(ValueError):
             utils.validate_digipin(" 39J49LL8T4")
 
-    def test_is_valid_digipin_lengths(self):
+    @pytest.mark.parametrize("length", range(1, 11))
+    def test_is_valid_digipin_lengths(self, length):
         """Test is_valid_digipin with all valid lengths."""
-        base = "39J49LL8T4"
-
-        for length in range(1, 11):
-            code = base[:length]
-            assert utils.is_valid_digipin(code) is True
+        assert utils.is_valid_digipin("39J49LL8T4"[:length]) is True
 
     def test_is_valid_digipin_invalid_chars(self):
         """Test is_valid_digipin rejects invalid characters."""
@@ -263,18 +390,27 @@ class TestUtilsEdgeCases:
         # Contains 'I' (ambiguous)
         assert utils.is_valid_digipin("39JI9LL8T4") is False
 
-    def test_get_precision_info_all_levels(self):
+    @pytest.mark.parametrize("level", range(1, 11))
+    def test_get_precision_info_all_levels(self, level):
         """Test get_precision_info for all 10 levels."""
-        for level in range(1, 11):
-            info = utils.get_precision_info(level)
+        info = utils.get_precision_info(level)
+
+        assert info["level"] == level
+        assert info["code_length"] == level
+        assert info["grid_size_lat_deg"] > 0
+        assert info["grid_size_lon_deg"] > 0
+        assert info["approx_distance_m"] > 0
+        assert info["total_cells"] > 0
+        assert isinstance(info["description"], str)
+
+    def test_get_precision_info_returns_copy(self):
+        """Modifying a returned dict does not affect later calls."""
+        info = utils.get_precision_info(5)
+        info["description"] = "changed"
+        assert utils.get_precision_info(5)["description"] != "changed"
 
-            assert info["level"] == level
-            assert info["code_length"] == level
-            assert info["grid_size_lat_deg"] > 0
-            assert info["grid_size_lon_deg"] > 0
-            assert info["approx_distance_m"] > 0
-            assert info["total_cells"] > 0
-            assert isinstance(info["description"], str)
+        with pytest.raises(ValueError):
+            utils.get_precision_info(11)
 
     def test_get_grid_size_decreases_with_level(self):
         """Test that grid size decreases as level increases."""
@@ -288,29 +424,29 @@ class TestUtilsEdgeCases:
             assert lat_next < lat_current
             assert lon_next < lon_current
 
-    def test_get_approx_distance_all_levels(self):
+    @pytest.mark.parametrize("level", range(1, 11))
+    def test_get_approx_distance_all_levels(self, level):
         """Test get_approx_distance for all levels."""
-        for level in range(1, 11):
-            distance = utils.get_approx_distance(level)
+        distance = utils.get_approx_distance(level)
 
-            assert distance > 0
-            assert isinstance(distance, float)
+        assert distance > 0
+        assert isinstance(distance, float)
 
-        # Level 1 should be much larger than level 10
+    def test_get_approx_distance_shrinks_with_level(self):
+        """Level 1 should be much larger than level 10."""
         assert utils.get_approx_distance(1) > utils.get_approx_distance(10) * 100
 
     def test_get_symbol_from_position_all_cells(self):
         """Test get_symbol_from_position for all 16 cells."""
-        symbols = set()
-
-        for row in range(4):
-            for col in range(4):
-                symbol = utils.get_symbol_from_position(row, col)
-                symbols.add(symbol)
-                assert symbol in utils.DIGIPIN_ALPHABET
+        symbols = [
+            utils.get_symbol_from_position(row, col)
+            for row in range(4)
+            for col in range(4)
+        ]
 
-        # Should have all 16 symbols
+        # Every alphabet symbol exactly once
         assert len(symbols) == 16
+        assert set(symbols) == set(utils.DIGIPIN_ALPHABET)
 
     def test_get_position_from_symbol_all_symbols(self):
         """Test get_position_from_symbol for all alphabet symbols."""
@@ -361,15 +497,10 @@ class TestUtilsEdgeCases:
         for row in utils.SPIRAL_GRID:
             assert len(row) == 4
 
-        # All symbols should be from alphabet
-        all_symbols = set()
-        for row in utils.SPIRAL_GRID:
-            for symbol in row:
-                all_symbols.add(symbol)
-                assert symbol in utils.DIGIPIN_ALPHABET
-
-        # Should have all 16 symbols
-        assert len(all_symbols) == 16
+        # Every alphabet symbol exactly once
+        flat = "".join("".join(row) for row in utils.SPIRAL_GRID)
+        assert len(flat) == 16
+        assert set(flat) == set(utils.DIGIPIN_ALPHABET)
 
 
 class TestCoordinateValidation:
@@ -392,6 +523,30 @@ class TestCoordinateValidation:
         # Integer coordinates should work
         assert utils.is_valid_coordinate(28, 77) is True
 
+    def test_batch_is_valid_coordinate_matches_scalar(self):
+        """Test batch_is_valid_coordinate agrees with is_valid_coordinate."""
+        pytest.importorskip("numpy")
+        inf, nan = float("inf"), float("nan")
+        coords = [
+            (28.622788, 77.213033),
+            (utils.LAT_MIN, utils.LON_MIN),
+            (utils.LAT_MAX, utils.LON_MAX),
+            (2.499999, 77.0),
+            (38.500001, 77.0),
+            (28.0, 63.499999),
+            (28.0, 99.500001),
+            (nan, 77.0),
+            (28.0, nan),
+            (inf, 77.0),
+            (28.0, -inf),
+        ]
+        lats, lons = zip(*coords)
+
+        result = utils.batch_is_valid_coordinate(lats, lons)
+        assert result.tolist() == [
+            utils.is_valid_coordinate(lat, lon) for lat, lon in coords
+        ]
+
     def test_validate_coordinate_with_integers(self):
         """Test validate_coordinate with integer inputs."""
         # Should not raise
@@ -419,6 +574,10 @@ class TestCodeValidation:
         # Letters only
         assert utils.is_valid_digipin("CFJKLMPTCF") is True
 
+        # Trailing newline and non-ASCII look-alikes (Kelvin sign for K)
+        assert utils.is_valid_digipin("39J4\n") is False
+        assert utils.is_valid_digipin("39J4\u212a") is False
+
     def test_validate_digipin_error_messages(self):
         """Test that validate_digipin provides helpful error messages."""
         # Too short
@@ -433,6 +592,29 @@ class TestCodeValidation:
         with pytest.raises(ValueError):
             utils.validate_digipin("39J49LL8T0")  # Contains '0'
 
+    def test_batch_is_valid_digipin_matches_scalar(self):
+        """Test that batch validation agrees with is_valid_digipin."""
+        pytest.importorskip("numpy")
+        # Non-str entries are deliberate: they must validate as False
+        codes: List[Any] = [
+            "39J49LL8T4",
+            "39j4",
+            "",
+            "39J49LL8T4X",
+            "39J49LL8T0",
+            "39J4\x00",
+            "39J4é",
+            None,
+            12345,
+        ]
+
+        for strict in (False, True):
+            result = utils.batch_is_valid_digipin(codes, strict=strict)
+            expected = [utils.is_valid_digipin(c, strict=strict) for c in codes]
+            assert result.tolist() == expected
+
+        assert utils.batch_is_valid_digipin([]).tolist() == []
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
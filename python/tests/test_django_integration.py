@@ -52,7 +52,11 @@ if DJANGO_AVAILABLE:
     from django.test import TestCase
 
     try:
-        from digipin.django_ext import DigipinField
+        from digipin.django_ext import (
+            DigipinField,
+            neighbors_of,
+            paginate_by_digipin,
+        )
 
         DIGIPIN_DJANGO_AVAILABLE = True
     except ImportError:
@@ -365,6 +369,11 @@ class TestCustomLookups:
 
         assert results.count() == 0
 
+    def test_within_lookup_escapes_like_wildcards(self):
+        """Test that LIKE wildcards in the prefix are matched literally."""
+        assert Location.objects.filter(digipin__within="%").count() == 0
+        assert Location.objects.filter(digipin__within="3_J").count() == 0
+
 
 @pytest.mark.skipif(not DIGIPIN_DJANGO_AVAILABLE, reason="Django not available")
 class TestMigrationSupport:
@@ -524,24 +533,74 @@ class TestRealWorldScenarios:
 
 
 @pytest.mark.skipif(not DIGIPIN_DJANGO_AVAILABLE, reason="Django not available")
-class TestNotImplementedLookup:
-    """Test that is_neighbor lookup raises NotImplementedError."""
+class TestIsNeighborLookup:
+    """Test the is_neighbor lookup."""
 
     @pytest.fixture(autouse=True)
     def setup_db(self):
         """Create tables."""
         with connection.schema_editor() as schema_editor:
             schema_editor.create_model(Location)
-        Location.objects.create(name="Test", digipin="39J49LL8T4")
+        # Center, two neighbors, a non-neighbor inside the neighbors'
+        # lexicographic range, and a far-away cell
+        for code in [
+            "39J49LL8T4",
+            "39J49LL8T5",
+            "39J49LL8TK",
+            "39J49LL8T6",
+            "4FK595M4J3",
+        ]:
+            Location.objects.create(name=code, digipin=code)
         yield
         Location.objects.all().delete()
         with connection.schema_editor() as schema_editor:
             schema_editor.delete_model(Location)
 
-    def test_is_neighbor_lookup_not_implemented(self):
-        """The is_neighbor lookup should raise NotImplementedError."""
-        with pytest.raises(NotImplementedError):
-            list(Location.objects.filter(digipin__is_neighbor="39J49LL8T4"))
+    def test_is_neighbor_lookup(self):
+        """Only the surrounding cells match."""
+        results = Location.objects.filter(digipin__is_neighbor="39J49LL8T4")
+
+        assert sorted(r.digipin for r in results) == ["39J49LL8T5", "39J49LL8TK"]
+
+    def test_is_neighbor_lookup_lowercase(self):
+        """The reference code is normalized like other lookups."""
+        results = Location.objects.filter(digipin__is_neighbor="39j49ll8t4")
+
+        assert results.count() == 2
+
+    def test_is_neighbor_lookup_short_code(self):
+        """Codes too coarse for a range query fall back to a plain IN list."""
+        Location.objects.create(name="region", digipin="3C")
+
+        results = Location.objects.filter(digipin__is_neighbor="39")
+
+        assert [r.digipin for r in results] == ["3C"]
+
+    def test_neighbors_of_batches_references(self):
+        """Neighbors of several references come back from one query."""
+        query = neighbors_of(["39J49LL8T4", "4FK595M4J3", "39J49LL8T4"])
+        results = Location.objects.filter(query)
+
+        assert sorted(r.digipin for r in results) == ["39J49LL8T5", "39J49LL8TK"]
+
+    def test_neighbors_of_empty(self):
+        """No references matches nothing."""
+        assert Location.objects.filter(neighbors_of([])).count() == 0
+
+    def test_paginate_by_digipin_visits_every_row_once(self):
+        """Keyset pages cover all rows in code order, including ties."""
+        Location.objects.create(name="dup", digipin="39J49LL8T5")
+
+        pages = list(paginate_by_digipin(Location.objects.all(), page_size=2))
+        codes = [row.digipin for page in pages for row in page]
+
+        assert [len(page) for page in pages] == [2, 2, 2]
+        assert codes == sorted(Location.objects.values_list("digipin", flat=True))
+
+    def test_paginate_by_digipin_rejects_bad_page_size(self):
+        """page_size must be positive."""
+        with pytest.raises(ValueError):
+            next(paginate_by_digipin(Location.objects.all(), page_size=0))
 
 
 if __name__ == "__main__":
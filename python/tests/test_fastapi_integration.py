@@ -17,8 +17,10 @@ from digipin.fastapi_ext import (
     DigipinRequest,
     EncodeResponse,
     DecodeResponse,
+    MAX_BATCH_SIZE,
 )
 from fastapi import FastAPI
+from digipin import decode, encode
 
 # Create test app
 app = FastAPI()
@@ -280,6 +282,61 @@ class TestNeighborsEndpoint:
         assert data["count"] > 0
 
 
+# -------------------------------------------------------------------------
+# Test Batch Endpoints
+# -------------------------------------------------------------------------
+
+
+class TestBatchEndpoints:
+    """Test the POST /batch/encode and /batch/decode endpoints."""
+
+    def test_batch_encode_matches_encode(self):
+        """Batch results equal per-point encode(), in request order."""
+        coords = [(28.622788, 77.213033), (19.0760, 72.8777), (12.9716, 77.5946)]
+        response = client.post(
+            "/api/v1/batch/encode",
+            json={
+                "coordinates": [{"lat": lat, "lon": lon} for lat, lon in coords],
+                "precision": 8,
+            },
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["count"] == 3
+        assert data["codes"] == [encode(lat, lon, precision=8) for lat, lon in coords]
+
+    def test_batch_encode_empty(self):
+        """An empty batch is valid and returns no codes."""
+        response = client.post("/api/v1/batch/encode", json={"coordinates": []})
+        assert response.status_code == 200
+        assert response.json()["codes"] == []
+
+    def test_batch_encode_out_of_bounds_item(self):
+        """Each batch item is range-checked like a single Coordinate."""
+        coords = [{"lat": 28.6, "lon": 77.2}, {"lat": 50.0, "lon": 77.2}]
+        response = client.post("/api/v1/batch/encode", json={"coordinates": coords})
+        assert response.status_code == 422
+        assert response.json()["detail"][0]["loc"] == ["body", "coordinates", 1, "lat"]
+
+    def test_batch_size_limit(self):
+        """Batches above MAX_BATCH_SIZE are rejected before any work is done."""
+        coords = [{"lat": 28.6, "lon": 77.2}] * (MAX_BATCH_SIZE + 1)
+        response = client.post("/api/v1/batch/encode", json={"coordinates": coords})
+        assert response.status_code == 422
+
+        codes = ["39J49LL8T4"] * (MAX_BATCH_SIZE + 1)
+        response = client.post("/api/v1/batch/decode", json={"codes": codes})
+        assert response.status_code == 422
+
+    def test_batch_decode_invalid_code(self):
+        """Invalid codes are reported with a 400."""
+        response = client.post(
+            "/api/v1/batch/decode", json={"codes": ["39J49LL8T4", "XYZ"]}
+        )
+        assert response.status_code == 400
+        assert "XYZ" in response.json()["detail"]
+
+
 # -------------------------------------------------------------------------
 # Test Response Models
 # -------------------------------------------------------------------------
@@ -311,6 +368,24 @@ class TestResponseModels:
         assert decode_resp.lon == data["lon"]
         assert decode_resp.bounds == data["bounds"]
 
+    def test_every_route_declares_response_model(self):
+        """Routes need a response model to skip jsonable_encoder."""
+        missing = [r.path for r in router.routes if r.response_model is None]
+        assert missing == []
+
+    def test_batch_decode_response_schema(self):
+        """Batch decode returns a lat/lon object per code, in order."""
+        response = client.post(
+            "/api/v1/batch/decode", json={"codes": ["39J49LL8T4", "39j4"]}
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["count"] == 2
+        assert [tuple(c.values()) for c in data["coordinates"]] == [
+            decode("39J49LL8T4"),
+            decode("39J4"),
+        ]
+
 
 # -------------------------------------------------------------------------
 # Test Real-World Scenarios
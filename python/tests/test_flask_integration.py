@@ -14,6 +14,8 @@ try:
         validate_digipin_request,
         validate_coordinates_request,
         create_digipin_blueprint,
+        within_any,
+        _prefix_ranges,
     )
 
     FLASK_AVAILABLE = True
@@ -111,6 +113,54 @@ if FLASK_AVAILABLE:
             assert len(delhi_locations) == 2
             assert all(loc.code.startswith("39") for loc in delhi_locations)
 
+    # -------------------------------------------------------------------------
+    # Query Helper Tests
+    # -------------------------------------------------------------------------
+
+    def test_prefix_ranges_merge_nested_and_adjacent(app):
+        """Nested prefixes collapse into their parent; adjacent ones join."""
+        assert _prefix_ranges(["39J4", "39j", "39J5"]) == [("39J", "39K")]
+        assert _prefix_ranges(["39J4", "39J5"]) == [("39J4", "39J6")]
+        assert _prefix_ranges(["39T", "T", "TT"]) == [("39T", "3C"), ("T", None)]
+        assert _prefix_ranges([]) == []
+
+        with pytest.raises(ValueError):
+            _prefix_ranges(["39A"])
+
+    def test_within_any_matches_search_area(app):
+        """One within_any() query returns exactly the codes in the area."""
+        from sqlalchemy import Column, Integer, MetaData, Table, create_engine, select
+        from digipin import get_disk
+
+        metadata = MetaData()
+        places = Table(
+            "places",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("code", DigipinType, index=True),
+        )
+        engine = create_engine("sqlite://")
+        metadata.create_all(engine)
+
+        # Points in and around a radius-2 disk of precision-8 cells
+        codes = {
+            encode(28.622788 + i * 0.0002, 77.213033 + j * 0.0002)
+            for i in range(-15, 16)
+            for j in range(-15, 16)
+        }
+        area = get_disk(encode(28.622788, 77.213033, precision=8), radius=2)
+
+        with engine.begin() as conn:
+            conn.execute(places.insert(), [{"code": code} for code in codes])
+
+            query = select(places.c.code).where(within_any(places.c.code, area))
+            found = [row.code for row in conn.execute(query)]
+            empty = select(places.c.code).where(within_any(places.c.code, []))
+
+            expected = [c for c in codes if any(c.startswith(p) for p in area)]
+            assert expected and sorted(found) == sorted(expected)
+            assert conn.execute(empty).fetchall() == []
+
     # -------------------------------------------------------------------------
     # Decorator Tests
     # -------------------------------------------------------------------------
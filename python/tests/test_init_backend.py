@@ -6,11 +6,6 @@ ensures all exports are properly exposed.
 """
 
 import pytest
-import sys
-from pathlib import Path
-
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
 
 import digipin
 
@@ -69,85 +64,73 @@ class TestPackageMetadata:
         assert digipin.__license__ == "MIT"
 
 
+def _assert_callables_exported(names):
+    """Assert every name is a callable package attribute, reporting all misses."""
+    exported = vars(digipin)
+    missing = sorted(set(names) - exported.keys())
+    assert not missing, f"not exported: {missing}"
+
+    not_callable = sorted(name for name in names if not callable(exported[name]))
+    assert not not_callable, f"not callable: {not_callable}"
+
+
 class TestCoreAPIExports:
     """Test that all core API functions are properly exported."""
 
     def test_core_functions_exported(self):
         """Test that core encode/decode functions are accessible."""
-        # Core functions
-        assert hasattr(digipin, "encode")
-        assert hasattr(digipin, "decode")
-        assert hasattr(digipin, "is_valid")
-
-        # All should be callable
-        assert callable(digipin.encode)
-        assert callable(digipin.decode)
-        assert callable(digipin.is_valid)
+        _assert_callables_exported({"encode", "decode", "is_valid"})
 
     def test_batch_operations_exported(self):
         """Test that batch operations are accessible."""
-        assert hasattr(digipin, "batch_encode")
-        assert hasattr(digipin, "batch_decode")
-
-        assert callable(digipin.batch_encode)
-        assert callable(digipin.batch_decode)
+        _assert_callables_exported({"batch_encode", "batch_decode"})
 
     def test_hierarchical_operations_exported(self):
         """Test that hierarchical functions are accessible."""
-        assert hasattr(digipin, "get_bounds")
-        assert hasattr(digipin, "encode_with_bounds")
-        assert hasattr(digipin, "decode_with_bounds")
-        assert hasattr(digipin, "get_parent")
-        assert hasattr(digipin, "is_within")
-
-        assert callable(digipin.get_bounds)
-        assert callable(digipin.encode_with_bounds)
-        assert callable(digipin.decode_with_bounds)
-        assert callable(digipin.get_parent)
-        assert callable(digipin.is_within)
+        _assert_callables_exported(
+            {
+                "get_bounds",
+                "encode_with_bounds",
+                "decode_with_bounds",
+                "get_parent",
+                "is_within",
+            }
+        )
 
     def test_neighbor_functions_exported(self):
         """Test that neighbor discovery functions are accessible."""
-        assert hasattr(digipin, "get_neighbors")
-        assert hasattr(digipin, "get_ring")
-        assert hasattr(digipin, "get_disk")
-        assert hasattr(digipin, "get_surrounding_cells")
-        assert hasattr(digipin, "expand_search_area")
-
-        assert callable(digipin.get_neighbors)
-        assert callable(digipin.get_ring)
-        assert callable(digipin.get_disk)
-        assert callable(digipin.get_surrounding_cells)
-        assert callable(digipin.expand_search_area)
+        _assert_callables_exported(
+            {
+                "get_neighbors",
+                "get_ring",
+                "get_disk",
+                "get_surrounding_cells",
+                "expand_search_area",
+            }
+        )
 
     def test_utility_functions_exported(self):
         """Test that utility functions are accessible."""
-        assert hasattr(digipin, "is_valid_coordinate")
-        assert hasattr(digipin, "get_precision_info")
-        assert hasattr(digipin, "get_grid_size")
-        assert hasattr(digipin, "get_approx_distance")
-
-        assert callable(digipin.is_valid_coordinate)
-        assert callable(digipin.get_precision_info)
-        assert callable(digipin.get_grid_size)
-        assert callable(digipin.get_approx_distance)
+        _assert_callables_exported(
+            {
+                "is_valid_coordinate",
+                "get_precision_info",
+                "get_grid_size",
+                "get_approx_distance",
+            }
+        )
 
     def test_constants_exported(self):
         """Test that constants are accessible."""
-        assert hasattr(digipin, "LAT_MIN")
-        assert hasattr(digipin, "LAT_MAX")
-        assert hasattr(digipin, "LON_MIN")
-        assert hasattr(digipin, "LON_MAX")
-        assert hasattr(digipin, "DIGIPIN_ALPHABET")
-        assert hasattr(digipin, "DIGIPIN_LEVELS")
-
-        # Verify values
-        assert digipin.LAT_MIN == 2.5
-        assert digipin.LAT_MAX == 38.5
-        assert digipin.LON_MIN == 63.5
-        assert digipin.LON_MAX == 99.5
+        expected = {
+            "LAT_MIN": 2.5,
+            "LAT_MAX": 38.5,
+            "LON_MIN": 63.5,
+            "LON_MAX": 99.5,
+            "DIGIPIN_LEVELS": 10,
+        }
+        assert {name: getattr(digipin, name, None) for name in expected} == expected
         assert len(digipin.DIGIPIN_ALPHABET) == 16
-        assert digipin.DIGIPIN_LEVELS == 10
 
 
 class TestOptionalFeatures:
@@ -258,6 +241,28 @@ class TestBackendFunctionality:
         assert min_lat < max_lat
         assert min_lon < max_lon
 
+    def test_cached_functions_match_uncached(self):
+        """Memoized encode/decode return the same results and hit the cache."""
+        # A point just below a level-10 grid line: rounding it would change cells
+        lat = 20.5 - 1e-9
+        assert digipin.encode_cached(lat, 81.5) == digipin.encode(lat, 81.5)
+        assert digipin.encode_cached(
+            28.622788, 77.213033, precision=6
+        ) == digipin.encode(28.622788, 77.213033, precision=6)
+
+        hits = digipin.decode_cached.cache_info().hits
+        assert digipin.decode_cached("39J49LL8T4") == digipin.decode("39J49LL8T4")
+        assert digipin.decode_cached("39J49LL8T4") == digipin.decode("39J49LL8T4")
+        assert digipin.decode_cached.cache_info().hits > hits
+
+    def test_cached_functions_do_not_cache_errors(self):
+        """Invalid input raises every time rather than being cached."""
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                digipin.encode_cached(50.0, 77.0)
+            with pytest.raises(ValueError):
+                digipin.decode_cached("XYZ")
+
 
 class TestDocumentation:
     """Test that docstrings are present and helpful."""
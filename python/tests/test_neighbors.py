@@ -19,8 +19,10 @@ from digipin import (
     get_neighbors,
     get_ring,
     get_disk,
+    get_disk_centers,
     get_surrounding_cells,
     expand_search_area,
+    neighbor_bbox,
     is_valid,
 )
 
@@ -317,6 +319,44 @@ class TestDiskFunction:
         assert disk_0.issubset(disk_1)
         assert disk_1.issubset(disk_2)
 
+    def test_disk_centers_match_decoded_disk(self):
+        """get_disk_centers should equal decoding every get_disk cell."""
+        for code in ["39J49LL8T4", "39J4", "2222222222", "TTTTTTTTTT"]:
+            for radius in [0, 1, 3]:
+                expected = [decode(cell) for cell in get_disk(code, radius)]
+                assert get_disk_centers(code, radius) == expected
+
+    def test_disk_centers_invalid_input(self):
+        """get_disk_centers validates like get_disk."""
+        with pytest.raises(ValueError):
+            get_disk_centers("39J49LL8T4", radius=-1)
+        with pytest.raises(ValueError):
+            get_disk_centers("INVALID", radius=1)
+
+    def test_disk_clamped_at_corner_has_no_duplicates(self):
+        """Disk clipped by the bounding box should list each cell once."""
+        # Southwest corner cell: only the north-east quadrant of the disk exists
+        code = encode(2.5, 63.5, precision=8)
+
+        for radius in (1, 3, 10):
+            disk = get_disk(code, radius=radius)
+            assert len(disk) == len(set(disk)) == (radius + 1) ** 2
+
+            ring = get_ring(code, radius=radius)
+            assert len(ring) == len(set(ring)) == 2 * radius + 1
+
+    def test_disk_matches_union_of_rings(self):
+        """Disk equals center plus every ring, across parent-grid boundaries."""
+        for code in ["39J49LL8T4", "39J4", "3", "2222222222", "TTTTTTTTTT"]:
+            for radius in (1, 7, 20):
+                expected = {code}
+                for ring_radius in range(1, radius + 1):
+                    expected.update(get_ring(code, ring_radius))
+
+                disk = get_disk(code, radius=radius)
+                assert len(disk) == len(expected)
+                assert set(disk) == expected
+
     def test_disk_invalid_radius_raises_error(self):
         """Disk with radius < 0 should raise error."""
         code = "39J49LL8T4"
@@ -347,6 +387,15 @@ class TestConvenienceAliases:
 
             assert expanded == disk
 
+    def test_neighbor_bbox_bounds_all_neighbors(self):
+        """neighbor_bbox should be the tightest range over the neighbors."""
+        for code in ["39J49LL8T4", "39J49LL8TP", "2222222222", "39"]:
+            lo, hi = neighbor_bbox(code)
+            neighbors = get_neighbors(code)
+
+            assert lo in neighbors and hi in neighbors
+            assert all(lo <= n <= hi for n in neighbors)
+
 
 class TestRealWorldUseCases:
     """Test real-world usage scenarios."""
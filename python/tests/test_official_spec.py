@@ -6,11 +6,6 @@ and verifies exact compliance with government requirements.
 """
 
 import pytest
-import sys
-from pathlib import Path
-
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from digipin import encoder, decoder, utils
 
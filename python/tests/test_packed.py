@@ -0,0 +1,80 @@
+"""
+Test Suite for Packed Integer DIGIPIN Codes
+
+Tests cover:
+- Round trips between strings and packed integers
+- Direct coordinate encoding, including grid-line points
+- Prefix (within) tests on packed values
+- Vectorized unpacking
+"""
+
+import random
+
+import pytest
+from digipin import encode, decode
+from digipin.packed import (
+    code_to_u64,
+    codes_to_strings,
+    decode_u64,
+    encode_u64,
+    is_within_u64,
+    u64_to_code,
+)
+
+
+def _sample_points(count=2000):
+    rng = random.Random(42)
+    points = [(rng.uniform(2.5, 38.5), rng.uniform(63.5, 99.5)) for _ in range(count)]
+    # Bounding box corners and grid lines
+    points += [(2.5, 63.5), (38.5, 99.5), (20.5, 81.5), (11.5, 72.5)]
+    return points
+
+
+class TestPackedCodes:
+    def test_round_trip(self):
+        for code in ["39J49LL8T4", "58C4K9FF72", "2222222222", "TTTTTTTTTT"]:
+            value = code_to_u64(code)
+            assert 0 <= value < 1 << 40
+            assert u64_to_code(value) == code
+
+    def test_lowercase_input(self):
+        assert code_to_u64("39j49ll8t4") == code_to_u64("39J49LL8T4")
+
+    def test_partial_code_rejected(self):
+        with pytest.raises(ValueError):
+            code_to_u64("39J4")
+
+    def test_out_of_range_value_rejected(self):
+        with pytest.raises(ValueError):
+            u64_to_code(1 << 40)
+
+    def test_encode_u64_matches_encode(self):
+        for lat, lon in _sample_points():
+            assert encode_u64(lat, lon) == code_to_u64(encode(lat, lon))
+
+    def test_encode_u64_validates_coordinates(self):
+        with pytest.raises(ValueError):
+            encode_u64(50.0, 77.0)
+
+    def test_decode_u64_matches_decode(self):
+        code = "39J49LL8T4"
+        assert decode_u64(code_to_u64(code)) == decode(code)
+
+    def test_is_within_u64(self):
+        value = code_to_u64("39J49LL8T4")
+        for level in range(1, 11):
+            assert is_within_u64(value, "39J49LL8T4"[:level])
+        assert is_within_u64(value, "39j4")
+        assert not is_within_u64(value, "39J5")
+        assert not is_within_u64(value, "4")
+
+    def test_codes_to_strings(self):
+        np = pytest.importorskip("numpy")
+        codes = [encode(lat, lon) for lat, lon in _sample_points()]
+        values = np.array([code_to_u64(code) for code in codes], dtype=np.uint64)
+
+        assert codes_to_strings(values).tolist() == codes
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
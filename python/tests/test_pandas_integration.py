@@ -126,6 +126,52 @@ class TestEncode:
         # Index should match
         assert list(codes.index) == ["A", "B", "C"]
 
+    def test_encoding_matches_scalar_encode(self):
+        """Vectorized column encoding should agree with encode() per row."""
+        rng = np.random.default_rng(7)
+        df = pd.DataFrame(
+            {
+                # Random points plus the bounding box edges and a grid line
+                "lat": np.r_[rng.uniform(2.5, 38.5, 500), 2.5, 38.5, 20.5],
+                "lon": np.r_[rng.uniform(63.5, 99.5, 500), 63.5, 99.5, 81.5],
+            }
+        )
+
+        for precision in (1, 6, 10):
+            codes = df.digipin.encode("lat", "lon", precision=precision)
+            expected = [
+                encode(lat, lon, precision=precision)
+                for lat, lon in zip(df["lat"], df["lon"])
+            ]
+            assert codes.tolist() == expected
+
+    def test_encoding_default_dtype_is_object(self):
+        """Codes are Python str values in an object column by default."""
+        df = pd.DataFrame({"lat": [28.622788], "lon": [77.213033]})
+
+        codes = df.digipin.encode("lat", "lon")
+
+        assert codes.dtype == object
+        assert codes.iloc[0] == "39J49LL8T4"
+
+    def test_encoding_to_arrow_strings(self):
+        """An Arrow string dtype is built directly and matches the default."""
+        pytest.importorskip("pyarrow")
+        df = pd.DataFrame(
+            {
+                "lat": [28.622788, 19.0760, 12.9716],
+                "lon": [77.213033, 72.8777, 77.5946],
+            },
+            index=["A", "B", "C"],
+        )
+
+        codes = df.digipin.encode("lat", "lon", precision=7, dtype="string[pyarrow]")
+
+        assert codes.dtype == pd.StringDtype("pyarrow")
+        assert list(codes.index) == ["A", "B", "C"]
+        assert codes.tolist() == df.digipin.encode("lat", "lon", precision=7).tolist()
+        assert codes.str.startswith("39J").tolist() == [True, False, False]
+
 
 class TestDecode:
     """Test decoding DIGIPIN codes to coordinates."""
@@ -205,6 +251,23 @@ class TestDecode:
         assert "latitude" in coords.columns
         assert "longitude" in coords.columns
 
+    def test_decoding_matches_scalar_decode(self):
+        """Vectorized column decoding should agree exactly with decode()."""
+        df = pd.DataFrame({"code": ["39J49LL8T4", "58c4k9ff72", "39J4", "T", "2"]})
+
+        coords = df.digipin.decode("code")
+
+        assert list(coords.itertuples(index=False, name=None)) == [
+            decode(code) for code in df["code"]
+        ]
+
+    def test_decoding_invalid_code_raises(self):
+        """Invalid or non-string codes raise ValueError, like decode()."""
+        for bad in ["39J4XYZ", None]:
+            df = pd.DataFrame({"code": ["39J49LL8T4", bad]})
+            with pytest.raises(ValueError):
+                df.digipin.decode("code")
+
 
 class TestValidation:
     """Test validation of DIGIPIN codes."""
@@ -4,14 +4,11 @@ Comprehensive tests for polyfill modules with shapely mocking.
 Tests both polyfill.py and polyfill_quadtree.py functions.
 """
 
+from typing import List
+
 import pytest
-import sys
-from pathlib import Path
 from unittest.mock import Mock, MagicMock, patch
 
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 
 class TestPolyfillWithoutShapely:
     """Test polyfill module availability."""
@@ -86,6 +83,54 @@ class TestPolyfillGridAlgorithm:
         except ImportError:
             pytest.skip("shapely not installed")
 
+    def test_grid_algorithm_empty_polygon(self):
+        """Test that an empty polygon fills to no codes."""
+        pytest.importorskip("shapely")
+        from shapely.geometry import Polygon
+        from digipin import polyfill
+
+        assert polyfill(Polygon(), precision=7, algorithm="grid") == []
+
+    def test_scan_tiles_returns_row_major_indices(self):
+        """Test that the tiled scan finds every center, in row-major order."""
+        np = pytest.importorskip("numpy")
+        shapely = pytest.importorskip("shapely")
+        from shapely.geometry import Point
+        from shapely.prepared import prep
+        from digipin.polyfill import _scan_tiles
+
+        # 150 x 150 centers: one tile wholly inside, the rest on the edge
+        step = 0.01
+        lats = 28.0 + (np.arange(150) + 0.5) * step
+        lons = 77.0 + (np.arange(150) + 0.5) * step
+        poly = Point(77.96, 28.96).buffer(0.55)
+
+        rows, cols = _scan_tiles(poly, prep(poly), lats, lons, step, step)
+
+        lon_grid, lat_grid = np.meshgrid(lons, lats)
+        expected_rows, expected_cols = np.nonzero(
+            shapely.contains_xy(poly, lon_grid, lat_grid)
+        )
+        assert rows.tolist() == expected_rows.tolist()
+        assert cols.tolist() == expected_cols.tolist()
+
+    def test_encode_cells_matches_scalar_encode(self):
+        """Test that the vectorized cell encoder agrees with encode()."""
+        np = pytest.importorskip("numpy")
+        pytest.importorskip("shapely")
+        from digipin import encode
+        from digipin.polyfill import _encode_cells
+
+        lats = np.array([2.5, 38.5, 28.622788, 12.9716, 19.0760])
+        lons = np.array([63.5, 99.5, 77.213033, 77.5946, 72.8777])
+
+        for precision in (1, 6, 10):
+            expected = [
+                encode(lat, lon, precision=precision)
+                for lat, lon in zip(lats.tolist(), lons.tolist())
+            ]
+            assert _encode_cells(lats, lons, precision) == expected
+
 
 class TestGetPolygonBoundary:
     """Test the get_polygon_boundary utility function."""
@@ -220,38 +265,106 @@ class TestPolyfillQuadtreeHelpers:
 class TestPolyfillQuadtreeRecursion:
     """Test the recursive polyfill quadtree algorithm."""
 
-    def test_expand_cell_fully(self):
-        """Test _expand_cell_fully recursive expansion."""
+    def test_expand_cells_fully(self):
+        """Test _expand_cells_fully emits every descendant of inside cells."""
         try:
-            from shapely.geometry import Polygon
-            from shapely.prepared import prep
-            from digipin.polyfill_quadtree import _expand_cell_fully
-
-            # Create a polygon
-            poly = Polygon(
-                [
-                    (77.20, 28.62),
-                    (77.23, 28.62),
-                    (77.23, 28.64),
-                    (77.20, 28.64),
-                ]
-            )
-            prepared = prep(poly)
+            from digipin.polyfill_quadtree import _expand_cells_fully
 
             # Expand a level-6 cell to level-7
-            result = _expand_cell_fully(
-                "39J49L", target_precision=7, prepared_poly=prepared
-            )
+            result = _expand_cells_fully(["39J49L"], target_precision=7)
 
-            # Should return list of level-7 codes
+            # Should return all 16 level-7 children
             assert isinstance(result, list)
+            assert len(result) == 16
             # All codes should be length 7
             for code in result:
                 assert len(code) == 7
                 assert code.startswith("39J49L")
+            assert len(set(result)) == 16
+
+            # Two levels down yields all 16 x 16 grandchildren
+            assert len(_expand_cells_fully(["39J49L"], target_precision=8)) == 256
+
+            # Several parents expand in order, each to its own subtree
+            result = _expand_cells_fully(["39J49L", "39J49P"], target_precision=7)
+            assert result[:16] == _expand_cells_fully(["39J49L"], 7)
+            assert result[16:] == _expand_cells_fully(["39J49P"], 7)
+            assert _expand_cells_fully([], target_precision=7) == []
         except ImportError:
             pytest.skip("shapely not installed")
 
+    def test_fill_level_matches_cell_relationship(self):
+        """Test _fill_level classifies a frontier like _get_cell_relationship."""
+        np = pytest.importorskip("numpy")
+        pytest.importorskip("shapely")
+        from shapely.geometry import Point
+        from shapely.prepared import prep
+        from digipin.decoder import batch_bounds
+        from digipin.polyfill_quadtree import (
+            _expand_cells_fully,
+            _fill_level,
+            _get_cell_relationship,
+        )
+        from digipin.utils import DIGIPIN_ALPHABET
+
+        poly = Point(77.2, 28.6).buffer(1.0)
+        prepared = prep(poly)
+        codes = ["39" + symbol for symbol in DIGIPIN_ALPHABET]
+        relationships = [_get_cell_relationship(c, prepared) for c in codes]
+        assert {"inside", "intersects", "outside"} <= set(relationships)
+
+        found: List[str] = []
+        frontier, frontier_bounds = _fill_level(
+            codes, batch_bounds(codes), 4, poly, found
+        )
+
+        assert found == [
+            child
+            for code, rel in zip(codes, relationships)
+            if rel == "inside"
+            for child in _expand_cells_fully([code], 4)
+        ]
+        assert frontier == [
+            code + symbol
+            for code, rel in zip(codes, relationships)
+            if rel == "intersects"
+            for symbol in DIGIPIN_ALPHABET
+        ]
+        # Child bounds are derived arithmetically, exactly as decoding would
+        assert np.array_equal(frontier_bounds, batch_bounds(frontier))
+
+    def test_fill_level_rectangle_matches_geometry(self):
+        """Test the rectangle comparisons agree with the GEOS predicates."""
+        pytest.importorskip("numpy")
+        pytest.importorskip("shapely")
+        from shapely.geometry import box
+        from digipin.decoder import batch_bounds, get_bounds
+        from digipin.polyfill_quadtree import _fill_level
+        from digipin.utils import DIGIPIN_ALPHABET
+
+        # Edges on cell boundaries, so whole cells touch the rectangle
+        min_lat, _, min_lon, _ = get_bounds("39J49L")
+        _, max_lat, _, max_lon = get_bounds("39J49P")
+        rectangles = [
+            box(min_lon, min_lat, max_lon, max_lat),
+            box(77.2001, 28.6001, 77.2123, 28.6087),
+        ]
+
+        for rect in rectangles:
+            results = []
+            for is_rectangle in (False, True):
+                found: List[str] = []
+                frontier = list(DIGIPIN_ALPHABET)
+                frontier_bounds = batch_bounds(frontier)
+                while frontier:
+                    frontier, frontier_bounds = _fill_level(
+                        frontier, frontier_bounds, 8, rect, found, is_rectangle
+                    )
+                results.append(found)
+
+            assert results[0]
+            assert results[0] == results[1]
+
 
 class TestPolyfillIntegration:
     """Integration tests for polyfill (requires shapely)."""
@@ -301,6 +414,29 @@ class TestPolyfillIntegration:
         except ImportError:
             pytest.skip("shapely not installed")
 
+    def test_grid_scans_true_cell_centers(self):
+        """Grid and quadtree test the same cell centers on any polygon."""
+        pytest.importorskip("shapely")
+        from digipin import polyfill
+
+        # Irregular L-shape whose bounding box is not cell-aligned
+        coords = [
+            (28.6400, 77.2200),
+            (28.6400, 77.2250),
+            (28.6350, 77.2250),
+            (28.6350, 77.2300),
+            (28.6300, 77.2300),
+            (28.6300, 77.2200),
+            (28.6400, 77.2200),
+        ]
+
+        for precision in (6, 7, 8, 9):
+            result_grid = polyfill(coords, precision=precision, algorithm="grid")
+            result_quadtree = polyfill(coords, precision=precision)
+
+            assert len(result_grid) == len(set(result_grid))
+            assert set(result_grid) == set(result_quadtree)
+
     def test_polyfill_empty_result_outside_bounds(self):
         """Test that polygon outside India returns empty list."""
         try:
@@ -319,6 +455,15 @@ class TestPolyfillIntegration:
 
             # Should be empty
             assert result == []
+            assert polyfill(coords, precision=7, algorithm="grid") == []
+
+            # An empty polygon has NaN bounds and is rejected the same way
+            from shapely.geometry import Polygon
+            from digipin.polyfill import _misses_grid
+
+            assert _misses_grid(Polygon())
+            assert polyfill(Polygon(), precision=7) == []
+            assert polyfill(Polygon(), precision=7, algorithm="grid") == []
         except ImportError:
             pytest.skip("shapely not installed")
 